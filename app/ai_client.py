@@ -1,38 +1,142 @@
 """OpenAI client with structured outputs for generating weekly picks."""
 
+import asyncio
+import hashlib
+import json
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from pathlib import Path
-from openai import OpenAI
-from .models import WeeklyPicksModel
-from .config import settings
-from .espn_scraper import scrape_espn_schedule, format_games_for_prompt
-from .depth_chart_parser import (
-    parse_depth_chart,
-    format_all_depth_charts_compact,
-    validate_player_team,
-    get_player_team
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from .models import CategoriesModel, LongShotPlayerModel, LongShotsModel, PlayerModel, WeeklyPicksModel
+from .config import Settings
+from .espn_scraper import (
+    GameData,
+    get_cached_schedule,
+    get_cached_schedule_async,
+    schedule_cache,
+    filter_games,
+    format_games_for_prompt,
+    group_games_by_time_slot
 )
+from .depth_chart_parser import DepthChartIndex, depth_chart_cache, get_depth_chart_index, normalize_player_name
+from .player_matcher import FUZZY_RENAME_MIN_SCORE, PlayerMatch
+from .picks_stream import PLAYER_CATEGORIES, IncrementalPicksParser
+from .atomic_io import atomic_write_text
+from .completion_cache import completion_cache
+from .picks_archive import ARCHIVE_SUFFIX, MSGPACK_AVAILABLE, POINTER_SUFFIX, write_archive, write_pointer
+from .openai_client import openai_clients
+from .picks_index import picks_index
+from .picks_store import picks_store
+from .prompt_template import CompiledTemplate, prompt_template, rendered_prompt_cache
+from .settings_store import settings_store
 
+# Note: Must use gpt-4o-2024-08-06 or later for structured outputs
+OPENAI_MODEL = "gpt-4o-2024-08-06"
+SYSTEM_MESSAGE = "You are an expert NFL fantasy and betting analyst. Return only valid JSON matching the exact schema provided."
+TEMPERATURE = 0.7  # Some creativity but mostly consistent
 
-def render_prompt() -> str:
+# Changes whenever the response schema does, so completions cached under an older schema are not reused
+PICKS_SCHEMA_VERSION = hashlib.sha256(
+    json.dumps(WeeklyPicksModel.model_json_schema(), sort_keys=True).encode("utf-8")
+).hexdigest()[:16]
+
+# Completion cache modes: "use" (read and write), "refresh" (skip the read, store the fresh result), "off"
+CACHE_MODES = ("use", "refresh", "off")
+
+# Size report for the most recent render_prompt() call
+_last_render_stats: Dict[str, Any] = {}
+
+
+def build_messages(prompt: str) -> List[Dict[str, str]]:
+    """Chat messages sent to OpenAI for a rendered prompt."""
+    return [
+        {
+            "role": "system",
+            "content": SYSTEM_MESSAGE
+        },
+        {
+            "role": "user",
+            "content": prompt
+        }
+    ]
+
+
+def completion_cache_key(prompt: str, model: str = OPENAI_MODEL, temperature: float = TEMPERATURE) -> str:
+    """
+    Content address of a structured-output request.
+    
+    Covers everything that determines the response: model, system message,
+    rendered prompt, response schema version and temperature.
+    
+    Args:
+        prompt: Rendered prompt
+        model: Model name
+        temperature: Sampling temperature
+        
+    Returns:
+        Hex digest used as the completion cache key.
+    """
+    request = {
+        "model": model,
+        "system": SYSTEM_MESSAGE,
+        "prompt": prompt,
+        "schema": PICKS_SCHEMA_VERSION,
+        "temperature": temperature,
+    }
+    return hashlib.sha256(json.dumps(request, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _cache_mode(config: Settings, bypass_cache: bool) -> str:
+    """Completion cache mode for a generation run."""
+    if not config.completion_cache_enabled:
+        return "off"
+    return "refresh" if bypass_cache else "use"
+
+
+def render_prompt(schedule: Optional[Tuple[List[GameData], Dict]] = None, config: Optional[Settings] = None) -> str:
     """
     Read the prompt template and replace variables with current settings.
     Also fetches live game data from ESPN.
     
+    Args:
+        schedule: Optional (games, metadata) already fetched from ESPN. When
+            omitted, the schedule is fetched (blocking) through the schedule cache.
+        config: Settings to render with (defaults to the current runtime settings).
+    
     Returns:
         Rendered prompt string with all variables replaced and live game data.
     """
-    # Get the prompt template path
-    prompt_path = Path(__file__).parent / "prompts" / "weekly_picks.txt"
+    global _last_render_stats
+    config = config or settings_store.current()
+    started = time.perf_counter()
     
-    # Read the template
-    with open(prompt_path, "r", encoding="utf-8") as f:
-        template = f.read()
+    # Compiled template (re-read only when the file changes)
+    template = prompt_template.get()
+    
+    # Fetch live game data from ESPN (cached per URL with TTL/ETag revalidation)
+    if schedule is None:
+        try:
+            schedule = get_cached_schedule(config.espn_game_data_link)
+        except Exception as e:
+            schedule = ([], {"error": str(e)})
+    
+    # Reuse an earlier rendering when none of its inputs changed
+    fingerprint = render_fingerprint(config, schedule, template)
+    sources = (schedule[0], template)
+    cached = rendered_prompt_cache.get(fingerprint, sources)
+    if cached is not None:
+        prompt, render_stats = cached
+        _last_render_stats = dict(
+            render_stats, cache_hit=True, render_ms=round((time.perf_counter() - started) * 1000, 3)
+        )
+        return prompt
     
     # Extract week and date from ESPN link
     import re
     from datetime import datetime
-    espn_link = settings.espn_game_data_link
+    espn_link = config.espn_game_data_link
     week_match = re.search(r'/week/(\d+)', espn_link)
     year_match = re.search(r'/year/(\d+)', espn_link)
     
@@ -46,51 +150,203 @@ def render_prompt() -> str:
         year_num = "2025"
         current_date = "2025-12-03"
     
-    # Fetch live game data from ESPN
+    selected_games: List[GameData] = []
     try:
-        games, metadata = scrape_espn_schedule(settings.espn_game_data_link)
+        games, metadata = schedule
+        if metadata.get("error"):
+            raise Exception(metadata["error"])
         # Use new game selection system if enabled, otherwise fall back to focus_games
-        if settings.use_game_selection and settings.selected_game_ids:
-            game_data = format_games_for_prompt(games, settings.focus_games, settings.selected_game_ids)
-        else:
-            game_data = format_games_for_prompt(games, settings.focus_games, None)
+        selected_games = filter_games(games, config.focus_games, _selected_game_ids(config))
+        game_data = format_games_for_prompt(selected_games)
     except Exception as e:
         game_data = f"Unable to fetch live game data: {str(e)}\nPlease verify the ESPN URL is correct."
     
-    # Load and format depth chart data
-    depth_chart_data = ""
+    # Load and format depth chart data (cached until the CSV changes)
+    depth_chart_data, render_stats = _depth_chart_for_prompt(selected_games, config)
+    
+    # Fill all slots in a single pass
+    prompt = template.render({
+        "SLATE_DESCRIPTION": config.slate_description,
+        "NOTE": config.note,
+        "FOCUS_GAMES": config.focus_games,
+        "PROP_FOCUS": config.prop_focus,
+        "MIN_ARTICLES_FOR_SENTIMENT": str(config.min_articles_for_sentiment),
+        "INCLUDE_LONG_SHOTS": str(config.include_long_shots).lower(),
+        "ESPN_GAME_DATA_LINK": config.espn_game_data_link,
+        "YEAR": year_num,
+        "WEEK_NUMBER": week_num,
+        "DATE": current_date,
+        "GAME_DATA": game_data,
+        "DEPTH_CHART_DATA": depth_chart_data,
+    })
+    
+    render_stats.update({
+        "fingerprint": fingerprint,
+        "cache_hit": False,
+        "prompt_tokens": estimate_tokens(prompt),
+        "template_version": template.version,
+        "template_render_ms": round(template.last_render_seconds * 1000, 3),
+        "render_ms": round((time.perf_counter() - started) * 1000, 3),
+    })
+    _last_render_stats = render_stats
+    if not schedule[1].get("error"):
+        # Failed fetches are retried on the next render rather than cached
+        rendered_prompt_cache.put(fingerprint, sources, prompt, render_stats)
+    
+    return prompt
+
+
+# Settings that affect the rendered prompt
+PROMPT_SETTINGS_FIELDS = {
+    "espn_game_data_link",
+    "slate_description",
+    "note",
+    "focus_games",
+    "use_game_selection",
+    "selected_game_ids",
+    "prop_focus",
+    "min_articles_for_sentiment",
+    "include_long_shots",
+    "scope_depth_chart_to_games",
+}
+
+
+def render_fingerprint(config: Settings, schedule: Tuple[List[GameData], Dict], template: CompiledTemplate) -> str:
+    """
+    Digest of every input render_prompt() depends on.
+    
+    Covers the prompt-relevant settings, the template version, the schedule
+    cache version for the ESPN URL, the depth chart version and today's date
+    (which appears in the prompt).
+    
+    Args:
+        config: Settings being rendered
+        schedule: (games, metadata) the prompt is built from
+        template: Compiled template being rendered
+        
+    Returns:
+        Hex digest identifying the rendering
+    """
+    from datetime import date
+    inputs = {
+        "settings": config.model_dump(mode="json", include=PROMPT_SETTINGS_FIELDS),
+        "template_version": template.version,
+        "schedule_version": schedule_cache.version_of(config.espn_game_data_link),
+        "schedule_error": schedule[1].get("error"),
+        "depth_chart_version": depth_chart_cache.current_version(),
+        "date": date.today().isoformat(),
+    }
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for prompt-size reporting (~4 characters per token)."""
+    return (len(text) + 3) // 4
+
+
+def _depth_chart_for_prompt(games: List[GameData], config: Settings) -> Tuple[str, Dict[str, Any]]:
+    """
+    Choose the depth chart text for the prompt and measure what it costs.
+    
+    Only teams playing in the selected games are included, unless scoping
+    is disabled, no games were resolved, or the scoped text would not be
+    smaller than the compact chart for all 32 teams.
+    
+    Args:
+        games: Games that made it into the prompt
+        config: Settings being rendered
+        
+    Returns:
+        Tuple of (depth chart text, render stats)
+    """
+    stats: Dict[str, Any] = {
+        "depth_chart_scope": "unavailable",
+        "games_included": len(games),
+        "teams_included": [],
+        "depth_chart_tokens": 0,
+        "full_depth_chart_tokens": 0,
+        "tokens_saved": 0,
+    }
     try:
-        depth_chart_path = Path(__file__).parent.parent / "data" / "FantasyPros_Fantasy_Football_2025_Depth_Charts.csv"
-        if depth_chart_path.exists():
-            depth_chart = parse_depth_chart(str(depth_chart_path))
-            depth_chart_data = format_all_depth_charts_compact(depth_chart)
-        else:
-            depth_chart_data = "Depth chart data not available."
+        full_text = depth_chart_cache.get_compact()
+        scoped_text, teams = depth_chart_cache.get_for_games(games)
+    except FileNotFoundError:
+        return "Depth chart data not available.", stats
     except Exception as e:
-        depth_chart_data = f"Unable to load depth chart data: {str(e)}"
-    
-    # Replace all variables
-    prompt = template.replace("{{SLATE_DESCRIPTION}}", settings.slate_description)
-    prompt = prompt.replace("{{NOTE}}", settings.note)
-    prompt = prompt.replace("{{FOCUS_GAMES}}", settings.focus_games)
-    prompt = prompt.replace("{{PROP_FOCUS}}", settings.prop_focus)
-    prompt = prompt.replace("{{MIN_ARTICLES_FOR_SENTIMENT}}", str(settings.min_articles_for_sentiment))
-    prompt = prompt.replace("{{INCLUDE_LONG_SHOTS}}", str(settings.include_long_shots).lower())
-    prompt = prompt.replace("{{ESPN_GAME_DATA_LINK}}", settings.espn_game_data_link)
-    prompt = prompt.replace("{{YEAR}}", year_num)
-    prompt = prompt.replace("{{WEEK_NUMBER}}", week_num)
-    prompt = prompt.replace("{{DATE}}", current_date)
-    
-    # Replace the game data placeholder with actual game data
-    prompt = prompt.replace("[LIVE GAME DATA WILL BE INSERTED HERE]", game_data)
-    
-    # Replace depth chart placeholder
-    prompt = prompt.replace("{{DEPTH_CHART_DATA}}", depth_chart_data)
+        return f"Unable to load depth chart data: {str(e)}", stats
     
-    return prompt
+    full_tokens = estimate_tokens(full_text)
+    scoped_tokens = estimate_tokens(scoped_text)
+    stats["full_depth_chart_tokens"] = full_tokens
+    if config.scope_depth_chart_to_games and teams and scoped_tokens < full_tokens:
+        stats.update({
+            "depth_chart_scope": "games",
+            "teams_included": teams,
+            "depth_chart_tokens": scoped_tokens,
+            "tokens_saved": full_tokens - scoped_tokens,
+        })
+        return scoped_text, stats
+    
+    stats.update({
+        "depth_chart_scope": "all",
+        "teams_included": sorted(depth_chart_cache.get()),
+        "depth_chart_tokens": full_tokens,
+    })
+    return full_text, stats
 
 
-def generate_picks() -> WeeklyPicksModel:
+def get_last_render_stats() -> Dict[str, Any]:
+    """
+    Return token accounting for the most recently rendered prompt.
+    
+    Returns:
+        Dict with depth_chart_scope ("games", "all" or "unavailable"),
+        games_included, teams_included, depth_chart_tokens,
+        full_depth_chart_tokens, tokens_saved, prompt_tokens,
+        template_version, fingerprint, cache_hit and timings
+        (template_render_ms, render_ms)
+    """
+    return dict(_last_render_stats)
+
+
+def _selected_game_ids(config: Settings) -> Optional[List[str]]:
+    """Game IDs chosen in the game selector, or None to use the legacy focus_games filter."""
+    if config.use_game_selection and config.selected_game_ids:
+        return config.selected_game_ids
+    return None
+
+
+async def render_prompt_async(config: Optional[Settings] = None) -> str:
+    """
+    Async variant of render_prompt() for request handlers.
+    
+    The ESPN schedule is fetched on the shared async HTTP client, and the
+    settings lookup and rendering (which may parse the depth chart CSV and
+    compile the template on a cold cache) run in a worker thread, so the
+    event loop is never blocked.
+    
+    Args:
+        config: Settings to render with (defaults to the current runtime settings).
+    
+    Returns:
+        Rendered prompt string with all variables replaced and live game data.
+    """
+    config = config or await asyncio.to_thread(settings_store.current)
+    try:
+        schedule = await get_cached_schedule_async(config.espn_game_data_link)
+    except Exception as e:
+        schedule = ([], {"error": str(e)})
+    return await asyncio.to_thread(render_prompt, schedule, config)
+
+
+# Progress stages reported by generate_picks(), in order
+GENERATION_STAGES = ["prompt_rendered", "model_called", "validated", "saved"]
+
+
+def generate_picks(config: Optional[Settings] = None,
+                   progress: Optional[Callable[[str], None]] = None,
+                   client: Any = None,
+                   bypass_cache: bool = False) -> WeeklyPicksModel:
     """
     Generate weekly picks using OpenAI's structured outputs.
     
@@ -99,100 +355,485 @@ def generate_picks() -> WeeklyPicksModel:
     - Returns a typed Pydantic instance (not raw JSON)
     - Handles errors gracefully
     
+    When GENERATION_FANOUT is "time_slot" or "position", the work is split
+    into concurrent requests (see generate_picks_fanout()).
+    
+    A request identical to an earlier one (same model, prompt, schema and
+    temperature) is answered from the completion cache unless bypass_cache
+    is set, in which case the fresh response replaces the cached one.
+    
+    Args:
+        config: Settings to generate with (defaults to the current runtime settings).
+        progress: Optional callback invoked with each completed stage name
+            ("prompt_rendered", "model_called", "validated").
+        client: OpenAI-compatible client (the shared client if omitted).
+        bypass_cache: Always call the model, even for a cached request.
+    
     Returns:
         WeeklyPicksModel instance with validated data.
         
     Raises:
         Exception: If OpenAI API call fails or response doesn't match schema.
     """
+    config = config or settings_store.current()
+    if config.generation_fanout in FANOUT_MODES:
+        return generate_picks_fanout(config, mode=config.generation_fanout, progress=progress, client=client,
+                                     bypass_cache=bypass_cache)
+    
+    progress = progress or (lambda stage: None)
+    
     # Render the prompt with current settings
-    prompt = render_prompt()
+    prompt = render_prompt(config=config)
+    progress("prompt_rendered")
+    
+    # Shared, connection-pooled OpenAI client, leased until the request is done
+    with ExitStack() as stack:
+        client = client or stack.enter_context(openai_clients.lease(config))
+        picks = request_picks(client, prompt, _cache_mode(config, bypass_cache))
+    progress("model_called")
+    
+    return _validate_generated_picks(picks, progress)
+
+
+def request_picks(client: Any, prompt: str, cache_mode: str = "off") -> WeeklyPicksModel:
+    """
+    Make one structured-output request for a rendered prompt.
+    
+    Transient failures are retried with backoff and count towards the
+    OpenAI circuit breaker (see openai_clients.call()).
     
-    # Initialize OpenAI client
-    client = OpenAI(api_key=settings.openai_api_key)
+    Args:
+        client: OpenAI-compatible client
+        prompt: Rendered prompt
+        cache_mode: "use" to answer from the completion cache when possible,
+            "refresh" to call the model and overwrite the cached response,
+            or "off".
+        
+    Returns:
+        Parsed (not yet depth-chart validated) WeeklyPicksModel.
+        
+    Raises:
+        Exception: If the model refuses or the response can't be parsed.
+        CircuitOpenError: If OpenAI has been failing and the circuit breaker is open.
+    """
+    key = completion_cache_key(prompt) if cache_mode != "off" else None
+    if cache_mode == "use":
+        cached = completion_cache.get(key)
+        if cached is not None:
+            return cached
     
     # Call OpenAI with structured outputs
-    # Note: Must use gpt-4o-2024-08-06 or later for structured outputs
-    completion = client.chat.completions.parse(
-        model="gpt-4o-2024-08-06",
-        messages=[
-            {
-                "role": "system",
-                "content": "You are an expert NFL fantasy and betting analyst. Return only valid JSON matching the exact schema provided."
-            },
-            {
-                "role": "user",
-                "content": prompt
-            }
-        ],
+    completion = openai_clients.call(lambda: client.chat.completions.parse(
+        model=OPENAI_MODEL,
+        messages=build_messages(prompt),
         response_format=WeeklyPicksModel,  # Pydantic model for automatic validation
-        temperature=0.7,  # Some creativity but mostly consistent
-    )
+        temperature=TEMPERATURE,
+    ))
     
     # Extract the parsed response
     message = completion.choices[0].message
     
     # Check if parsing was successful
     if message.parsed:
-        # Validate against depth chart
-        depth_chart_path = Path(__file__).parent.parent / "data" / "FantasyPros_Fantasy_Football_2025_Depth_Charts.csv"
-        if depth_chart_path.exists():
-            try:
-                depth_chart = parse_depth_chart(str(depth_chart_path))
-                validated_picks = validate_and_correct_picks(message.parsed, depth_chart)
-                return validated_picks
-            except Exception as e:
-                print(f"⚠️  Warning: Could not validate against depth chart: {str(e)}")
-                return message.parsed
-        else:
-            print("⚠️  Warning: Depth chart file not found, skipping validation")
-            return message.parsed
+        if key is not None:
+            completion_cache.put(key, message.parsed)
+        return message.parsed
     elif message.refusal:
         raise Exception(f"Model refused to generate picks: {message.refusal}")
     else:
         raise Exception("Failed to parse response from OpenAI")
 
 
+def _validate_generated_picks(picks: WeeklyPicksModel, progress: Callable[[str], None]) -> WeeklyPicksModel:
+    """Validate freshly generated picks against the cached depth chart, if available."""
+    try:
+        index = depth_chart_cache.get_index()
+    except FileNotFoundError:
+        print("⚠️  Warning: Depth chart file not found, skipping validation")
+        return picks
+    
+    try:
+        validated_picks = validate_and_correct_picks(picks, index)
+        progress("validated")
+        return validated_picks
+    except Exception as e:
+        print(f"⚠️  Warning: Could not validate against depth chart: {str(e)}")
+        return picks
+
+
+# Ways generate_picks_fanout() can split a slate into concurrent requests
+FANOUT_MODES = ("time_slot", "position")
+
+# Categories requested separately in "position" fan-out mode
+FANOUT_POSITION_LABELS = {
+    "qbs": "quarterbacks (categories.qbs)",
+    "rbs": "running backs (categories.rbs)",
+    "wrs": "wide receivers (categories.wrs)",
+    "tes": "tight ends (categories.tes)",
+    "long_shots": "long shots (long_shots.players)",
+}
+
+
+def generate_picks_fanout(config: Optional[Settings] = None, mode: str = "time_slot",
+                          max_concurrency: Optional[int] = None,
+                          progress: Optional[Callable[[str], None]] = None,
+                          client: Any = None,
+                          bypass_cache: bool = False) -> WeeklyPicksModel:
+    """
+    Generate picks with several smaller concurrent requests instead of one large one.
+    
+    - "time_slot": one request per time slot of the selected games
+      (early, afternoon, night, thursday, monday), each seeing only its games.
+    - "position": one request per category (QB, RB, WR, TE, long shots) over
+      the full slate, each asked to fill only its category.
+    
+    Partial results are merged with players deduplicated by normalized name
+    (first request in slot/category order wins), then validated once. Each
+    request goes through the completion cache on its own.
+    
+    Args:
+        config: Settings to generate with (defaults to the current runtime settings).
+        mode: "time_slot" or "position".
+        max_concurrency: Maximum requests in flight (defaults to GENERATION_MAX_CONCURRENCY).
+        progress: Optional callback invoked with each completed stage name.
+        client: OpenAI-compatible client (the shared client if omitted).
+        bypass_cache: Always call the model, even for cached requests.
+        
+    Returns:
+        Merged and validated WeeklyPicksModel.
+        
+    Raises:
+        ValueError: If mode is unknown.
+        Exception: If any request fails.
+    """
+    config = config or settings_store.current()
+    progress = progress or (lambda stage: None)
+    if mode not in FANOUT_MODES:
+        raise ValueError(f"Unknown fan-out mode '{mode}' (expected one of {', '.join(FANOUT_MODES)})")
+    
+    try:
+        schedule = get_cached_schedule(config.espn_game_data_link)
+    except Exception as e:
+        schedule = ([], {"error": str(e)})
+    
+    # Build one (category filter, prompt) task per slot or position
+    tasks: List[Tuple[Optional[str], str]] = []
+    if mode == "time_slot":
+        games = filter_games(schedule[0], config.focus_games, _selected_game_ids(config))
+        for slot_games in group_games_by_time_slot(games).values():
+            if slot_games:
+                slot_config = config.model_copy(update={
+                    "use_game_selection": True,
+                    "selected_game_ids": [g.game_id for g in slot_games]
+                })
+                tasks.append((None, render_prompt(schedule, slot_config)))
+    else:
+        prompt = render_prompt(schedule, config)
+        categories = list(FANOUT_POSITION_LABELS)
+        if not config.include_long_shots:
+            categories.remove("long_shots")
+        for category in categories:
+            instruction = (
+                f"\n\n# Scope of This Request\n"
+                f"Only provide {FANOUT_POSITION_LABELS[category]}. "
+                f"Leave every other category empty; other requests cover them."
+            )
+            tasks.append((category, prompt + instruction))
+    
+    if not tasks:
+        # Nothing to split (e.g. no games matched); fall back to a single request
+        tasks.append((None, render_prompt(schedule, config)))
+    progress("prompt_rendered")
+    
+    cache_mode = _cache_mode(config, bypass_cache)
+    limit = max(1, min(max_concurrency or config.generation_max_concurrency, len(tasks)))
+    with ExitStack() as stack:
+        client = client or stack.enter_context(openai_clients.lease(config))
+        with ThreadPoolExecutor(max_workers=limit, thread_name_prefix="picks-fanout") as executor:
+            partials = list(executor.map(lambda task: request_picks(client, task[1], cache_mode), tasks))
+    progress("model_called")
+    
+    picks = merge_picks(partials, [category for category, _ in tasks])
+    return _validate_generated_picks(picks, progress)
+
+
+def merge_picks(partials: List[WeeklyPicksModel],
+                only_categories: Optional[List[Optional[str]]] = None) -> WeeklyPicksModel:
+    """
+    Merge partial pick documents, deduplicating players by normalized name.
+    
+    Args:
+        partials: Partial results in priority order (meta is taken from the first).
+        only_categories: Optional per-partial category to keep ("qbs", ..., "long_shots");
+            None keeps every category of that partial.
+            
+    Returns:
+        Merged WeeklyPicksModel.
+    """
+    only_categories = only_categories or [None] * len(partials)
+    merged = {category: [] for category in PLAYER_CATEGORIES}
+    long_shots = []
+    seen = {category: set() for category in (*PLAYER_CATEGORIES, "long_shots")}
+    
+    for partial, only in zip(partials, only_categories):
+        for category in PLAYER_CATEGORIES:
+            if only not in (None, category):
+                continue
+            for player in getattr(partial.categories, category):
+                key = normalize_player_name(player.name)
+                if key not in seen[category]:
+                    seen[category].add(key)
+                    merged[category].append(player)
+        if only in (None, "long_shots"):
+            for player in partial.long_shots.players:
+                key = normalize_player_name(player.name)
+                if key not in seen["long_shots"]:
+                    seen["long_shots"].add(key)
+                    long_shots.append(player)
+    
+    return WeeklyPicksModel(
+        meta=partials[0].meta,
+        categories=CategoriesModel(**merged),
+        long_shots=LongShotsModel(players=long_shots)
+    )
+
+
+def generate_picks_stream(config: Optional[Settings] = None, client: Any = None,
+                          save: bool = True) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Generate weekly picks with a streamed completion, yielding players as they arrive.
+    
+    Each player is parsed as soon as its JSON object is complete and
+    validated against the depth chart before it is yielded, so the first
+    pick is available long before the full completion finishes. Streams
+    always call the model; the final response is stored in the completion
+    cache for later non-streamed runs.
+    
+    Args:
+        config: Settings to generate with (defaults to the current runtime settings).
+        client: OpenAI-compatible client (the shared client if omitted).
+        save: Save the final picks like generate_and_save_picks() does.
+    
+    Yields:
+        (event, data) tuples:
+        - ("stage", {"stage": ...}) for prompt_rendered / model_called / validated / saved
+        - ("pick", {"category", "player", "warning"}) for each completed player
+        - ("done", {"picks": ...}) with the full validated document
+        
+    Raises:
+        Exception: If the model refuses or the final document doesn't match the schema.
+    """
+    config = config or settings_store.current()
+    
+    prompt = render_prompt(config=config)
+    yield "stage", {"stage": "prompt_rendered"}
+    
+    try:
+        index = depth_chart_cache.get_index()
+    except FileNotFoundError:
+        index = None
+    
+    parser = IncrementalPicksParser()
+    refusal = ""
+    with ExitStack() as stack:
+        client = client or stack.enter_context(openai_clients.lease(config))
+        # Opening the stream is retried; errors after the first event are not
+        stream = openai_clients.call(lambda: stack.enter_context(client.chat.completions.stream(
+            model=OPENAI_MODEL,
+            messages=build_messages(prompt),
+            response_format=WeeklyPicksModel,
+            temperature=TEMPERATURE,
+        )))
+        for event in stream:
+            if event.type == "refusal.delta":
+                refusal += event.delta
+                continue
+            if event.type != "content.delta":
+                continue
+            for category, player in parser.feed(event.delta):
+                warning = None
+                if index is not None:
+                    if category == "long_shots":
+                        warning = validate_long_shot(player, index)
+                    else:
+                        warning = validate_player(player, index)
+                yield "pick", {"category": category, "player": player.model_dump(), "warning": warning}
+    yield "stage", {"stage": "model_called"}
+    
+    if refusal:
+        raise Exception(f"Model refused to generate picks: {refusal}")
+    
+    picks = WeeklyPicksModel.model_validate_json(parser.text)
+    if config.completion_cache_enabled:
+        completion_cache.put(completion_cache_key(prompt), picks)
+    if index is not None:
+        picks = validate_and_correct_picks(picks, index)
+        yield "stage", {"stage": "validated"}
+    
+    if save:
+        save_picks(picks, config=config)
+        yield "stage", {"stage": "saved"}
+    
+    yield "done", {"picks": picks.model_dump()}
+
+
+def generate_and_save_picks(config: Optional[Settings] = None,
+                            progress: Optional[Callable[[str], None]] = None,
+                            bypass_cache: bool = False) -> WeeklyPicksModel:
+    """
+    Generate picks and save them; the unit of work run by background jobs.
+    
+    Args:
+        config: Settings snapshot to generate with (defaults to the current runtime settings).
+        progress: Optional callback invoked with each completed stage name.
+        bypass_cache: Always call the model, even for a cached request.
+    
+    Returns:
+        The saved WeeklyPicksModel instance.
+    """
+    progress = progress or (lambda stage: None)
+    picks = generate_picks(config=config, progress=progress, bypass_cache=bypass_cache)
+    save_picks(picks, config=config)
+    progress("saved")
+    return picks
+
+
+def correct_player_name(player: Union[PlayerModel, LongShotPlayerModel],
+                        index: DepthChartIndex) -> Tuple[Optional[PlayerMatch], bool]:
+    """
+    Replace a name missing from the depth chart with the closest rostered spelling.
+    
+    Catches formatting differences ("DJ Moore" / "D.J. Moore", "Kenneth
+    Walker" / "Kenneth Walker III") and small misspellings. A match on
+    another team than the claimed one is only applied if the names are
+    nearly identical; otherwise it may be a different player ("Brian
+    Robinson" / "Bijan Robinson"), so the pick is left as is.
+    
+    Args:
+        player: Player pick to check (renamed in place)
+        index: Depth chart index
+        
+    Returns:
+        Tuple of (closest match, or None if the name was already exact or
+        nothing matched; whether the pick was renamed to it)
+    """
+    if player.name in index:
+        return None, False
+    match = index.fuzzy_match(player.name, player.team)
+    if match is None:
+        return None, False
+    if match.score >= FUZZY_RENAME_MIN_SCORE or match.team == index.resolve_team(player.team):
+        player.name = match.name
+        return match, True
+    return match, False
+
+
+def _rename_note(original_name: str, match: Optional[PlayerMatch]) -> List[str]:
+    if match is None:
+        return []
+    return [f"🔎 {original_name}: Matched depth chart player '{match.name}' (confidence {match.score:.0%})"]
+
+
+def _candidate_note(label: str, team: str, match: PlayerMatch) -> str:
+    return (f"❌ {label}: Not found in depth charts (claimed team: {team}); closest is "
+            f"'{match.name}' ({match.team}, confidence {match.score:.0%}), not applied")
+
+
+def validate_player(player: PlayerModel, index: DepthChartIndex) -> Optional[str]:
+    """
+    Validate one category player against the depth chart, correcting in place.
+    
+    Args:
+        player: Player pick to check
+        index: Depth chart index
+        
+    Returns:
+        Warning message if the player was renamed, corrected or not found, else None
+    """
+    original_name = player.name
+    match, renamed = correct_player_name(player, index)
+    if match is not None and not renamed:
+        player.verified = False
+        player.matchup_note = f"[NOT IN DEPTH CHART] {player.matchup_note}"
+        return _candidate_note(player.name, player.team, match)
+    warnings = _rename_note(original_name, match)
+    if match is not None and match.score < 1.0:
+        player.verified = False  # Misspelled name; worth a second look
+    
+    # Check if player-team combo is valid
+    correct_team = index.team_of(player.name)
+    if correct_team is not None and index.resolve_team(player.team) == correct_team:
+        player.team = correct_team  # Store the depth chart name, not an alias ("KC", "Chiefs")
+        return "\n".join(warnings) or None
+    
+    if correct_team:
+        warnings.append(f"⚠️  {player.name}: Corrected team from '{player.team}' to '{correct_team}'")
+        player.team = correct_team
+        player.verified = False  # Mark as unverified due to correction
+        # Update matchup note to indicate correction
+        player.matchup_note = f"[TEAM CORRECTED] {player.matchup_note}"
+    else:
+        warnings.append(f"❌ {player.name}: Not found in depth charts (claimed team: {player.team})")
+        player.verified = False
+        player.matchup_note = f"[NOT IN DEPTH CHART] {player.matchup_note}"
+    return "\n".join(warnings)
+
+
+def validate_long_shot(player: LongShotPlayerModel, index: DepthChartIndex) -> Optional[str]:
+    """
+    Validate one long shot player against the depth chart, correcting in place.
+    
+    Args:
+        player: Long shot pick to check
+        index: Depth chart index
+        
+    Returns:
+        Warning message if the player was renamed, corrected or not found, else None
+    """
+    original_name = player.name
+    match, renamed = correct_player_name(player, index)
+    if match is not None and not renamed:
+        return _candidate_note(f"{player.name} (long shot)", player.team, match)
+    warnings = _rename_note(original_name, match)
+    correct_team = index.team_of(player.name)
+    if correct_team is not None and index.resolve_team(player.team) == correct_team:
+        player.team = correct_team  # Store the depth chart name, not an alias ("KC", "Chiefs")
+        return "\n".join(warnings) or None
+    
+    if correct_team:
+        warnings.append(f"⚠️  {player.name} (long shot): Corrected team from '{player.team}' to '{correct_team}'")
+        player.team = correct_team
+    else:
+        warnings.append(f"❌ {player.name} (long shot): Not found in depth charts (claimed team: {player.team})")
+    return "\n".join(warnings)
+
+
 def validate_and_correct_picks(picks: WeeklyPicksModel, depth_chart: dict) -> WeeklyPicksModel:
     """
     Validate player-team assignments and flag/correct errors.
     
     Args:
         picks: Generated picks from AI
-        depth_chart: Parsed depth chart data
+        depth_chart: Parsed depth chart data (or a prebuilt DepthChartIndex)
         
     Returns:
         Validated picks with corrections and warnings
     """
     warnings = []
+    index = get_depth_chart_index(depth_chart)
     
     # Validate each category
-    for category_name in ['qbs', 'rbs', 'wrs', 'tes']:
-        category = getattr(picks.categories, category_name)
-        for player in category:
-            # Check if player-team combo is valid
-            if not validate_player_team(player.name, player.team, depth_chart):
-                correct_team = get_player_team(player.name, depth_chart)
-                if correct_team:
-                    warnings.append(f"⚠️  {player.name}: Corrected team from '{player.team}' to '{correct_team}'")
-                    player.team = correct_team
-                    player.verified = False  # Mark as unverified due to correction
-                    # Update matchup note to indicate correction
-                    player.matchup_note = f"[TEAM CORRECTED] {player.matchup_note}"
-                else:
-                    warnings.append(f"❌ {player.name}: Not found in depth charts (claimed team: {player.team})")
-                    player.verified = False
-                    player.matchup_note = f"[NOT IN DEPTH CHART] {player.matchup_note}"
+    for category_name in PLAYER_CATEGORIES:
+        for player in getattr(picks.categories, category_name):
+            warning = validate_player(player, index)
+            if warning:
+                warnings.append(warning)
     
     # Validate long shots
     for player in picks.long_shots.players:
-        if not validate_player_team(player.name, player.team, depth_chart):
-            correct_team = get_player_team(player.name, depth_chart)
-            if correct_team:
-                warnings.append(f"⚠️  {player.name} (long shot): Corrected team from '{player.team}' to '{correct_team}'")
-                player.team = correct_team
-            else:
-                warnings.append(f"❌ {player.name} (long shot): Not found in depth charts (claimed team: {player.team})")
+        warning = validate_long_shot(player, index)
+        if warning:
+            warnings.append(warning)
     
     # Log warnings
     if warnings:
@@ -208,14 +849,23 @@ def validate_and_correct_picks(picks: WeeklyPicksModel, depth_chart: dict) -> We
     return picks
 
 
-def save_picks(picks: WeeklyPicksModel, filepath: str = "app/data/current_picks.json") -> None:
+def save_picks(picks: WeeklyPicksModel, filepath: str = "app/data/current_picks.json",
+               config: Optional[Settings] = None) -> None:
     """
     Save picks to both current_picks.json and a dated historical file.
     
+    With the "archive" storage backend the dated file is a compact msgpack
+    archive and the current picks become a pointer to it, so the week is
+    stored once; load_picks() still accepts the .json paths. Every file is
+    replaced atomically, so concurrent readers never see a partial write.
+    
     Args:
         picks: WeeklyPicksModel instance to save.
         filepath: Path to save the current JSON file (relative to project root).
+        config: Settings used for the historical filename and storage backend
+            (defaults to the current runtime settings).
     """
+    config = config or settings_store.current()
     from datetime import datetime
     import re
     
@@ -223,12 +873,8 @@ def save_picks(picks: WeeklyPicksModel, filepath: str = "app/data/current_picks.
     data_dir = Path(filepath).parent
     data_dir.mkdir(parents=True, exist_ok=True)
     
-    # Save as current_picks.json
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(picks.model_dump_json(indent=2))
-    
     # Extract week and date from ESPN link for filename
-    espn_link = settings.espn_game_data_link
+    espn_link = config.espn_game_data_link
     week_match = re.search(r'/week/(\d+)', espn_link)
     year_match = re.search(r'/year/(\d+)', espn_link)
     
@@ -240,17 +886,45 @@ def save_picks(picks: WeeklyPicksModel, filepath: str = "app/data/current_picks.
     # Use current date for historical filename
     current_date = datetime.now().strftime("%Y-%m-%d")
     
-    historical_filename = f"week_{week}_{current_date}.json"
-    historical_path = data_dir / historical_filename
+    historical_path = data_dir / f"week_{week}_{current_date}.json"
+    current_path = Path(filepath)
+    
+    backend = config.picks_storage_backend
+    if backend == "archive" and not MSGPACK_AVAILABLE:
+        print("⚠️  msgpack is not installed; saving picks as JSON")
+        backend = "json"
+    
+    if backend == "archive":
+        archive_path = historical_path.with_suffix(ARCHIVE_SUFFIX)
+        write_archive(archive_path, picks)
+        write_pointer(current_path.with_suffix(POINTER_SUFFIX), archive_path)
+        # Remove JSON copies that would shadow the archive and pointer
+        for stale in (current_path, historical_path):
+            stale.unlink(missing_ok=True)
+        historical_path = archive_path
+        picks_store.put(current_path, picks)
+        picks_store.put(historical_path, picks)
+    else:
+        # Save as current_picks.json (serialized once for both files)
+        picks_json = picks.model_dump_json(indent=2)
+        atomic_write_text(current_path, picks_json)
+        atomic_write_text(historical_path, picks_json)
+        # Drop archive copies left by the archive backend
+        historical_path.with_suffix(ARCHIVE_SUFFIX).unlink(missing_ok=True)
+        current_path.with_suffix(POINTER_SUFFIX).unlink(missing_ok=True)
+        picks_store.put(current_path, picks, picks_json)
+        picks_store.put(historical_path, picks, picks_json)
     
-    with open(historical_path, "w", encoding="utf-8") as f:
-        f.write(picks.model_dump_json(indent=2))
+    picks_index.add(historical_path, picks)
 
 
 def load_picks(filepath: str = "app/data/current_picks.json") -> WeeklyPicksModel:
     """
     Load picks from a JSON file.
     
+    The file is parsed once and then served from the picks store until it
+    changes on disk, so the returned model is shared and must not be mutated.
+    
     Args:
         filepath: Path to the JSON file (relative to project root).
         
@@ -261,7 +935,4 @@ def load_picks(filepath: str = "app/data/current_picks.json") -> WeeklyPicksMode
         FileNotFoundError: If the file doesn't exist.
         Exception: If the JSON doesn't match the schema.
     """
-    with open(filepath, "r", encoding="utf-8") as f:
-        data = f.read()
-    
-    return WeeklyPicksModel.model_validate_json(data)
\ No newline at end of file
+    return picks_store.get(filepath).picks
\ No newline at end of file
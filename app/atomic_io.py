@@ -0,0 +1,68 @@
+"""Crash-safe file writes."""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Union
+
+
+def _read_umask() -> int:
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Read once at import: os.umask() is process-wide, so probing it later could
+# race with other threads creating files
+_DEFAULT_MODE = 0o666 & ~_read_umask()  # What a plain open(path, "w") would create
+
+
+def atomic_write_bytes(path: Union[str, Path], data: bytes) -> None:
+    """
+    Replace path with data so readers see either the old or the new file, never a partial one.
+
+    The data is written to a temporary file in the same directory, flushed
+    and fsynced, then renamed over the target with os.replace() (atomic on
+    POSIX and Windows). The directory is fsynced afterwards where supported,
+    so the rename itself survives a crash.
+
+    Args:
+        path: Destination file
+        data: Complete new contents
+    """
+    path = Path(path)
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        mode = _DEFAULT_MODE
+
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+    try:
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+    except OSError:
+        return  # Directories cannot be opened on Windows
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+def atomic_write_text(path: Union[str, Path], text: str, encoding: str = "utf-8") -> None:
+    """Text variant of atomic_write_bytes()."""
+    atomic_write_bytes(path, text.encode(encoding))
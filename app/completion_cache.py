@@ -0,0 +1,119 @@
+"""Disk cache of parsed model completions, keyed by request content."""
+
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from pydantic import ValidationError
+
+from .atomic_io import atomic_write_bytes
+from .config import settings
+from .models import WeeklyPicksModel
+
+DEFAULT_CACHE_DIR = Path("app/data/completion_cache")
+
+
+class CompletionCache:
+    """
+    Content-addressed store of structured-output completions.
+
+    Each entry is the parsed WeeklyPicksModel for one request key, saved as
+    JSON in its own file so every worker shares the cache. Reads refresh the
+    file's mtime, and writes evict the least recently used entries once the
+    directory grows past max_bytes.
+    """
+
+    def __init__(self, directory: Union[str, Path] = DEFAULT_CACHE_DIR, max_bytes: int = 100 * 1024 * 1024):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[WeeklyPicksModel]:
+        """
+        Return the cached picks for a request key.
+
+        Args:
+            key: Request key (see ai_client.completion_cache_key())
+
+        Returns:
+            Validated WeeklyPicksModel, or None on a miss
+        """
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+            picks = WeeklyPicksModel.model_validate_json(data)
+        except FileNotFoundError:
+            picks = None
+        except ValidationError:
+            # Written under an older schema; drop it
+            path.unlink(missing_ok=True)
+            picks = None
+        else:
+            try:
+                os.utime(path)  # Mark as recently used
+            except FileNotFoundError:
+                pass  # Evicted by another process since the read; what was read is still valid
+
+        with self._lock:
+            if picks is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return picks
+
+    def put(self, key: str, picks: WeeklyPicksModel) -> None:
+        """Store picks under a request key, then enforce the size limit."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(self._path(key), picks.model_dump_json().encode("utf-8"))
+        self._evict()
+
+    def _entries(self) -> List[Tuple[int, int, Path]]:
+        """(mtime_ns, size, path) for every cached completion."""
+        entries = []
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue  # Removed by another worker
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        return entries
+
+    def _evict(self) -> None:
+        """Delete the least recently used entries until the cache fits in max_bytes."""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            with self._lock:
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Delete every cached completion."""
+        for path in self.directory.glob("*.json"):
+            path.unlink(missing_ok=True)
+
+    def stats(self) -> Dict[str, object]:
+        """Return cache counters for monitoring."""
+        entries = self._entries()
+        return {
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+# Global completion cache used by ai_client.request_picks()
+completion_cache = CompletionCache(max_bytes=settings.completion_cache_max_mb * 1024 * 1024)
@@ -1,7 +1,7 @@
 """Configuration management using pydantic-settings."""
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -9,6 +9,15 @@ class Settings(BaseSettings):
     
     # OpenAI Configuration
     openai_api_key: str
+    openai_base_url: Optional[str] = None  # OpenAI-compatible endpoint (defaults to api.openai.com)
+    openai_timeout_seconds: float = 600.0  # Per-request timeout (structured outputs can take minutes)
+    openai_connect_timeout_seconds: float = 10.0
+    openai_max_connections: int = 20  # Pooled connections kept by the shared client
+    openai_max_retries: int = 3  # Retries for rate limits, timeouts and 5xx errors
+    openai_retry_base_delay: float = 1.0  # Backoff doubles from here (with jitter) unless Retry-After says otherwise
+    openai_retry_max_delay: float = 30.0
+    openai_circuit_failure_threshold: int = 5  # Consecutive failed calls before failing fast
+    openai_circuit_reset_seconds: float = 60.0  # Wait before letting a trial call through
     
     # Weekly Picks Configuration
     espn_game_data_link: str = "https://www.espn.com/nfl/schedule/_/week/13/year/2025/seasontype/2"
@@ -28,6 +37,40 @@ class Settings(BaseSettings):
     # AI Generation Settings
     min_articles_for_sentiment: int = 3
     include_long_shots: bool = True
+    scope_depth_chart_to_games: bool = True  # Only send depth charts for teams in the selected games
+    
+    # Picks Storage
+    picks_storage_backend: str = "json"  # "json" (pretty-printed files) or "archive" (compact msgpack + pointer)
+    picks_index_path: str = "app/data/picks_index.sqlite3"  # SQLite index of historical picks files
+    
+    # Runtime Settings State
+    runtime_state_backend: str = "sqlite"  # "sqlite" (settings and jobs shared by all uvicorn workers) or "memory" (single worker)
+    runtime_state_path: str = "app/data/runtime_settings.sqlite3"
+    
+    # Completion Cache
+    completion_cache_enabled: bool = True  # Reuse the saved response for an identical prompt/model request
+    completion_cache_max_mb: int = 100  # Least recently used responses are evicted beyond this size
+    
+    # Background Generation
+    generation_workers: int = 2  # Concurrent pick generation jobs
+    generation_fanout: str = "off"  # "off", "time_slot" or "position" (split into concurrent requests)
+    generation_max_concurrency: int = 4  # Max concurrent OpenAI requests per fan-out generation
+    
+    # ESPN Schedule Parsing
+    espn_parser: str = "auto"  # "auto" (fastest installed), "selectolax", "lxml" or "html.parser"
+    espn_schedule_source: str = "html"  # "html" (schedule page) or "json" (scoreboard API, page as fallback)
+    espn_scoreboard_url: str = "https://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard"
+    
+    # ESPN Schedule Cache
+    espn_cache_ttl_seconds: int = 300  # Serve cached schedule without any request
+    espn_cache_stale_seconds: int = 3600  # Serve stale while revalidating in background
+    espn_cache_max_weeks: int = 8  # Number of schedule URLs kept (LRU)
+    
+    # Cache Warm-up (at startup, then on a timer; 0 = startup only)
+    cache_warmup_enabled: bool = True
+    cache_warmup_schedule_seconds: int = 240  # This week's and next week's schedule; keep below espn_cache_ttl_seconds
+    cache_warmup_prompt_seconds: int = 240  # Pre-render the prompt for the current settings
+    cache_warmup_files_seconds: int = 60  # Reload the depth chart CSV and current picks if they changed
     
     model_config = SettingsConfigDict(
         env_file=".env",
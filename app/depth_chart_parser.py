@@ -1,8 +1,55 @@
 """Parser for FantasyPros depth chart CSV data."""
 
 import csv
+import os
+import sys
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
+
+from .player_matcher import FUZZY_MATCH_MIN_SCORE, PlayerMatch, PlayerNameMatcher
+from .roster import DepthChartView, PlayerRecord, Roster
+
+
+# Default location of the FantasyPros depth chart export
+DEFAULT_DEPTH_CHART_PATH = Path(__file__).parent.parent / "data" / "FantasyPros_Fantasy_Football_2025_Depth_Charts.csv"
+
+# Standard abbreviations for each team in the FantasyPros depth chart.
+# Alternates (e.g. ESPN's "WSH", "JAC") are listed after the primary code.
+TEAM_ABBREVIATIONS: Dict[str, List[str]] = {
+    "Arizona Cardinals": ["ARI"],
+    "Atlanta Falcons": ["ATL"],
+    "Baltimore Ravens": ["BAL"],
+    "Buffalo Bills": ["BUF"],
+    "Carolina Panthers": ["CAR"],
+    "Chicago Bears": ["CHI"],
+    "Cincinnati Bengals": ["CIN"],
+    "Cleveland Browns": ["CLE"],
+    "Dallas Cowboys": ["DAL"],
+    "Denver Broncos": ["DEN"],
+    "Detroit Lions": ["DET"],
+    "Green Bay Packers": ["GB", "GNB"],
+    "Houston Texans": ["HOU"],
+    "Indianapolis Colts": ["IND"],
+    "Jacksonville Jaguars": ["JAX", "JAC"],
+    "Kansas City Chiefs": ["KC", "KAN"],
+    "Los Angeles Chargers": ["LAC"],
+    "Los Angeles Rams": ["LAR", "LA"],
+    "Las Vegas Raiders": ["LV", "LVR"],
+    "Miami Dolphins": ["MIA"],
+    "Minnesota Vikings": ["MIN"],
+    "New England Patriots": ["NE", "NWE"],
+    "New Orleans Saints": ["NO", "NOR"],
+    "New York Giants": ["NYG"],
+    "New York Jets": ["NYJ"],
+    "Philadelphia Eagles": ["PHI"],
+    "Pittsburgh Steelers": ["PIT"],
+    "Seattle Seahawks": ["SEA"],
+    "San Francisco 49ers": ["SF", "SFO"],
+    "Tampa Bay Buccaneers": ["TB", "TAM"],
+    "Tennessee Titans": ["TEN"],
+    "Washington Commanders": ["WSH", "WAS"],
+}
 
 
 def parse_depth_chart(csv_path: str) -> Dict[str, Dict[str, List[str]]]:
@@ -24,7 +71,28 @@ def parse_depth_chart(csv_path: str) -> Dict[str, Dict[str, List[str]]]:
             ...
         }
     """
-    depth_chart = {}
+    return parse_roster(csv_path).to_dict()
+
+
+# (ECR column, player column) for each position in a depth chart row
+POSITION_COLUMNS = (('QB', 0, 1), ('RB', 2, 3), ('WR', 4, 5), ('TE', 6, 7))
+
+
+def parse_roster(csv_path: str) -> Roster:
+    """
+    Parse FantasyPros depth chart CSV into a compact Roster.
+    
+    Unlike parse_depth_chart() this keeps each player's expert consensus
+    rank (the ECR column before every position's player column).
+    
+    Args:
+        csv_path: Path to the depth chart CSV file
+        
+    Returns:
+        Roster of every team; use roster.as_depth_chart() for the nested dict view
+    """
+    teams = []
+    players = []
     current_team = None
     
     with open(csv_path, 'r', encoding='utf-8') as f:
@@ -40,41 +108,22 @@ def parse_depth_chart(csv_path: str) -> Dict[str, Dict[str, List[str]]]:
                 team_name = row[0].strip().strip('"')
                 if team_name and not team_name.startswith('ECR'):
                     current_team = team_name
-                    depth_chart[current_team] = {
-                        'QB': [],
-                        'RB': [],
-                        'WR': [],
-                        'TE': []
-                    }
+                    teams.append(current_team)
                 continue
             
             # Skip header rows
             if 'Quarterbacks' in str(row) or 'ECR' in str(row[0]):
                 continue
             
-            # Parse player data rows
+            # Parse player data rows: an ECR column then a player column per position
             if current_team and len(row) >= 8:
-                # QB (columns 1)
-                qb_name = row[1].strip().strip('"')
-                if qb_name and qb_name != '-' and not qb_name.startswith('ECR'):
-                    depth_chart[current_team]['QB'].append(qb_name)
-                
-                # RB (column 3)
-                rb_name = row[3].strip().strip('"')
-                if rb_name and rb_name != '-' and not rb_name.startswith('ECR'):
-                    depth_chart[current_team]['RB'].append(rb_name)
-                
-                # WR (column 5)
-                wr_name = row[5].strip().strip('"')
-                if wr_name and wr_name != '-' and not wr_name.startswith('ECR'):
-                    depth_chart[current_team]['WR'].append(wr_name)
-                
-                # TE (column 7)
-                te_name = row[7].strip().strip('"')
-                if te_name and te_name != '-' and not te_name.startswith('ECR'):
-                    depth_chart[current_team]['TE'].append(te_name)
-    
-    return depth_chart
+                for position, ecr_column, name_column in POSITION_COLUMNS:
+                    name = row[name_column].strip().strip('"')
+                    if name and name != '-' and not name.startswith('ECR'):
+                        ecr = row[ecr_column].strip().strip('"')
+                        players.append((current_team, position, name, int(ecr) if ecr.isdigit() else None))
+    
+    return Roster(players, teams)
 
 
 def normalize_player_name(name: str) -> str:
@@ -93,26 +142,216 @@ def normalize_player_name(name: str) -> str:
     return ' '.join(name.split()).lower()
 
 
-def get_player_team(player_name: str, depth_chart: Dict[str, Dict[str, List[str]]]) -> Optional[str]:
+def normalize_team_name(name: str) -> str:
+    """
+    Normalize team name or abbreviation for alias lookups.
+    
+    Args:
+        name: Team name, nickname, city or abbreviation
+        
+    Returns:
+        Lowercased name with punctuation and extra whitespace removed
+    """
+    return ' '.join(name.replace('.', '').replace('@', ' ').split()).lower()
+
+
+# Location of a player in the depth chart (team, position, rank and ECR)
+DepthChartEntry = PlayerRecord
+
+
+def _game_field(game: object, field: str) -> str:
+    """Read a field from a GameData object or a game dict."""
+    if isinstance(game, dict):
+        return game.get(field) or ""
+    return getattr(game, field, "") or ""
+
+
+class DepthChartIndex:
+    """
+    Hash-based lookup structure built once from a Roster (or parse_depth_chart() output).
+    
+    Player names are normalized a single time at build time and map to
+    player ids in the roster's arrays, so team/rank
+    lookups and team validation are O(1) per query instead of a full scan
+    of every team, position and player. Names that don't match exactly can
+    be resolved with fuzzy_match(), backed by a trigram index built on
+    first use.
+    """
+    
+    def __init__(self, depth_chart: Union[Dict[str, Dict[str, List[str]]], Roster]):
+        if isinstance(depth_chart, Roster):
+            self.roster = depth_chart
+            self.depth_chart = depth_chart.as_depth_chart()
+        else:
+            self.roster = depth_chart.roster if isinstance(depth_chart, DepthChartView) else Roster.from_depth_chart(depth_chart)
+            self.depth_chart = depth_chart
+        self.players: Dict[str, int] = {}  # Normalized name -> roster player id
+        self.team_aliases: Dict[str, str] = {}
+        self.city_teams: Dict[str, List[str]] = {}
+        self._matcher: Optional[PlayerNameMatcher] = None
+        
+        for player_id, player in enumerate(self.roster.names):
+            # First occurrence wins, matching the original scan order
+            self.players.setdefault(sys.intern(normalize_player_name(player)), player_id)
+        
+        self._build_team_aliases()
+    
+    def _build_team_aliases(self) -> None:
+        """Map full names, nicknames, unambiguous cities and abbreviations to teams."""
+        for team in self.depth_chart:
+            city = normalize_team_name(team.rsplit(' ', 1)[0])
+            self.city_teams.setdefault(city, []).append(team)
+        
+        for team in self.depth_chart:
+            city, _, nickname = team.rpartition(' ')
+            self.team_aliases[normalize_team_name(team)] = team
+            self.team_aliases[normalize_team_name(nickname)] = team
+            # "New York" and "Los Angeles" are shared by two teams
+            if len(self.city_teams.get(normalize_team_name(city), [])) == 1:
+                self.team_aliases[normalize_team_name(city)] = team
+            for abbreviation in TEAM_ABBREVIATIONS.get(team, []):
+                self.team_aliases.setdefault(normalize_team_name(abbreviation), team)
+    
+    def __len__(self) -> int:
+        return len(self.players)
+    
+    def __contains__(self, player_name: str) -> bool:
+        return normalize_player_name(player_name) in self.players
+    
+    def lookup(self, player_name: str) -> Optional[PlayerRecord]:
+        """Return the player's record (team, position, rank, ECR), if rostered."""
+        player_id = self.players.get(normalize_player_name(player_name))
+        return self.roster.record(player_id) if player_id is not None else None
+    
+    def fuzzy_match(self, player_name: str, claimed_team: str = "",
+                    min_score: float = FUZZY_MATCH_MIN_SCORE) -> Optional[PlayerMatch]:
+        """
+        Find the rostered player a possibly misspelled name refers to.
+        
+        Args:
+            player_name: Name as written (e.g. "DJ Moore", "Kenneth Walker")
+            claimed_team: Team given with the name (any alias); prefers that team's players on near-ties
+            min_score: Lowest confidence to accept (0-1)
+            
+        Returns:
+            PlayerMatch with the depth chart spelling, team and confidence, or None
+        """
+        if self._matcher is None:
+            self._matcher = PlayerNameMatcher((player.name, player.team) for player in self.roster)
+        team = self.resolve_team(claimed_team) if claimed_team else None
+        return self._matcher.match(player_name, team, min_score)
+    
+    def team_of(self, player_name: str) -> Optional[str]:
+        """Return the player's current team, or None if not in the depth chart."""
+        entry = self.lookup(player_name)
+        return entry.team if entry else None
+    
+    def rank_of(self, player_name: str) -> Optional[int]:
+        """Return the player's depth rank at their position (1 = starter)."""
+        entry = self.lookup(player_name)
+        return entry.rank if entry else None
+    
+    def resolve_team(self, team_name: str) -> Optional[str]:
+        """Resolve a full name, nickname, city or abbreviation to a depth chart team."""
+        return self.team_aliases.get(normalize_team_name(team_name))
+    
+    def resolve_game_team(self, short_name: str, abbreviation: str = "") -> List[str]:
+        """
+        Resolve a team as shown on the ESPN schedule to depth chart team(s).
+        
+        ESPN lists teams by city ("Buffalo", "New York"), so the team code from
+        the team link is tried first. A shared city without a code resolves to
+        every team in that city rather than guessing one.
+        
+        Args:
+            short_name: Team name from the schedule (e.g. "Buffalo", "New York")
+            abbreviation: ESPN team code if known (e.g. "NYG")
+            
+        Returns:
+            List of depth chart team names (empty if unknown)
+        """
+        for candidate in (abbreviation, short_name):
+            team = self.resolve_team(candidate) if candidate else None
+            if team:
+                return [team]
+        return list(self.city_teams.get(normalize_team_name(short_name), []))
+    
+    def teams_for_games(self, games: List[object]) -> List[str]:
+        """
+        Return the sorted depth chart teams playing in the given games.
+        
+        Args:
+            games: GameData objects or dicts with away_team/home_team keys
+                (and optionally away_abbrev/home_abbrev)
+            
+        Returns:
+            Sorted list of depth chart team names
+        """
+        teams = set()
+        for game in games:
+            for side in ("away", "home"):
+                teams.update(self.resolve_game_team(
+                    _game_field(game, f"{side}_team"), _game_field(game, f"{side}_abbrev")
+                ))
+        return sorted(teams)
+    
+    def validate(self, player_name: str, claimed_team: str) -> bool:
+        """Return True if the player is on the claimed team (aliases allowed)."""
+        actual_team = self.team_of(player_name)
+        if actual_team is None:
+            return False
+        return self.resolve_team(claimed_team) == actual_team
+
+
+DepthChartLike = Union[Dict[str, Dict[str, List[str]]], Roster, DepthChartIndex]
+
+# Most recently built index, reused while callers keep passing the same dict
+_index_cache: Optional[DepthChartIndex] = None
+
+
+def get_depth_chart_index(depth_chart: DepthChartLike) -> DepthChartIndex:
+    """
+    Return a DepthChartIndex for the given depth chart.
+    
+    The index is rebuilt only when a different depth chart object is passed,
+    so repeated module-level lookups against the same chart stay O(1).
+    Indexes are built from a snapshot; mutate the dict and pass a new one
+    (or build a new DepthChartIndex) if the roster changes.
+    """
+    global _index_cache
+    if isinstance(depth_chart, DepthChartIndex):
+        return depth_chart
+    if _index_cache is None or (_index_cache.depth_chart is not depth_chart and _index_cache.roster is not depth_chart):
+        _index_cache = DepthChartIndex(depth_chart)
+    return _index_cache
+
+
+def get_player_team(player_name: str, depth_chart: DepthChartLike) -> Optional[str]:
     """
     Look up a player's current team from depth chart.
     
     Args:
         player_name: Name of the player to look up
-        depth_chart: Parsed depth chart data
+        depth_chart: Parsed depth chart data (or a prebuilt DepthChartIndex)
         
     Returns:
         Team name if found, None otherwise
     """
-    normalized_search = normalize_player_name(player_name)
-    
-    for team, positions in depth_chart.items():
-        for position, players in positions.items():
-            for player in players:
-                if normalize_player_name(player) == normalized_search:
-                    return team
+    return get_depth_chart_index(depth_chart).team_of(player_name)
+
+
+def get_player_rank(player_name: str, depth_chart: DepthChartLike) -> Optional[int]:
+    """
+    Look up a player's depth rank at their position.
     
-    return None
+    Args:
+        player_name: Name of the player to look up
+        depth_chart: Parsed depth chart data (or a prebuilt DepthChartIndex)
+        
+    Returns:
+        1-based depth rank if found, None otherwise
+    """
+    return get_depth_chart_index(depth_chart).rank_of(player_name)
 
 
 def get_team_players(team_name: str, position: str, depth_chart: Dict[str, Dict[str, List[str]]]) -> List[str]:
@@ -132,24 +371,19 @@ def get_team_players(team_name: str, position: str, depth_chart: Dict[str, Dict[
     return []
 
 
-def validate_player_team(player_name: str, claimed_team: str, depth_chart: Dict[str, Dict[str, List[str]]]) -> bool:
+def validate_player_team(player_name: str, claimed_team: str, depth_chart: DepthChartLike) -> bool:
     """
     Verify if a player is actually on the claimed team.
     
     Args:
         player_name: Name of the player
-        claimed_team: Team the player is claimed to be on
-        depth_chart: Parsed depth chart data
+        claimed_team: Team the player is claimed to be on (full name, nickname or abbreviation)
+        depth_chart: Parsed depth chart data (or a prebuilt DepthChartIndex)
         
     Returns:
         True if player is on the claimed team, False otherwise
     """
-    actual_team = get_player_team(player_name, depth_chart)
-    if actual_team is None:
-        return False
-    
-    # Normalize team names for comparison
-    return normalize_player_name(actual_team) == normalize_player_name(claimed_team)
+    return get_depth_chart_index(depth_chart).validate(player_name, claimed_team)
 
 
 def extract_team_from_game(game_str: str) -> Tuple[str, str]:
@@ -190,32 +424,35 @@ def find_team_in_depth_chart(team_partial: str, depth_chart: Dict[str, Dict[str,
     return None
 
 
-def format_depth_chart_for_prompt(depth_chart: Dict[str, Dict[str, List[str]]], games: List[Dict]) -> str:
+def format_depth_chart_for_prompt(depth_chart: DepthChartLike, games: List[object]) -> str:
     """
     Format depth chart data for specific games into a prompt-friendly string.
     
     Args:
-        depth_chart: Parsed depth chart data
-        games: List of game dictionaries with 'away_team' and 'home_team' keys
+        depth_chart: Parsed depth chart data (or a DepthChartIndex)
+        games: GameData objects or game dictionaries with 'away_team' and 'home_team' keys
         
     Returns:
         Formatted string with depth chart data for relevant teams
     """
-    output_lines = []
-    teams_included = set()
+    index = get_depth_chart_index(depth_chart)
+    return format_teams_for_prompt(index.depth_chart, index.teams_for_games(games))
+
+
+def format_teams_for_prompt(depth_chart: Dict[str, Dict[str, List[str]]], teams: List[str]) -> str:
+    """
+    Format depth chart data for the given teams into a prompt-friendly string.
     
-    # Collect all teams from games
-    for game in games:
-        away_team = find_team_in_depth_chart(game.get('away_team', ''), depth_chart)
-        home_team = find_team_in_depth_chart(game.get('home_team', ''), depth_chart)
+    Args:
+        depth_chart: Parsed depth chart data
+        teams: Depth chart team names to include
         
-        if away_team:
-            teams_included.add(away_team)
-        if home_team:
-            teams_included.add(home_team)
+    Returns:
+        Formatted string with depth chart data for the teams
+    """
+    output_lines = []
     
-    # Format depth chart for included teams
-    for team in sorted(teams_included):
+    for team in sorted(teams):
         if team in depth_chart:
             output_lines.append(f"\n{team.upper()}")
             
@@ -267,4 +504,149 @@ def format_all_depth_charts_compact(depth_chart: Dict[str, Dict[str, List[str]]]
         if positions['TE']:
             output_lines.append(f"  TE: {', '.join(positions['TE'][:2])}")
     
-    return '\n'.join(output_lines)
\ No newline at end of file
+    return '\n'.join(output_lines)
+
+
+# Distinct team sets kept by DepthChartCache.get_for_games()
+MAX_SCOPED_DEPTH_CHARTS = 64
+
+
+class DepthChartCache:
+    """
+    Process-wide cache of the parsed depth chart and its derived forms.
+    
+    The CSV is re-parsed only when the file's mtime or size changes, so
+    prompt previews and pick validation never touch the CSV on a warm cache.
+    The chart is held as a compact Roster; get() returns a read-only
+    {team: {position: [names]}} view of it.
+    """
+    
+    def __init__(self, csv_path: Union[str, Path] = DEFAULT_DEPTH_CHART_PATH):
+        self.csv_path = Path(csv_path)
+        self.version = 0  # Bumped every time the chart is (re)loaded
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._signature: Optional[Tuple[int, int]] = None
+        self._roster: Optional[Roster] = None
+        self._depth_chart: Optional[DepthChartView] = None
+        self._index: Optional[DepthChartIndex] = None
+        self._compact: Optional[str] = None
+        self._scoped: Dict[Tuple[str, ...], str] = {}  # Team set -> formatted text
+    
+    def _file_signature(self) -> Tuple[int, int]:
+        """Return (mtime_ns, size) for the CSV; raises FileNotFoundError if missing."""
+        stat = os.stat(self.csv_path)
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    def _refresh(self) -> None:
+        """Reload the chart if the file changed since the last load. Caller holds the lock."""
+        signature = self._file_signature()
+        if signature == self._signature and self._depth_chart is not None:
+            self.hits += 1
+            return
+        
+        self.misses += 1
+        roster = parse_roster(str(self.csv_path))
+        self._roster = roster
+        self._depth_chart = roster.as_depth_chart()
+        self._index = DepthChartIndex(roster)
+        self._compact = None
+        self._scoped = {}
+        self._signature = signature
+        self.version += 1
+    
+    def get(self) -> DepthChartView:
+        """Return the parsed depth chart, reloading it if the CSV changed."""
+        with self._lock:
+            self._refresh()
+            return self._depth_chart
+    
+    def get_roster(self) -> Roster:
+        """Return the current Roster (with ECR and depth rank per player)."""
+        with self._lock:
+            self._refresh()
+            return self._roster
+    
+    def get_index(self) -> DepthChartIndex:
+        """Return the DepthChartIndex for the current depth chart."""
+        with self._lock:
+            self._refresh()
+            return self._index
+    
+    def get_compact(self) -> str:
+        """Return format_all_depth_charts_compact() output for the current chart."""
+        with self._lock:
+            self._refresh()
+            if self._compact is None:
+                self._compact = format_all_depth_charts_compact(self._depth_chart)
+            return self._compact
+    
+    def current_version(self) -> Optional[int]:
+        """Return the version of the chart on disk (reloading if changed), or None if missing."""
+        with self._lock:
+            try:
+                self._refresh()
+            except FileNotFoundError:
+                return None
+            return self.version
+    
+    def get_for_games(self, games: List[object]) -> Tuple[str, List[str]]:
+        """
+        Return format_depth_chart_for_prompt() output for the teams in the games.
+        
+        Args:
+            games: GameData objects or game dicts
+            
+        Returns:
+            Tuple of (formatted text, depth chart teams included)
+        """
+        with self._lock:
+            self._refresh()
+            teams = self._index.teams_for_games(games)
+            key = tuple(teams)
+            text = self._scoped.get(key)
+            if text is None:
+                if len(self._scoped) >= MAX_SCOPED_DEPTH_CHARTS:
+                    self._scoped.clear()
+                text = format_teams_for_prompt(self._depth_chart, teams)
+                self._scoped[key] = text
+            return text, teams
+    
+    def invalidate(self) -> None:
+        """Drop the cached chart so the next access re-parses the CSV."""
+        with self._lock:
+            self._signature = None
+            self._roster = None
+            self._depth_chart = None
+            self._index = None
+            self._compact = None
+            self._scoped = {}
+    
+    def stats(self) -> Dict[str, object]:
+        """Return cache counters for monitoring."""
+        return {
+            "path": str(self.csv_path),
+            "loaded": self._depth_chart is not None,
+            "players": len(self._roster) if self._roster is not None else 0,
+            "version": self.version,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# Global depth chart cache shared by the prompt builder and pick validation
+depth_chart_cache = DepthChartCache()
+
+
+def load_depth_chart() -> DepthChartView:
+    """
+    Load the default depth chart through the process-wide cache.
+    
+    Returns:
+        Parsed depth chart data (a read-only view shared between callers)
+        
+    Raises:
+        FileNotFoundError: If the depth chart CSV doesn't exist.
+    """
+    return depth_chart_cache.get()
@@ -0,0 +1,170 @@
+"""ESPN scoreboard JSON API client, an alternative to scraping the schedule page."""
+
+import argparse
+import json
+import re
+import statistics
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from .espn_scraper import ESPN_REQUEST_HEADERS, ESPN_TIMEZONE, GameData, _http_get, parse_espn_schedule_html
+
+# Structured scoreboard for one week: every game with kickoff time, venue and status
+ESPN_SCOREBOARD_URL = "https://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard"
+
+
+def scoreboard_url(espn_url: str, base_url: str = ESPN_SCOREBOARD_URL) -> str:
+    """
+    Build the scoreboard API URL for the week of an ESPN schedule page URL.
+
+    Args:
+        espn_url: ESPN NFL schedule URL (e.g., https://www.espn.com/nfl/schedule/_/week/13/year/2025/seasontype/2)
+        base_url: Scoreboard endpoint
+
+    Returns:
+        Scoreboard URL with dates (season year), seasontype and week parameters
+
+    Raises:
+        ValueError: If the schedule URL has no week or year.
+    """
+    week_match = re.search(r'/week/(\d+)', espn_url)
+    year_match = re.search(r'/year/(\d+)', espn_url)
+    if not week_match or not year_match:
+        raise ValueError(f"Can't find week and year in ESPN URL: {espn_url}")
+    season_type_match = re.search(r'/seasontype/(\d+)', espn_url)
+    season_type = season_type_match.group(1) if season_type_match else "2"
+    return f"{base_url}?dates={year_match.group(1)}&seasontype={season_type}&week={week_match.group(1)}"
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an ESPN UTC timestamp ("2025-11-30T18:00Z") into an aware datetime."""
+    kickoff = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if kickoff.tzinfo is None:
+        kickoff = kickoff.replace(tzinfo=timezone.utc)
+    return kickoff
+
+
+def parse_scoreboard_json(content: bytes, api_url: str = "") -> Tuple[List[GameData], Dict[str, Any]]:
+    """
+    Parse an already-fetched ESPN scoreboard response.
+
+    Team names are the team locations (e.g. "Green Bay", "New York"), the same
+    text the schedule page shows, so game IDs match the HTML scraper's.
+
+    Args:
+        content: Raw scoreboard JSON
+        api_url: URL the response was fetched from (unused; kept for parity with
+            parse_espn_schedule_html())
+
+    Returns:
+        Tuple of (list of GameData objects, metadata dict with week/year info)
+
+    Raises:
+        ValueError: If the response isn't a scoreboard document.
+    """
+    try:
+        data = json.loads(content)
+        events = data["events"]
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Not an ESPN scoreboard response: {e}")
+
+    games = []
+    for event in events:
+        competition = event["competitions"][0]
+        teams = {competitor["homeAway"]: competitor["team"] for competitor in competition["competitors"]}
+        if "away" not in teams or "home" not in teams:
+            continue
+
+        kickoff = _parse_timestamp(competition.get("date") or event["date"])
+        local_kickoff = kickoff.astimezone(ESPN_TIMEZONE)  # Displayed in Eastern time, like the schedule page
+        # timeValid is false while the NFL hasn't scheduled the kickoff (e.g. late-season flex games)
+        if competition.get("timeValid", True):
+            game_time = local_kickoff.strftime("%I:%M %p").lstrip("0")
+        else:
+            game_time = "TBD"
+            kickoff = None  # The date is a placeholder too
+
+        status = (competition.get("status") or event.get("status") or {}).get("type", {})
+        games.append(GameData(
+            teams["away"].get("location", ""), teams["home"].get("location", ""), game_time,
+            status.get("description", "Scheduled"), local_kickoff.strftime("%A"),
+            teams["away"].get("abbreviation", ""), teams["home"].get("abbreviation", ""),
+            kickoff=kickoff, venue=(competition.get("venue") or {}).get("fullName", "")
+        ))
+
+    metadata = {
+        "week": (data.get("week") or {}).get("number"),
+        "year": (data.get("season") or {}).get("year"),
+        "games_found": len(games),
+        "scraped_at": datetime.now().isoformat()
+    }
+
+    return games, metadata
+
+
+def compare_sources(espn_url: str, fetcher: Callable[[str, Dict[str, str]], httpx.Response] = _http_get,
+                    repeat: int = 5, base_url: str = ESPN_SCOREBOARD_URL) -> List[Dict[str, Any]]:
+    """
+    Time fetching and parsing one week through the schedule page and the scoreboard API.
+
+    Args:
+        espn_url: ESPN NFL schedule URL
+        fetcher: GET function (url, headers) -> response; defaults to the shared client
+        repeat: Timed fetches per source
+        base_url: Scoreboard endpoint
+
+    Returns:
+        One row per source with games found, response size and median/best
+        fetch, parse and total time (ms)
+    """
+    sources = [
+        ("html", espn_url, parse_espn_schedule_html),
+        ("json", scoreboard_url(espn_url, base_url), parse_scoreboard_json),
+    ]
+    results = []
+    for source, url, parse in sources:
+        fetch_ms, parse_ms = [], []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            response = fetcher(url, ESPN_REQUEST_HEADERS)
+            response.raise_for_status()
+            fetched = time.perf_counter()
+            games, _ = parse(response.content, url)
+            fetch_ms.append((fetched - started) * 1000)
+            parse_ms.append((time.perf_counter() - fetched) * 1000)
+
+        totals = [fetch + parse for fetch, parse in zip(fetch_ms, parse_ms)]
+        results.append({
+            "source": source,
+            "url": url,
+            "bytes": len(response.content),
+            "games": len(games),
+            "fetch_ms": round(statistics.median(fetch_ms), 3),
+            "parse_ms": round(statistics.median(parse_ms), 3),
+            "total_ms": round(statistics.median(totals), 3),
+            "best_total_ms": round(min(totals), 3),
+        })
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Compare ESPN schedule page and scoreboard API latency")
+    parser.add_argument("url", nargs="?", help="ESPN schedule URL (default: ESPN_GAME_DATA_LINK)")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    if args.url is None:
+        from .config import settings
+        args.url = settings.espn_game_data_link
+
+    print(f"{'source':<7} {'games':>5} {'KiB':>7} {'fetch ms':>9} {'parse ms':>9} {'total ms':>9} {'best ms':>8}")
+    for row in compare_sources(args.url, repeat=args.repeat):
+        print(f"{row['source']:<7} {row['games']:>5} {row['bytes'] / 1024:>7.1f} {row['fetch_ms']:>9} "
+              f"{row['parse_ms']:>9} {row['total_ms']:>9} {row['best_total_ms']:>8}")
+
+
+if __name__ == "__main__":
+    main()
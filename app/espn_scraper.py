@@ -1,19 +1,67 @@
 """ESPN web scraper for fetching live NFL game data."""
 
-import requests
-from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
-from datetime import datetime
+import asyncio
+import importlib.util
+from bisect import bisect_left
+from collections import OrderedDict
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import TYPE_CHECKING, Awaitable, Callable, Iterable, List, Dict, Optional, Tuple
+from datetime import date, datetime, time as dtime, timezone
+from zoneinfo import ZoneInfo
 import re
+import threading
+import time
+
+from .schedule_parsers import ScheduleRow, get_parser
+
+if TYPE_CHECKING:
+    import httpx  # Imported with the first HTTP client, off the app's startup path
+
+# Browser-like headers; ESPN serves a reduced page to unknown clients
+ESPN_REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+ESPN_REQUEST_TIMEOUT = 10
+
+# ESPN shows kickoff times and dates in Eastern time
+ESPN_TIMEZONE = ZoneInfo("America/New_York")
+
+# Time slot categories; "tbd" is for games without a kickoff time yet
+TIME_SLOTS = ('early', 'afternoon', 'night', 'monday', 'thursday', 'tbd')
+
+# Kickoff time as displayed ("1:00 PM", "8:15 p.m.")
+KICKOFF_TIME_PATTERN = re.compile(r'(\d{1,2}):(\d{2})\s*([ap])\.?\s*m\b', re.IGNORECASE)
+
+# Where schedules come from: the schedule page ("html") or the scoreboard API ("json", see espn_api)
+SCHEDULE_SOURCES = ("html", "json")
+
+# Connection pool shared by all ESPN requests
+ESPN_MAX_CONNECTIONS = 10
+ESPN_MAX_KEEPALIVE_CONNECTIONS = 5
+ESPN_MAX_CONCURRENT_REQUESTS = 4
+
+# HTTP/2 needs the optional 'h2' package; fall back to HTTP/1.1 keep-alive without it
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
 
 
 class GameData:
     """Data structure for NFL game information with time slot categorization."""
-    def __init__(self, away_team: str, home_team: str, time: str, status: str = "Scheduled", day_of_week: str = ""):
+    
+    # No per-instance __dict__; a season of games stays small
+    __slots__ = ("away_team", "home_team", "away_abbrev", "home_abbrev", "time", "status", "kickoff", "venue",
+                 "matchup", "day_of_week", "time_slot", "game_id")
+    
+    def __init__(self, away_team: str, home_team: str, time: str, status: str = "Scheduled", day_of_week: str = "",
+                 away_abbrev: str = "", home_abbrev: str = "", kickoff: Optional[datetime] = None, venue: str = ""):
         self.away_team = away_team
         self.home_team = home_team
+        self.away_abbrev = away_abbrev  # ESPN team code (e.g. "NYG"), disambiguates shared cities
+        self.home_abbrev = home_abbrev
         self.time = time
         self.status = status
+        self.kickoff = kickoff  # Timezone-aware kickoff (UTC), None if the date or time is unknown
+        self.venue = venue
         self.matchup = f"{away_team} @ {home_team}"
         self.day_of_week = day_of_week
         self.time_slot = self._categorize_time_slot()
@@ -21,12 +69,12 @@ class GameData:
     
     def _categorize_time_slot(self) -> str:
         """
-        Categorize game into time slot based on time string and day.
+        Categorize game into time slot based on kickoff time and day.
         
         Returns:
-            One of: 'early', 'afternoon', 'night', 'monday', 'thursday'
+            One of: 'early', 'afternoon', 'night', 'monday', 'thursday', or
+            'tbd' if the kickoff time isn't known
         """
-        time_lower = self.time.lower()
         day_lower = self.day_of_week.lower()
         
         # Check for specific days first
@@ -35,43 +83,29 @@ class GameData:
         elif 'thursday' in day_lower or 'thu' in day_lower:
             return 'thursday'
         
-        # Parse time for Sunday games
-        # Extract hour from time string (e.g., "1:00 PM", "4:05 PM", "8:20 PM")
-        time_match = re.search(r'(\d+):(\d+)', self.time)
-        if time_match:
-            hour = int(time_match.group(1))
-            
-            # Determine if PM (most NFL games are PM)
-            is_pm = 'pm' in time_lower or 'p.m.' in time_lower
-            
-            # Convert to 24-hour for easier comparison
-            if is_pm and hour != 12:
-                hour += 12
-            elif not is_pm and hour == 12:
-                hour = 0
-            
-            # Categorize by time
-            if 13 <= hour < 16:  # 1:00 PM - 3:59 PM
-                return 'early'
-            elif 16 <= hour < 20:  # 4:00 PM - 7:59 PM
-                return 'afternoon'
-            elif hour >= 20:  # 8:00 PM and later
-                return 'night'
-        
-        # Default to early if can't determine
-        return 'early'
+        # Sunday (and other day) games by Eastern kickoff time
+        kickoff_time = parse_kickoff_time(self.time)
+        if kickoff_time is None:
+            return 'tbd'
+        if kickoff_time.hour < 16:  # Through 3:59 PM
+            return 'early'
+        elif kickoff_time.hour < 20:  # 4:00 PM - 7:59 PM
+            return 'afternoon'
+        return 'night'  # 8:00 PM and later
     
     def _generate_game_id(self) -> str:
         """
         Generate unique game ID.
         
         Returns:
-            Format: {away_team}_{home_team}_{time_slot}
+            Format: {away_team}_{home_team}_{time_slot}, with 'early' for
+            'tbd' games as before that slot existed, so saved selections match
         """
         # Clean team names (remove spaces, special chars)
         away_clean = re.sub(r'[^A-Za-z0-9]', '', self.away_team)
         home_clean = re.sub(r'[^A-Za-z0-9]', '', self.home_team)
-        return f"{away_clean}_{home_clean}_{self.time_slot}"
+        slot = 'early' if self.time_slot == 'tbd' else self.time_slot
+        return f"{away_clean}_{home_clean}_{slot}"
     
     def to_dict(self) -> Dict[str, str]:
         """Convert to dictionary for JSON serialization."""
@@ -79,18 +113,211 @@ class GameData:
             "away_team": self.away_team,
             "home_team": self.home_team,
             "time": self.time,
+            "kickoff": self.kickoff.isoformat() if self.kickoff else None,
+            "venue": self.venue,
             "status": self.status,
             "matchup": self.matchup,
             "day_of_week": self.day_of_week,
+            "away_abbrev": self.away_abbrev,
+            "home_abbrev": self.home_abbrev,
             "time_slot": self.time_slot,
             "game_id": self.game_id
         }
 
 
+@lru_cache(maxsize=256)
+def parse_kickoff_time(text: str) -> Optional[dtime]:
+    """
+    Parse a displayed kickoff time ("1:00 PM") into a time of day.
+    
+    Returns:
+        Time of day in Eastern time, or None for "TBD" and other unparseable text
+    """
+    match = KICKOFF_TIME_PATTERN.search(text)
+    if not match:
+        return None
+    hour, minute = int(match.group(1)) % 12, int(match.group(2))
+    if match.group(3).lower() == 'p':
+        hour += 12
+    if hour > 23 or minute > 59:
+        return None
+    return dtime(hour, minute)
+
+
+def kickoff_datetime(game_date: Optional[date], time_text: str) -> Optional[datetime]:
+    """
+    Combine a schedule date and displayed Eastern kickoff time into a UTC datetime.
+    
+    Returns:
+        Timezone-aware kickoff, or None if the date or time is unknown
+    """
+    kickoff_time = parse_kickoff_time(time_text)
+    if game_date is None or kickoff_time is None:
+        return None
+    return datetime.combine(game_date, kickoff_time, tzinfo=ESPN_TIMEZONE).astimezone(timezone.utc)
+
+
+class Schedule(Sequence):
+    """
+    Immutable list of games sorted by kickoff, for range queries and slot grouping.
+    
+    Games without a kickoff keep their relative order after the timed
+    games. Kickoff range queries bisect the sorted kickoffs (O(log n)), and
+    games are grouped by time slot once, when the schedule is built.
+    """
+    
+    def __init__(self, games: Iterable[GameData] = ()):
+        games = list(games)
+        timed = sorted((game for game in games if game.kickoff is not None), key=lambda game: game.kickoff)
+        self._games: Tuple[GameData, ...] = tuple(timed + [game for game in games if game.kickoff is None])
+        self._kickoffs: List[datetime] = [game.kickoff for game in timed]
+        self._slots: Dict[str, List[GameData]] = {slot: [] for slot in TIME_SLOTS}
+        for game in self._games:
+            self._slots.setdefault(game.time_slot, []).append(game)
+    
+    def __getitem__(self, index):
+        return self._games[index]
+    
+    def __len__(self) -> int:
+        return len(self._games)
+    
+    def __repr__(self) -> str:
+        return f"Schedule({len(self._games)} games)"
+    
+    def kicking_off(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> List[GameData]:
+        """
+        Games kicking off in [start, end), in kickoff order.
+        
+        Args:
+            start: Earliest kickoff (timezone-aware), or None for no lower bound
+            end: Kickoff upper bound, exclusive (timezone-aware), or None for no upper bound
+        
+        Returns:
+            Games with a known kickoff in the range
+        """
+        low = bisect_left(self._kickoffs, start) if start is not None else 0
+        high = bisect_left(self._kickoffs, end) if end is not None else len(self._kickoffs)
+        return list(self._games[low:high]) if low < high else []
+    
+    def remaining(self, now: Optional[datetime] = None) -> List[GameData]:
+        """Games that haven't kicked off yet (at or after now), plus any without a kickoff time."""
+        upcoming = self.kicking_off(start=now or datetime.now(timezone.utc))
+        return upcoming + list(self._games[len(self._kickoffs):])
+    
+    def by_slot(self) -> Dict[str, List[GameData]]:
+        """Games grouped by time slot (computed once; treat as read-only)."""
+        return self._slots
+
+
+def _client_options() -> Dict[str, any]:
+    """Shared httpx client configuration for ESPN requests."""
+    import httpx
+    
+    return {
+        "headers": ESPN_REQUEST_HEADERS,
+        "timeout": ESPN_REQUEST_TIMEOUT,
+        "follow_redirects": True,
+        "http2": HTTP2_AVAILABLE,
+        "limits": httpx.Limits(
+            max_connections=ESPN_MAX_CONNECTIONS,
+            max_keepalive_connections=ESPN_MAX_KEEPALIVE_CONNECTIONS
+        ),
+    }
+
+
+_sync_client: Optional["httpx.Client"] = None
+_sync_client_lock = threading.Lock()
+
+# The async client and its semaphore are bound to the event loop that created them
+_async_client: Optional["httpx.AsyncClient"] = None
+_async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_async_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def get_http_client() -> "httpx.Client":
+    """Return the shared, connection-pooled sync client (thread-safe)."""
+    global _sync_client
+    with _sync_client_lock:
+        if _sync_client is None:
+            import httpx
+            
+            _sync_client = httpx.Client(**_client_options())
+        return _sync_client
+
+
+def get_async_http_client() -> "httpx.AsyncClient":
+    """
+    Return the shared, connection-pooled async client for the running event loop.
+    
+    A new client is created if called from a different loop (e.g. a script
+    using asyncio.run() after the previous loop closed).
+    """
+    global _async_client, _async_client_loop, _async_semaphore
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client_loop is not loop:
+        import httpx
+        
+        _async_client = httpx.AsyncClient(**_client_options())
+        _async_client_loop = loop
+        _async_semaphore = asyncio.Semaphore(ESPN_MAX_CONCURRENT_REQUESTS)
+    return _async_client
+
+
+async def close_http_clients() -> None:
+    """Close the shared HTTP clients (called on application shutdown)."""
+    global _sync_client, _async_client, _async_client_loop, _async_semaphore
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = _async_client_loop = _async_semaphore = None
+    with _sync_client_lock:
+        if _sync_client is not None:
+            _sync_client.close()
+            _sync_client = None
+
+
+def _http_get(url: str, headers: Dict[str, str]) -> "httpx.Response":
+    """Blocking GET on the shared sync client."""
+    return get_http_client().get(url, headers=headers)
+
+
+async def _http_get_async(url: str, headers: Dict[str, str]) -> "httpx.Response":
+    """Non-blocking GET on the shared async client, bounded by ESPN_MAX_CONCURRENT_REQUESTS."""
+    client = get_async_http_client()
+    async with _async_semaphore:
+        return await client.get(url, headers=headers)
+
+
+async def scrape_espn_schedule_async(espn_url: str) -> tuple[List[GameData], Dict[str, any]]:
+    """
+    Scrape ESPN NFL schedule page for game data without blocking the event loop.
+    
+    The page is fetched on the shared async client and parsed in a worker
+    thread, since HTML parsing is CPU-bound.
+    
+    Args:
+        espn_url: ESPN NFL schedule URL (e.g., https://www.espn.com/nfl/schedule/_/week/13/year/2025/seasontype/2)
+    
+    Returns:
+        Tuple of (list of GameData objects, metadata dict with week/year info)
+    """
+    try:
+        response = await _http_get_async(espn_url, ESPN_REQUEST_HEADERS)
+        response.raise_for_status()
+        
+        return await asyncio.to_thread(parse_espn_schedule_html, response.content, espn_url)
+        
+    except Exception as e:
+        raise Exception(f"Error scraping ESPN: {str(e)}")
+
+
 def scrape_espn_schedule(espn_url: str) -> tuple[List[GameData], Dict[str, any]]:
     """
     Scrape ESPN NFL schedule page for game data.
     
+    Blocking variant of scrape_espn_schedule_async() for scripts and worker
+    threads, on the shared pooled sync client. Async code (e.g. FastAPI
+    handlers) should await the async variant.
+    
     Args:
         espn_url: ESPN NFL schedule URL (e.g., https://www.espn.com/nfl/schedule/_/week/13/year/2025/seasontype/2)
     
@@ -98,164 +325,564 @@ def scrape_espn_schedule(espn_url: str) -> tuple[List[GameData], Dict[str, any]]
         Tuple of (list of GameData objects, metadata dict with week/year info)
     """
     try:
-        # Fetch the page
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        response = requests.get(espn_url, headers=headers, timeout=10)
+        response = _http_get(espn_url, ESPN_REQUEST_HEADERS)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
-        games = []
+        return parse_espn_schedule_html(response.content, espn_url)
+        
+    except Exception as e:
+        raise Exception(f"Error scraping ESPN: {str(e)}")
+
+
+def _team_abbrev(hrefs: List[str]) -> str:
+    """Extract the ESPN team code from team link hrefs (like /nfl/team/_/name/nyg/new-york-giants)."""
+    for href in reversed(hrefs):
+        match = re.search(r'/name/([A-Za-z0-9]+)/', href)
+        if match:
+            return match.group(1).upper()
+    return ""
+
+
+def parse_espn_schedule_html(content: bytes, espn_url: str, parser: Optional[str] = None) -> tuple[List[GameData], Dict[str, any]]:
+    """
+    Parse an already-fetched ESPN NFL schedule page.
+    
+    Only the rows of the schedule tables are walked. If none yield games
+    (e.g. ESPN renamed the table wrapper), every table row on the page is
+    tried instead.
+    
+    Args:
+        content: Raw HTML of the schedule page
+        espn_url: URL the page was fetched from (used for week/year metadata)
+        parser: HTML backend ("selectolax", "lxml", "html.parser" or "auto");
+            defaults to the configured backend (see schedule_parsers.set_default_parser())
+    
+    Returns:
+        Tuple of (list of GameData objects, metadata dict with week/year info)
+    """
+    backend = get_parser(parser)
+    document = backend.parse(content)
+    
+    # Extract week and year from URL
+    week_match = re.search(r'/week/(\d+)', espn_url)
+    year_match = re.search(r'/year/(\d+)', espn_url)
+    week = int(week_match.group(1)) if week_match else None
+    year = int(year_match.group(1)) if year_match else None
+    
+    games = _games_from_rows(backend.rows(document), year)
+    
+    # If no games found in the schedule tables, try every table row
+    if not games:
+        games = _games_from_rows(backend.rows(document, schedule_only=False), year)
+    
+    metadata = {
+        "week": week,
+        "year": year,
+        "games_found": len(games),
+        "scraped_at": datetime.now().isoformat()
+    }
+    
+    return games, metadata
+
+
+def _parse_schedule_date(header: str, season_year: Optional[int]) -> Optional[date]:
+    """
+    Parse a date header ("Thursday, November 27, 2025").
+    
+    Headers without a year take it from the season: August-December games
+    are in the season year, January-February games in the next.
+    """
+    try:
+        return datetime.strptime(header, "%A, %B %d, %Y").date()
+    except ValueError:
+        pass
+    if season_year is None:
+        return None
+    try:
+        parsed = datetime.strptime(f"{header}, {season_year}", "%A, %B %d, %Y").date()
+    except ValueError:
+        return None
+    return parsed.replace(year=season_year + 1) if parsed.month < 8 else parsed
+
+
+def _games_from_rows(rows: Iterable[ScheduleRow], season_year: Optional[int] = None) -> List[GameData]:
+    """
+    Build games from schedule table rows (shared by every parser backend).
+    
+    Date header rows set the day of week and date for the games below
+    them; game rows have the away team, "@" home team and kickoff time in
+    their first three cells.
+    """
+    games = []
+    current_day = ""
+    current_date = None
+    
+    for header, cells in rows:
+        # Date header row (e.g., "Thursday, December 5")
+        if header is not None:
+            day_match = re.match(r'(\w+)', header)
+            if day_match:
+                current_day = day_match.group(1)
+            current_date = _parse_schedule_date(header, season_year)
+            continue
+        
+        if len(cells) < 3:
+            continue
+        (away_text, away_links), (home_text, home_links), (game_time, _) = cells
         
-        # Extract week and year from URL
-        week_match = re.search(r'/week/(\d+)', espn_url)
-        year_match = re.search(r'/year/(\d+)', espn_url)
-        week = int(week_match.group(1)) if week_match else None
-        year = int(year_match.group(1)) if year_match else None
+        # Away team is the last team link (the first wraps the logo); home cell reads "@TeamName"
+        away_team = away_links[-1][0] if away_links else None
+        home_team = home_text.replace('@', '').strip() if '@' in home_text else None
         
-        # Try to extract day of week from section headers
-        current_day = ""
+        # Only create game if we have both teams
+        if away_team and home_team:
+            games.append(GameData(
+                away_team, home_team, game_time, "Scheduled", current_day,
+                _team_abbrev([href for _, href in away_links]), _team_abbrev([href for _, href in home_links]),
+                kickoff=kickoff_datetime(current_date, game_time)
+            ))
+    
+    return games
+
+
+class _ScheduleEntry:
+    """Cached schedule for one URL plus its HTTP validators."""
+    def __init__(self, games: Schedule, metadata: Dict[str, any], etag: Optional[str],
+                 last_modified: Optional[str], fetched_at: float, version: int):
+        self.games = games
+        self.metadata = metadata
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fetched_at = fetched_at
+        self.version = version
+
+
+class ScheduleCache:
+    """
+    TTL cache of parsed ESPN schedules keyed by URL.
+    
+    - Fresh entries (younger than ttl_seconds) are served without any request.
+    - Stale entries within stale_seconds past the TTL are served immediately
+      while the schedule is revalidated in the background (stale-while-revalidate).
+    - Older entries are revalidated synchronously with If-None-Match /
+      If-Modified-Since, so an unchanged page costs a 304 and no re-parse.
+    - At most max_weeks URLs are kept; the least recently used is evicted.
+    - If ESPN is unreachable, the last good schedule is served.
+    
+    Schedules come from the schedule page ("html") or the scoreboard API
+    ("json"), chosen per call or by the cache's default source. The API is
+    cached under its own URL; if it fails and nothing is cached for it, the
+    schedule page is used instead. Fetch and parse times are recorded per
+    source in each schedule's metadata and in stats().
+    
+    get() is for sync callers; aget() is the non-blocking variant for the
+    web app. Both share the same entries and statistics, and return each
+    cached week as one shared, immutable Schedule.
+    """
+    
+    def __init__(self, ttl_seconds: float = 300, stale_seconds: float = 3600, max_weeks: int = 8,
+                 fetcher: Callable[[str, Dict[str, str]], "httpx.Response"] = _http_get,
+                 async_fetcher: Callable[[str, Dict[str, str]], Awaitable["httpx.Response"]] = _http_get_async,
+                 clock: Callable[[], float] = time.monotonic, source: str = "html",
+                 scoreboard_url: Optional[str] = None):
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.max_weeks = max_weeks
+        self.fetcher = fetcher
+        self.async_fetcher = async_fetcher
+        self.clock = clock
+        self.source = self._check_source(source)
+        self.scoreboard_url = scoreboard_url  # None: espn_api.ESPN_SCOREBOARD_URL
+        self.version = 0  # Bumped whenever any cached schedule changes
+        self._entries: "OrderedDict[str, _ScheduleEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._revalidating: Dict[str, object] = {}  # URL -> Thread or asyncio.Task
+        self._stats = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "revalidations": 0,  # 304 Not Modified
+            "refreshes": 0,      # 200 with a new page for a cached URL
+            "errors": 0,
+            "evictions": 0,
+            "fallbacks": 0,      # Scoreboard API failed; schedule page used instead
+        }
+        # Per source: full fetches and their summed fetch/parse time
+        self._latency = {source: {"fetches": 0, "fetch_ms": 0.0, "parse_ms": 0.0} for source in SCHEDULE_SOURCES}
+    
+    @staticmethod
+    def _check_source(source: str) -> str:
+        if source not in SCHEDULE_SOURCES:
+            raise ValueError(f"Unknown schedule source '{source}' (expected one of {', '.join(SCHEDULE_SOURCES)})")
+        return source
+    
+    def configure(self, ttl_seconds: Optional[float] = None, stale_seconds: Optional[float] = None,
+                  max_weeks: Optional[int] = None, source: Optional[str] = None,
+                  scoreboard_url: Optional[str] = None) -> None:
+        """Update cache limits and the default source (e.g. from application settings)."""
+        with self._lock:
+            if ttl_seconds is not None:
+                self.ttl_seconds = ttl_seconds
+            if stale_seconds is not None:
+                self.stale_seconds = stale_seconds
+            if source is not None:
+                self.source = self._check_source(source)
+            if scoreboard_url is not None:
+                self.scoreboard_url = scoreboard_url
+            if max_weeks is not None:
+                self.max_weeks = max_weeks
+                self._evict()
+    
+    def _api_url(self, espn_url: str) -> str:
+        """Scoreboard API URL for a schedule page URL (raises ValueError if it has no week/year)."""
+        from .espn_api import ESPN_SCOREBOARD_URL, scoreboard_url
+        return scoreboard_url(espn_url, self.scoreboard_url or ESPN_SCOREBOARD_URL)
+    
+    def get(self, espn_url: str, source: Optional[str] = None) -> Tuple[Schedule, Dict[str, any]]:
+        """
+        Return (games, metadata) for an ESPN schedule URL, fetching if needed.
         
-        # Parse using table rows - ESPN's current structure
-        table_rows = soup.find_all('tr', class_='Table__TR')
+        Args:
+            espn_url: ESPN NFL schedule URL
+            source: "html" or "json" (defaults to the cache's source)
         
-        for row in table_rows:
+        Raises:
+            Exception: If the schedule can't be fetched and nothing is cached.
+        """
+        if self._check_source(source or self.source) == "json":
             try:
-                # Check if this row is a date header
-                header = row.find('th', class_='Table__TH')
-                if header:
-                    # Extract day of week from header (e.g., "Thursday, December 5")
-                    header_text = header.get_text(strip=True)
-                    if header_text:
-                        # Extract day name (first word before comma)
-                        day_match = re.match(r'(\w+)', header_text)
-                        if day_match:
-                            current_day = day_match.group(1)
-                    continue
-                
-                # Get all table cells
-                cells = row.find_all('td')
-                
-                if len(cells) >= 3:
-                    # Cell 0: Away team
-                    # Cell 1: @Home team
-                    # Cell 2: Game time
-                    
-                    # Extract away team from first cell
-                    away_links = cells[0].find_all('a', class_='AnchorLink')
-                    away_team = away_links[-1].get_text(strip=True) if away_links else None
-                    
-                    # Extract home team from second cell (format: "@TeamName")
-                    home_text = cells[1].get_text(strip=True)
-                    home_team = home_text.replace('@', '').strip() if '@' in home_text else None
-                    
-                    # Extract game time from third cell
-                    game_time = cells[2].get_text(strip=True) if len(cells) > 2 else "TBD"
-                    
-                    # Only create game if we have both teams
-                    if away_team and home_team:
-                        game = GameData(away_team, home_team, game_time, "Scheduled", current_day)
-                        games.append(game)
+                return self._get(self._api_url(espn_url), "json")
             except Exception as e:
-                # Skip rows that don't match expected format
-                continue
+                self._count_fallback(e)
+        return self._get(espn_url, "html")
+    
+    async def aget(self, espn_url: str, source: Optional[str] = None) -> Tuple[Schedule, Dict[str, any]]:
+        """
+        Async variant of get(): fetches on the shared async client and parses off the event loop.
         
-        # If no games found with primary method, try alternative parsing
-        if not games:
-            games = _parse_alternative_format(soup)
+        Raises:
+            Exception: If the schedule can't be fetched and nothing is cached.
+        """
+        if self._check_source(source or self.source) == "json":
+            try:
+                return await self._aget(self._api_url(espn_url), "json")
+            except Exception as e:
+                self._count_fallback(e)
+        return await self._aget(espn_url, "html")
+    
+    async def arefresh(self, espn_url: str, source: Optional[str] = None) -> Tuple[Schedule, Dict[str, any]]:
+        """
+        Revalidate a week now, however fresh its cached copy is.
         
-        metadata = {
-            "week": week,
-            "year": year,
-            "games_found": len(games),
-            "scraped_at": datetime.now().isoformat()
-        }
+        Used to keep a week warm ahead of visitors: the request is
+        conditional, so an unchanged page costs a 304, and the TTL restarts
+        either way.
         
-        return games, metadata
+        Raises:
+            Exception: If ESPN can't be fetched (the cached copy is kept).
+        """
+        if self._check_source(source or self.source) == "json":
+            try:
+                return await self._arefresh(self._api_url(espn_url), "json")
+            except Exception as e:
+                self._count_fallback(e)
+        return await self._arefresh(espn_url, "html")
+    
+    def _get(self, url: str, source: str) -> Tuple[Schedule, Dict[str, any]]:
+        state, entry = self._lookup(url)
+        if state == "stale":
+            self._start_background_revalidation(url, source)
+        if state != "fetch":
+            return entry.games, dict(entry.metadata)
         
-    except Exception as e:
-        raise Exception(f"Error scraping ESPN: {str(e)}")
+        entry = self._fetch(url, entry, source)
+        return entry.games, dict(entry.metadata)
+    
+    async def _aget(self, url: str, source: str) -> Tuple[Schedule, Dict[str, any]]:
+        state, entry = self._lookup(url)
+        if state == "stale":
+            self._start_background_revalidation_async(url, source)
+        if state != "fetch":
+            return entry.games, dict(entry.metadata)
+        
+        entry = await self._fetch_async(url, entry, source)
+        return entry.games, dict(entry.metadata)
+    
+    async def _arefresh(self, url: str, source: str) -> Tuple[Schedule, Dict[str, any]]:
+        with self._lock:
+            entry = self._entries.get(url)
+        entry = await self._fetch_async(url, entry, source, keep_cached=False)
+        return entry.games, dict(entry.metadata)
+    
+    def _count_fallback(self, error: Exception) -> None:
+        with self._lock:
+            self._stats["fallbacks"] += 1
+        print(f"⚠️  ESPN scoreboard API unavailable ({error}); using the schedule page")
+    
+    def version_of(self, espn_url: str, source: Optional[str] = None) -> Optional[int]:
+        """Return the content version of the schedule get() would serve for a URL (None if not cached)."""
+        with self._lock:
+            entry = None
+            if (source or self.source) == "json":
+                try:
+                    entry = self._entries.get(self._api_url(espn_url))
+                except ValueError:
+                    pass
+            entry = entry or self._entries.get(espn_url)
+            return entry.version if entry else None
+    
+    def invalidate(self, espn_url: Optional[str] = None) -> None:
+        """Drop one URL (from both sources) or everything from the cache."""
+        with self._lock:
+            if espn_url is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(espn_url, None)
+                try:
+                    self._entries.pop(self._api_url(espn_url), None)
+                except ValueError:
+                    pass
+    
+    def wait_for_revalidation(self, timeout: Optional[float] = None) -> None:
+        """Block until in-flight background revalidation threads finish (used by tests/scripts)."""
+        with self._lock:
+            threads = [t for t in self._revalidating.values() if isinstance(t, threading.Thread)]
+        for thread in threads:
+            thread.join(timeout)
+    
+    def stats(self) -> Dict[str, any]:
+        """Return hit/miss/revalidation counters, occupancy and average latency per source."""
+        with self._lock:
+            latency = {}
+            for source, totals in self._latency.items():
+                fetches = totals["fetches"]
+                latency[source] = {
+                    "fetches": fetches,
+                    "avg_fetch_ms": round(totals["fetch_ms"] / fetches, 3) if fetches else None,
+                    "avg_parse_ms": round(totals["parse_ms"] / fetches, 3) if fetches else None,
+                }
+            return {
+                **self._stats,
+                "entries": len(self._entries),
+                "max_weeks": self.max_weeks,
+                "ttl_seconds": self.ttl_seconds,
+                "stale_seconds": self.stale_seconds,
+                "version": self.version,
+                "source": self.source,
+                "latency": latency,
+            }
+    
+    def _lookup(self, url: str) -> Tuple[str, Optional[_ScheduleEntry]]:
+        """
+        Classify a URL as 'hit', 'stale' (serve + revalidate) or 'fetch'.
+        
+        Returns:
+            Tuple of (state, cached entry or None)
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                self._stats["misses"] += 1
+                return "fetch", None
+            
+            self._entries.move_to_end(url)
+            age = self.clock() - entry.fetched_at
+            if age < self.ttl_seconds:
+                self._stats["hits"] += 1
+                return "hit", entry
+            if age < self.ttl_seconds + self.stale_seconds:
+                self._stats["stale_hits"] += 1
+                return "stale", entry
+            return "fetch", entry
+    
+    def _start_background_revalidation(self, url: str, source: str) -> None:
+        """Spawn one revalidation thread per URL."""
+        def revalidate():
+            try:
+                with self._lock:
+                    entry = self._entries.get(url)
+                self._fetch(url, entry, source)
+            except Exception:
+                pass  # Error already counted; stale copy keeps being served
+            finally:
+                with self._lock:
+                    self._revalidating.pop(url, None)
+        
+        with self._lock:
+            if url in self._revalidating:
+                return
+            thread = threading.Thread(target=revalidate, name="espn-revalidate", daemon=True)
+            self._revalidating[url] = thread
+        thread.start()
+    
+    def _start_background_revalidation_async(self, url: str, source: str) -> None:
+        """Schedule one revalidation task per URL on the running event loop."""
+        async def revalidate():
+            try:
+                with self._lock:
+                    entry = self._entries.get(url)
+                await self._fetch_async(url, entry, source)
+            except Exception:
+                pass  # Error already counted; stale copy keeps being served
+            finally:
+                with self._lock:
+                    self._revalidating.pop(url, None)
+        
+        with self._lock:
+            if url in self._revalidating:
+                return
+            self._revalidating[url] = asyncio.get_running_loop().create_task(revalidate())
+    
+    def _conditional_headers(self, entry: Optional[_ScheduleEntry]) -> Dict[str, str]:
+        """Request headers, including validators from a cached entry."""
+        headers = dict(ESPN_REQUEST_HEADERS)
+        if entry is not None:
+            if entry.etag:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                headers['If-Modified-Since'] = entry.last_modified
+        return headers
+    
+    def _fetch(self, url: str, entry: Optional[_ScheduleEntry], source: str) -> _ScheduleEntry:
+        """Fetch (conditionally, if we have validators) and store the schedule."""
+        try:
+            started = time.perf_counter()
+            response = self.fetcher(url, self._conditional_headers(entry))
+            fetch_ms = (time.perf_counter() - started) * 1000
+            return self._handle_response(url, entry, response, source, fetch_ms)
+        except Exception as e:
+            return self._handle_error(entry, e)
+    
+    async def _fetch_async(self, url: str, entry: Optional[_ScheduleEntry], source: str,
+                           keep_cached: bool = True) -> _ScheduleEntry:
+        """Async _fetch(); parsing runs in a worker thread. With keep_cached=False errors raise even if cached."""
+        try:
+            started = time.perf_counter()
+            response = await self.async_fetcher(url, self._conditional_headers(entry))
+            fetch_ms = (time.perf_counter() - started) * 1000
+            return await asyncio.to_thread(self._handle_response, url, entry, response, source, fetch_ms)
+        except Exception as e:
+            return self._handle_error(entry if keep_cached else None, e)
+    
+    def _handle_error(self, entry: Optional[_ScheduleEntry], error: Exception) -> _ScheduleEntry:
+        """Count a failed fetch and fall back to the cached copy, if any."""
+        with self._lock:
+            self._stats["errors"] += 1
+        if entry is not None:
+            return entry
+        raise Exception(f"Error scraping ESPN: {str(error)}")
+    
+    def _handle_response(self, url: str, entry: Optional[_ScheduleEntry], response: "httpx.Response",
+                         source: str = "html", fetch_ms: float = 0.0) -> _ScheduleEntry:
+        """Apply a 304 to the cached entry or parse and store a new page."""
+        if response.status_code == 304 and entry is not None:
+            with self._lock:
+                entry.fetched_at = self.clock()
+                self._stats["revalidations"] += 1
+                self._store(url, entry)
+            return entry
+        
+        response.raise_for_status()
+        started = time.perf_counter()
+        if source == "json":
+            from .espn_api import parse_scoreboard_json
+            games, metadata = parse_scoreboard_json(response.content, url)
+        else:
+            games, metadata = parse_espn_schedule_html(response.content, url)
+        parse_ms = (time.perf_counter() - started) * 1000
+        metadata.update({"source": source, "fetch_ms": round(fetch_ms, 3), "parse_ms": round(parse_ms, 3)})
+        
+        with self._lock:
+            if entry is not None:
+                self._stats["refreshes"] += 1
+            latency = self._latency[source]
+            latency["fetches"] += 1
+            latency["fetch_ms"] += fetch_ms
+            latency["parse_ms"] += parse_ms
+            self.version += 1
+            new_entry = _ScheduleEntry(
+                Schedule(games), metadata,
+                response.headers.get('ETag'),
+                response.headers.get('Last-Modified'),
+                self.clock(),
+                self.version
+            )
+            self._store(url, new_entry)
+        return new_entry
+    
+    def _store(self, url: str, entry: _ScheduleEntry) -> None:
+        """Insert/refresh an entry as most recently used. Caller holds the lock."""
+        self._entries[url] = entry
+        self._entries.move_to_end(url)
+        self._evict()
+    
+    def _evict(self) -> None:
+        """Drop least recently used weeks beyond max_weeks. Caller holds the lock."""
+        while len(self._entries) > max(self.max_weeks, 1):
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
 
 
-def _parse_alternative_format(soup: BeautifulSoup) -> List[GameData]:
-    """Alternative parser for different ESPN HTML structures."""
-    games = []
-    current_day = ""
+# Global schedule cache shared by the web app and the prompt builder
+schedule_cache = ScheduleCache()
+
+
+def get_cached_schedule(espn_url: str, source: Optional[str] = None) -> tuple[Schedule, Dict[str, any]]:
+    """
+    Cached version of scrape_espn_schedule() backed by the global ScheduleCache.
+    
+    Args:
+        espn_url: ESPN NFL schedule URL
+        source: "html" (schedule page) or "json" (scoreboard API); defaults to the configured source
     
-    # Try finding by table rows (same as primary now, but kept for compatibility)
-    rows = soup.find_all('tr', class_='Table__TR')
+    Returns:
+        Tuple of (Schedule of GameData objects, metadata dict with week/year info)
+    """
+    return schedule_cache.get(espn_url, source)
+
+
+async def get_cached_schedule_async(espn_url: str, source: Optional[str] = None) -> tuple[Schedule, Dict[str, any]]:
+    """
+    Non-blocking cached schedule lookup for async callers (FastAPI handlers).
     
-    for row in rows:
-        try:
-            # Check for date header
-            header = row.find('th', class_='Table__TH')
-            if header:
-                header_text = header.get_text(strip=True)
-                if header_text:
-                    day_match = re.match(r'(\w+)', header_text)
-                    if day_match:
-                        current_day = day_match.group(1)
-                continue
-            
-            # Get all table cells
-            cells = row.find_all('td')
-            
-            if len(cells) >= 3:
-                # Cell 0: Away team
-                # Cell 1: @Home team
-                # Cell 2: Game time
-                
-                # Extract away team from first cell
-                away_links = cells[0].find_all('a', class_='AnchorLink')
-                away_team = away_links[-1].get_text(strip=True) if away_links else None
-                
-                # Extract home team from second cell (format: "@TeamName")
-                home_text = cells[1].get_text(strip=True)
-                home_team = home_text.replace('@', '').strip() if '@' in home_text else None
-                
-                # Extract game time from third cell
-                game_time = cells[2].get_text(strip=True) if len(cells) > 2 else "TBD"
-                
-                # Only create game if we have both teams
-                if away_team and home_team:
-                    game = GameData(away_team, home_team, game_time, "Scheduled", current_day)
-                    games.append(game)
-        except:
-            continue
+    Args:
+        espn_url: ESPN NFL schedule URL
+        source: "html" (schedule page) or "json" (scoreboard API); defaults to the configured source
     
-    return games
+    Returns:
+        Tuple of (Schedule of GameData objects, metadata dict with week/year info)
+    """
+    return await schedule_cache.aget(espn_url, source)
 
 
-def group_games_by_time_slot(games: List[GameData]) -> Dict[str, List[GameData]]:
+def group_games_by_time_slot(games: Iterable[GameData]) -> Dict[str, List[GameData]]:
     """
     Group games by their time slot category.
     
+    A Schedule's grouping is computed once when it is built and returned
+    as is; other iterables are grouped on every call.
+    
     Args:
-        games: List of GameData objects
+        games: Schedule or list of GameData objects
     
     Returns:
         Dictionary with time slots as keys and lists of games as values
+        (read-only for a Schedule)
     """
-    grouped = {
-        'early': [],
-        'afternoon': [],
-        'night': [],
-        'monday': [],
-        'thursday': []
-    }
-    
-    for game in games:
-        time_slot = game.time_slot
-        if time_slot in grouped:
-            grouped[time_slot].append(game)
-    
-    return grouped
+    if isinstance(games, Schedule):
+        return games.by_slot()
+    return Schedule(games).by_slot()
 
 
-def format_games_for_prompt(games: List[GameData], focus_games: str = "all", selected_game_ids: Optional[List[str]] = None) -> str:
+def _kickoff_hour(game: GameData) -> Optional[int]:
+    """Eastern kickoff hour (0-23), or None if the time isn't known."""
+    kickoff_time = parse_kickoff_time(game.time)
+    return kickoff_time.hour if kickoff_time else None
+
+
+def filter_games(games: List[GameData], focus_games: str = "all", selected_game_ids: Optional[List[str]] = None) -> List[GameData]:
     """
-    Format game data for inclusion in AI prompt.
+    Select the games to analyze.
     
     Args:
         games: List of GameData objects
@@ -263,31 +890,49 @@ def format_games_for_prompt(games: List[GameData], focus_games: str = "all", sel
         selected_game_ids: List of game IDs to include (None = use focus_games parameter)
     
     Returns:
-        Formatted string with game information
+        Filtered list of GameData objects
     """
-    if not games:
-        return "No game data available. Please check the ESPN URL."
-    
     # New system: Filter by selected game IDs
     if selected_game_ids is not None:
         filtered_games = [g for g in games if g.game_id in selected_game_ids]
     # Legacy system: Filter by focus_games string
     elif focus_games != "all":
+        hours = [(g, _kickoff_hour(g)) for g in games]
         if "afternoon" in focus_games.lower():
-            # Filter for afternoon games (typically 4:05 PM ET and later)
-            filtered_games = [g for g in games if "4:" in g.time or "8:" in g.time]
+            # Games kicking off at 4:00 PM ET or later
+            filtered_games = [g for g, hour in hours if hour is not None and hour >= 16]
         elif "early" in focus_games.lower():
-            # Filter for early games (typically 1:00 PM ET)
-            filtered_games = [g for g in games if "1:" in g.time]
+            # Games kicking off before 4:00 PM ET (typically 1:00 PM)
+            filtered_games = [g for g, hour in hours if hour is not None and hour < 16]
         elif "primetime" in focus_games.lower():
-            # Filter for primetime games (typically 8:00+ PM ET)
-            filtered_games = [g for g in games if "8:" in g.time or "9:" in g.time]
+            # Games kicking off at 8:00 PM ET or later
+            filtered_games = [g for g, hour in hours if hour is not None and hour >= 20]
         else:
             # Assume it's a comma-separated list of specific matchups
             focus_list = [m.strip() for m in focus_games.split(",")]
             filtered_games = [g for g in games if any(team in g.matchup for team in focus_list)]
     else:
-        filtered_games = games
+        filtered_games = list(games)
+    
+    return filtered_games
+
+
+def format_games_for_prompt(games: List[GameData], focus_games: str = "all", selected_game_ids: Optional[List[str]] = None) -> str:
+    """
+    Format game data for inclusion in AI prompt.
+    
+    Args:
+        games: List of GameData objects
+        focus_games: Filter for specific games ("all", "afternoon_only", or specific matchups) - legacy parameter
+        selected_game_ids: List of game IDs to include (None = use focus_games parameter)
+    
+    Returns:
+        Formatted string with game information
+    """
+    if not games:
+        return "No game data available. Please check the ESPN URL."
+    
+    filtered_games = filter_games(games, focus_games, selected_game_ids)
     
     if not filtered_games:
         return "No games match the selected criteria."
@@ -304,10 +949,11 @@ def format_games_for_prompt(games: List[GameData], focus_games: str = "all", sel
         'afternoon': '🕓 AFTERNOON GAMES (4:00 PM ET)',
         'night': '🌙 NIGHT GAMES (8:00+ PM ET)',
         'monday': '🏈 MONDAY NIGHT FOOTBALL',
-        'thursday': '🏈 THURSDAY NIGHT FOOTBALL'
+        'thursday': '🏈 THURSDAY NIGHT FOOTBALL',
+        'tbd': '⏳ KICKOFF TIME TBD'
     }
     
-    for slot in ['early', 'afternoon', 'night', 'thursday', 'monday']:
+    for slot in ['early', 'afternoon', 'night', 'thursday', 'monday', 'tbd']:
         if grouped[slot]:
             lines.append(f"\n## {time_slot_labels[slot]}")
             for game in grouped[slot]:
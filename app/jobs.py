@@ -0,0 +1,401 @@
+"""Background job queue for long-running pick generation."""
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+JOBS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    key TEXT NOT NULL,
+    description TEXT NOT NULL,
+    status TEXT NOT NULL,
+    stages TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    started_at TEXT,
+    finished_at TEXT,
+    error TEXT,
+    result TEXT,
+    submissions INTEGER NOT NULL,
+    owner TEXT NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_by_key ON jobs (key, status);
+"""
+
+_ACTIVE_STATUSES = ("queued", "running")
+
+
+class JobEvents:
+    """
+    Events a running job publishes, replayed in full to every follower.
+
+    A follower that joins late first receives everything published so far,
+    then blocks for new events until the log is closed.
+    """
+
+    def __init__(self):
+        self._events: List[Tuple[str, Any]] = []
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def publish(self, event: str, data: Any) -> None:
+        """Append an event and wake every follower."""
+        with self._condition:
+            self._events.append((event, data))
+            self._condition.notify_all()
+
+    def close(self) -> None:
+        """Mark the log complete; followers stop after the last event."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def follow(self) -> Iterator[Tuple[str, Any]]:
+        """Yield every event from the start, waiting for more until closed."""
+        position = 0
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: position < len(self._events) or self._closed)
+                pending = self._events[position:]
+                closed = self._closed
+            yield from pending
+            position += len(pending)
+            if closed and not pending:
+                return
+
+
+class Job:
+    """State of one background job, including the stages it has completed."""
+
+    def __init__(self, key: str, description: str = ""):
+        self.id = uuid.uuid4().hex
+        self.key = key
+        self.description = description
+        self.status = "queued"  # "queued", "running", "succeeded", "failed"
+        self.stages: List[Dict[str, str]] = []
+        self.created_at = datetime.now().isoformat()
+        self.started_at: Optional[str] = None
+        self.finished_at: Optional[str] = None
+        self.error: Optional[str] = None
+        self.result: Any = None
+        self.submissions = 1  # Number of requests coalesced onto this job
+        self.events: Optional[JobEvents] = None  # Live event log while running, in this worker only
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("succeeded", "failed")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization (without the result)."""
+        return {
+            "job_id": self.id,
+            "description": self.description,
+            "status": self.status,
+            "stage": self.stages[-1]["stage"] if self.stages else None,
+            "stages": list(self.stages),
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error,
+            "submissions": self.submissions,
+        }
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class SQLiteJobStore:
+    """
+    Keeps job records in a SQLite file that every worker opens.
+
+    The worker that runs a job writes its status, stages and result as they
+    change, so a poll answered by any other worker sees the same job, and a
+    submission on any worker coalesces onto an active job with the same key.
+    An active job whose worker process has exited, or that hasn't changed
+    for stale_seconds, is marked failed instead of being waited on forever.
+    """
+
+    def __init__(self, db_path: Union[str, Path], dump_result: Callable[[Any], str] = json.dumps,
+                 load_result: Callable[[str], Any] = json.loads, stale_seconds: float = 3600):
+        self.db_path = Path(db_path)
+        self.dump_result = dump_result
+        self.load_result = load_result
+        self.stale_seconds = stale_seconds
+        self._host = socket.gethostname()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return this process's connection, opening it on first use. Caller holds the lock."""
+        if self._connection is None or self._pid != os.getpid():
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.db_path, timeout=10, check_same_thread=False, isolation_level=None)
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.executescript(JOBS_SCHEMA)
+            connection.row_factory = sqlite3.Row
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    @property
+    def owner(self) -> str:
+        return f"{self._host}:{os.getpid()}"
+
+    def _abandoned(self, owner: str, updated: float) -> bool:
+        """True if the worker that owns an active job is gone."""
+        if time.time() - updated > self.stale_seconds:
+            return True
+        host, _, pid = owner.rpartition(":")
+        return os.name == "posix" and host == self._host and not _pid_alive(int(pid))
+
+    def _job_from_row(self, row: sqlite3.Row) -> Job:
+        job = Job(row["key"], row["description"])
+        job.id = row["id"]
+        job.status = row["status"]
+        job.stages = json.loads(row["stages"])
+        job.created_at = row["created_at"]
+        job.started_at = row["started_at"]
+        job.finished_at = row["finished_at"]
+        job.error = row["error"]
+        job.submissions = row["submissions"]
+        if row["result"] is not None:
+            job.result = self.load_result(row["result"])
+        return job
+
+    def _fail_abandoned(self, connection: sqlite3.Connection, row: sqlite3.Row) -> bool:
+        """Mark an active job failed if its worker is gone. Caller holds a write transaction."""
+        if row["status"] not in _ACTIVE_STATUSES or not self._abandoned(row["owner"], row["updated"]):
+            return False
+        connection.execute(
+            "UPDATE jobs SET status = 'failed', error = ?, finished_at = ?, updated = ? WHERE id = ?",
+            ("Worker stopped before the job finished", datetime.now().isoformat(), time.time(), row["id"])
+        )
+        return True
+
+    def _write(self, action: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Run action(connection) in one write transaction."""
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                result = action(connection)
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+            return result
+
+    def claim(self, job: Job) -> Optional[Job]:
+        """
+        Record a new job unless one with the same key is active on any worker.
+
+        Returns:
+            The active job (with its submissions bumped), or None if job was recorded
+        """
+        def action(connection):
+            rows = connection.execute(
+                "SELECT * FROM jobs WHERE key = ? AND status IN (?, ?) ORDER BY created_at", (job.key, *_ACTIVE_STATUSES)
+            ).fetchall()
+            for row in rows:
+                if not self._fail_abandoned(connection, row):
+                    connection.execute("UPDATE jobs SET submissions = submissions + 1 WHERE id = ?", (row["id"],))
+                    active = self._job_from_row(row)
+                    active.submissions += 1
+                    return active
+            connection.execute(
+                "INSERT INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, NULL, ?, ?, ?)",
+                (job.id, job.key, job.description, job.status, json.dumps(job.stages), job.created_at,
+                 job.started_at, job.finished_at, job.error, job.submissions, self.owner, time.time())
+            )
+            return None
+
+        return self._write(action)
+
+    def add_submission(self, job_id: str) -> None:
+        """Count another request coalesced onto a job."""
+        self._write(lambda connection: connection.execute(
+            "UPDATE jobs SET submissions = submissions + 1 WHERE id = ?", (job_id,)))
+
+    def save(self, job: Job) -> None:
+        """Write a job's progress and outcome (its submissions count is kept)."""
+        result = self.dump_result(job.result) if job.status == "succeeded" and job.result is not None else None
+        self._write(lambda connection: connection.execute(
+            "UPDATE jobs SET status = ?, stages = ?, started_at = ?, finished_at = ?, error = ?, result = ?, "
+            "updated = ? WHERE id = ?",
+            (job.status, json.dumps(job.stages), job.started_at, job.finished_at, job.error, result,
+             time.time(), job.id)
+        ))
+
+    def load(self, job_id: str) -> Optional[Job]:
+        """Return a job recorded by any worker, or None if unknown (or already pruned)."""
+        select = "SELECT * FROM jobs WHERE id = ?"
+        # Polls only read; the write lock is taken just to fail a job whose worker is gone
+        with self._lock:
+            row = self._connect().execute(select, (job_id,)).fetchone()
+        if row is not None and row["status"] in _ACTIVE_STATUSES and self._abandoned(row["owner"], row["updated"]):
+            def action(connection):
+                current = connection.execute(select, (job_id,)).fetchone()
+                if current is not None and self._fail_abandoned(connection, current):
+                    current = connection.execute(select, (job_id,)).fetchone()
+                return current
+
+            row = self._write(action)
+        return self._job_from_row(row) if row is not None else None
+
+    def prune(self, max_finished_jobs: int) -> None:
+        """Drop the oldest finished jobs beyond max_finished_jobs."""
+        self._write(lambda connection: connection.execute(
+            "DELETE FROM jobs WHERE status NOT IN (?, ?) AND id NOT IN ("
+            "SELECT id FROM jobs WHERE status NOT IN (?, ?) ORDER BY finished_at DESC LIMIT ?)",
+            (*_ACTIVE_STATUSES, *_ACTIVE_STATUSES, max_finished_jobs)
+        ))
+
+
+class JobManager:
+    """
+    Runs jobs on a bounded worker pool and tracks their progress.
+
+    Submitting a job whose key matches a queued or running job returns the
+    existing job instead of starting a duplicate. Finished jobs are kept
+    (up to max_finished_jobs) so clients can poll for results.
+
+    Without a store, jobs are only known to this process, which limits the
+    app to a single worker. With a SQLiteJobStore, every worker sharing the
+    file can report and coalesce onto jobs running in any of them.
+    """
+
+    def __init__(self, max_workers: int = 2, max_finished_jobs: int = 50, store: Optional[SQLiteJobStore] = None):
+        self.max_finished_jobs = max_finished_jobs
+        self.store = store
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="picks-job")
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._active_by_key: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, key: str, func: Callable[..., Any], *args, description: str = "",
+               events: Optional[JobEvents] = None, **kwargs) -> Tuple[Job, bool]:
+        """
+        Queue func(*args, progress=..., **kwargs) unless an identical job is active.
+
+        Args:
+            key: Identity of the job's inputs, used to coalesce duplicates
+            func: Callable to run; receives a progress(stage) callback
+            description: Human-readable label for status responses
+            events: Event log for func to publish to (passed as events=...); it is
+                attached to the job while it runs and closed when it finishes
+
+        Returns:
+            Tuple of (job, coalesced) where coalesced is True if an existing job was reused
+        """
+        with self._lock:
+            active = self._active_by_key.get(key)
+            if active is not None:
+                active.submissions += 1
+                if self.store is not None:
+                    self.store.add_submission(active.id)
+                return active, True
+
+            job = Job(key, description)
+            job.events = events
+            if self.store is not None:
+                active = self.store.claim(job)
+                if active is not None:
+                    return active, True  # Running on another worker
+            self._jobs[job.id] = job
+            self._active_by_key[key] = job
+
+        self._executor.submit(self._run, job, func, args, kwargs)
+        return job, False
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Return a job by ID (started by any worker sharing the store), or None if unknown (or already pruned)."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None and self.store is not None:
+            job = self.store.load(job_id)
+        return job
+
+    def list(self) -> List[Job]:
+        """Return the jobs tracked by this process, oldest first."""
+        with self._lock:
+            return list(self._jobs.values())
+
+    def shutdown(self) -> None:
+        """Stop accepting work and cancel queued jobs."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, job: Job, func: Callable[..., Any], args: tuple, kwargs: dict) -> None:
+        """Execute a job on a worker thread, recording stages and outcome."""
+        def progress(stage: str) -> None:
+            with self._lock:
+                job.stages.append({"stage": stage, "at": datetime.now().isoformat()})
+            self._save(job)
+
+        with self._lock:
+            job.status = "running"
+            job.started_at = datetime.now().isoformat()
+        self._save(job)
+
+        if job.events is not None:
+            kwargs = dict(kwargs, events=job.events)
+        result, error = None, None
+        try:
+            result = func(*args, progress=progress, **kwargs)
+        except Exception as e:
+            error = str(e)
+
+        # Record the outcome and release the key in one step (under the lock
+        # submit() holds), so no submission coalesces onto a finished job
+        with self._lock:
+            if error is None:
+                job.result = result
+                job.status = "succeeded"
+            else:
+                job.error = error
+                job.status = "failed"
+            job.finished_at = datetime.now().isoformat()
+            self._save(job)
+            if self._active_by_key.get(job.key) is job:
+                del self._active_by_key[job.key]
+            events, job.events = job.events, None
+            self._prune()
+        if events is not None:
+            events.close()
+
+    def _save(self, job: Job) -> None:
+        """Write a job's state to the shared store, if any."""
+        if self.store is None:
+            return
+        try:
+            self.store.save(job)
+        except Exception as e:
+            print(f"⚠️  Could not save job {job.id}: {e}")
+
+    def _prune(self) -> None:
+        """Drop the oldest finished jobs beyond max_finished_jobs. Caller holds the lock."""
+        finished = [job_id for job_id, job in self._jobs.items() if job.done]
+        for job_id in finished[:max(len(finished) - self.max_finished_jobs, 0)]:
+            del self._jobs[job_id]
+        if self.store is not None:
+            try:
+                self.store.prune(self.max_finished_jobs)
+            except Exception as e:
+                print(f"⚠️  Could not prune job records: {e}")
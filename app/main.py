@@ -1,28 +1,151 @@
 """FastAPI application for DFS/Props Picks."""
 
+import asyncio
+import hashlib
+import json
 import os
+from contextlib import asynccontextmanager
 from pathlib import Path
 from fastapi import FastAPI, Request, Form, HTTPException
-from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from .ai_client import generate_picks, save_picks, load_picks, render_prompt
-from .config import settings
+from starlette.concurrency import iterate_in_threadpool
+from .ai_client import (
+    generate_and_save_picks,
+    generate_picks_stream,
+    get_last_render_stats,
+    render_prompt_async
+)
+from .config import Settings, settings
 from .models import WeeklyPicksModel
-from .espn_scraper import scrape_espn_schedule, format_games_for_prompt, group_games_by_time_slot
-from typing import List
+from .espn_scraper import (
+    SCHEDULE_SOURCES,
+    get_cached_schedule_async,
+    schedule_cache,
+    close_http_clients,
+    format_games_for_prompt,
+    group_games_by_time_slot
+)
+from .depth_chart_parser import depth_chart_cache
+from .completion_cache import completion_cache
+from .jobs import JobEvents, JobManager, SQLiteJobStore
+from .openai_client import openai_clients
+from .picks_index import picks_index
+from .picks_store import CURRENT_PICKS_PATH, PicksRecord, choose_encoding, etag_matches, picks_exist, picks_store
+from .prompt_template import prompt_template, rendered_prompt_cache
+from .schedule_parsers import set_default_parser
+from .settings_store import settings_store
+from .warmup import CacheWarmer, next_week_url
+from typing import List, Optional
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown: open the OpenAI client, index picks history and start cache warm-up, then stop it and release pooled HTTP connections and workers on exit."""
+    # The OpenAI SDK is slow to import, so the client is built in the background rather than before serving
+    openai_startup = asyncio.create_task(asyncio.to_thread(_open_openai_client))
+    try:
+        await asyncio.to_thread(picks_index.sync)
+    except Exception as e:
+        print(f"⚠️  Could not sync picks index: {e}")
+    if settings.cache_warmup_enabled:
+        cache_warmer.start()
+    yield
+    await cache_warmer.stop()
+    await openai_startup
+    job_manager.shutdown()
+    openai_clients.close()
+    await close_http_clients()
+
+
+def _open_openai_client() -> None:
+    """Build the shared OpenAI client ahead of the first generation."""
+    try:
+        openai_clients.get(settings)
+    except Exception as e:
+        print(f"⚠️  Could not open OpenAI client: {e}")
+
 
 # Initialize FastAPI app
 app = FastAPI(
     title="DFS/Props Picks Generator",
     description="AI-powered weekly NFL DFS and prop betting recommendations",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Setup static files and templates
 app.mount("/static", StaticFiles(directory="static"), name="static")
 templates = Jinja2Templates(directory="templates")
 
+# Worker pool for pick generation jobs; with the SQLite state backend, job records are
+# shared through the runtime settings database so polls can reach any uvicorn worker
+job_manager = JobManager(
+    max_workers=settings.generation_workers,
+    store=None if settings.runtime_state_backend == "memory" else SQLiteJobStore(
+        settings.runtime_state_path,
+        dump_result=lambda picks: picks.model_dump_json(),
+        load_result=WeeklyPicksModel.model_validate_json
+    )
+)
+
+# Apply schedule parser and cache limits from settings
+set_default_parser(settings.espn_parser)
+schedule_cache.configure(
+    ttl_seconds=settings.espn_cache_ttl_seconds,
+    stale_seconds=settings.espn_cache_stale_seconds,
+    max_weeks=settings.espn_cache_max_weeks,
+    source=settings.espn_schedule_source,
+    scoreboard_url=settings.espn_scoreboard_url
+)
+
+
+async def _warm_schedule() -> dict:
+    """Refetch the configured week's schedule."""
+    url = settings_store.current().espn_game_data_link
+    games, metadata = await schedule_cache.arefresh(url)
+    return {"url": url, "games": len(games), "source": metadata.get("source")}
+
+
+async def _warm_next_week_schedule() -> Optional[dict]:
+    """Refetch the schedule of the week after the configured one, ready for the weekly switch."""
+    url = next_week_url(settings_store.current().espn_game_data_link)
+    if url is None:
+        return None
+    games, metadata = await schedule_cache.arefresh(url)
+    return {"url": url, "games": len(games), "source": metadata.get("source")}
+
+
+async def _warm_depth_chart() -> dict:
+    """Load the depth chart (and its compact prompt form) if the CSV changed."""
+    await asyncio.to_thread(depth_chart_cache.get_compact)
+    return {"version": depth_chart_cache.version, "players": depth_chart_cache.stats()["players"]}
+
+
+async def _warm_prompt() -> dict:
+    """Render the prompt for the current settings into the rendered prompt cache."""
+    await render_prompt_async(settings_store.current())
+    stats = get_last_render_stats()
+    return {"prompt_tokens": stats.get("prompt_tokens"), "cache_hit": stats.get("cache_hit")}
+
+
+async def _warm_picks() -> Optional[dict]:
+    """Load the current picks if the file changed (None until picks are generated)."""
+    try:
+        record = await asyncio.to_thread(picks_store.get)
+    except FileNotFoundError:
+        return None
+    return {"etag": record.etag}
+
+
+# Background refresh of the caches the admin page and dashboard read, in dependency order
+cache_warmer = CacheWarmer()
+cache_warmer.add("schedule", _warm_schedule, settings.cache_warmup_schedule_seconds)
+cache_warmer.add("next_week_schedule", _warm_next_week_schedule, settings.cache_warmup_schedule_seconds, required=False)
+cache_warmer.add("depth_chart", _warm_depth_chart, settings.cache_warmup_files_seconds)
+cache_warmer.add("prompt", _warm_prompt, settings.cache_warmup_prompt_seconds)
+cache_warmer.add("picks", _warm_picks, settings.cache_warmup_files_seconds)
+
 
 @app.get("/", response_class=HTMLResponse)
 async def dashboard(request: Request):
@@ -32,9 +155,8 @@ async def dashboard(request: Request):
     Loads current_picks.json and renders it with the dashboard template.
     """
     try:
-        # Try to load existing picks
-        picks = load_picks()
-        picks_data = picks.model_dump()
+        # Try to load existing picks (parsed once, cached until the file changes)
+        picks_data = picks_store.get().data
     except FileNotFoundError:
         # No picks generated yet
         picks_data = None
@@ -48,13 +170,34 @@ async def dashboard(request: Request):
         {
             "request": request,
             "picks": picks_data,
-            "settings": settings
+            "settings": settings_store.current()
         }
     )
 
 
+def _picks_response(request: Request, record: PicksRecord) -> Response:
+    """
+    Serve a picks document from its cached bytes with HTTP caching headers.
+    
+    Answers If-None-Match revalidation with 304 Not Modified, and otherwise
+    sends the precompressed variant the client accepts (brotli, gzip or none).
+    """
+    headers = {
+        "ETag": record.etag,
+        "Cache-Control": "no-cache",  # Always revalidate; a 304 costs almost nothing
+        "Vary": "Accept-Encoding",
+    }
+    if etag_matches(request.headers.get("if-none-match", ""), record.etag):
+        return Response(status_code=304, headers=headers)
+    
+    encoding = choose_encoding(request.headers.get("accept-encoding", ""))
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    return Response(content=record.body(encoding), media_type="application/json", headers=headers)
+
+
 @app.get("/api/picks")
-async def get_picks():
+async def get_picks(request: Request):
     """
     API endpoint to get current picks as JSON.
     
@@ -62,8 +205,7 @@ async def get_picks():
         JSON response with picks data or error message.
     """
     try:
-        picks = load_picks()
-        return JSONResponse(content=picks.model_dump())
+        return _picks_response(request, picks_store.get())
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="No picks generated yet. Visit /admin to generate picks.")
     except Exception as e:
@@ -71,62 +213,55 @@ async def get_picks():
 
 
 @app.get("/api/picks/list")
-async def list_picks_files():
+async def list_picks_files(page: int = 1, page_size: int = 50):
     """
-    List all available picks JSON files.
+    List available picks JSON files from the picks index.
+    
+    Args:
+        page: 1-based page number.
+        page_size: Files per page (1-500).
     
     Returns:
-        JSON response with list of available files and their metadata.
+        JSON response with one page of files (newest first) and the total count.
     """
     try:
-        data_dir = Path("app/data")
-        json_files = []
+        page_size = min(max(page_size, 1), 500)
+        listing = picks_index.list_files(page, page_size)
         
-        # Find all JSON files except current_picks.json
-        for file in data_dir.glob("*.json"):
-            if file.name == "current_picks.json":
-                continue
-                
-            # Try to extract metadata from filename
-            # Format: week_{week_number}_{date}.json
-            try:
-                parts = file.stem.split("_")
-                if len(parts) >= 3 and parts[0] == "week":
-                    week_num = parts[1]
-                    date_str = "_".join(parts[2:])  # Handle dates with underscores
-                    
-                    json_files.append({
-                        "filename": file.name,
-                        "week": int(week_num),
-                        "date": date_str,
-                        "display_name": f"Week {week_num} - {date_str}"
-                    })
-            except:
-                # If parsing fails, just add the filename
-                json_files.append({
-                    "filename": file.name,
-                    "display_name": file.stem
-                })
-        
-        # Sort by week number (descending) and date (descending)
-        json_files.sort(key=lambda x: (x.get("week", 0), x.get("date", "")), reverse=True)
-        
-        # Add current_picks.json at the top if it exists
-        current_picks_path = data_dir / "current_picks.json"
-        if current_picks_path.exists():
-            json_files.insert(0, {
+        # Add current_picks.json at the top of the first page if it exists
+        if listing["page"] == 1 and picks_exist(CURRENT_PICKS_PATH):
+            listing["files"].insert(0, {
                 "filename": "current_picks.json",
                 "display_name": "Current Week (Latest)"
             })
         
-        return JSONResponse(content={"files": json_files})
+        return JSONResponse(content=listing)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error listing picks files: {str(e)}")
 
 
+@app.get("/api/players/{player_name}/picks")
+async def get_player_history(player_name: str, limit: int = 100):
+    """
+    Get every historical pick for a player across weeks.
+    
+    Args:
+        player_name: Player name (case and punctuation are ignored).
+        limit: Maximum number of picks to return.
+        
+    Returns:
+        JSON response with the player's picks, newest week first.
+    """
+    try:
+        picks = picks_index.player_history(player_name, limit)
+        return JSONResponse(content={"player": player_name, "count": len(picks), "picks": picks})
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error querying picks index: {str(e)}")
+
+
 @app.get("/api/picks/{filename}")
-async def get_picks_by_filename(filename: str):
+async def get_picks_by_filename(filename: str, request: Request):
     """
     Get picks from a specific JSON file.
     
@@ -144,8 +279,7 @@ async def get_picks_by_filename(filename: str):
         if not filepath.resolve().is_relative_to(Path("app/data").resolve()):
             raise HTTPException(status_code=403, detail="Access denied")
         
-        picks = load_picks(str(filepath))
-        return JSONResponse(content=picks.model_dump())
+        return _picks_response(request, picks_store.get(filepath))
         
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"File {filename} not found")
@@ -158,16 +292,17 @@ async def admin_page(request: Request):
     """
     Admin page for configuring variables and triggering pick generation.
     """
+    config = settings_store.current()
+    
     # Get current prompt preview
     try:
-        prompt_preview = render_prompt()
+        prompt_preview = await render_prompt_async(config)
     except Exception as e:
         prompt_preview = f"Error rendering prompt: {str(e)}"
     
     # Try to load current picks for display
     try:
-        picks = load_picks()
-        picks_json = picks.model_dump_json(indent=2)
+        picks_json = picks_store.get().pretty_json
     except:
         picks_json = None
     
@@ -175,52 +310,187 @@ async def admin_page(request: Request):
         "admin.html",
         {
             "request": request,
-            "settings": settings,
+            "settings": config,
             "prompt_preview": prompt_preview,
             "picks_json": picks_json
         }
     )
 
 
+def _generation_job_key(config: Settings, bypass_cache: bool = False) -> str:
+    """Identify a generation request by its inputs so duplicates coalesce."""
+    inputs = config.model_dump_json(exclude={"openai_api_key"}) + (":fresh" if bypass_cache else "")
+    return hashlib.sha256(inputs.encode("utf-8")).hexdigest()
+
+
 @app.post("/admin/run")
 async def run_generation(
+    request: Request,
     espn_game_data_link: str = Form(...),
     slate_description: str = Form(...),
     note: str = Form(...),
     focus_games: str = Form(...),
     prop_focus: str = Form(...),
     min_articles_for_sentiment: int = Form(...),
-    include_long_shots: bool = Form(False)
+    include_long_shots: bool = Form(False),
+    bypass_cache: bool = Form(False)
 ):
     """
-    Trigger AI generation of weekly picks with provided configuration.
+    Queue AI generation of weekly picks with provided configuration.
     
-    Updates settings, calls OpenAI, saves results, and redirects to dashboard.
+    Updates settings and enqueues a background job that calls OpenAI and saves
+    the results. Returns the job ID immediately (JSON for API/AJAX callers,
+    redirect to the admin page for plain form posts). Submitting the same
+    configuration while a job is still running returns that job.
+    
+    A request identical to an earlier one is answered from the completion
+    cache; set bypass_cache to force a fresh generation.
+    
+    Errors are a JSON {"detail": ...} body for JSON callers (400 for invalid
+    settings, 500 otherwise) and a redirect with the error for form posts.
     """
+    wants_json = "application/json" in request.headers.get("accept", "")
     try:
-        # Update settings with form values
-        settings.espn_game_data_link = espn_game_data_link
-        settings.slate_description = slate_description
-        settings.note = note
-        settings.focus_games = focus_games
-        settings.prop_focus = prop_focus
-        settings.min_articles_for_sentiment = min_articles_for_sentiment
-        settings.include_long_shots = include_long_shots
+        # Save the form values for every worker
+        config = settings_store.update(
+            espn_game_data_link=espn_game_data_link,
+            slate_description=slate_description,
+            note=note,
+            focus_games=focus_games,
+            prop_focus=prop_focus,
+            min_articles_for_sentiment=min_articles_for_sentiment,
+            include_long_shots=include_long_shots
+        )
         
-        # Generate picks using OpenAI structured outputs
-        picks = generate_picks()
+        # Settings snapshots are never mutated, so later config edits don't affect this job
+        job, coalesced = job_manager.submit(
+            _generation_job_key(config, bypass_cache),
+            generate_and_save_picks,
+            config,
+            description=f"Picks for {config.espn_game_data_link}",
+            bypass_cache=bypass_cache
+        )
         
-        # Save to file
-        save_picks(picks)
+        if not wants_json:
+            return RedirectResponse(url=f"/admin?job_id={job.id}", status_code=303)
         
-        # Redirect to dashboard to view results
-        return RedirectResponse(url="/?success=true", status_code=303)
+        return JSONResponse(status_code=202, content={
+            "job_id": job.id,
+            "status": job.status,
+            "coalesced": coalesced,
+            "status_url": f"/api/jobs/{job.id}",
+            "result_url": f"/api/jobs/{job.id}/result"
+        })
         
     except Exception as e:
+        if wants_json:
+            return JSONResponse(status_code=400 if isinstance(e, ValueError) else 500,
+                                content={"detail": f"Error queueing generation: {str(e)}"})
         # Return to admin page with error
         return RedirectResponse(url=f"/admin?error={str(e)}", status_code=303)
 
 
+def _sse_event(event: str, data: dict) -> str:
+    """Format one Server-Sent Events message."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def stream_and_save_picks(config: Settings, progress=None, events: Optional[JobEvents] = None) -> WeeklyPicksModel:
+    """
+    Job body for streamed generation: run generate_picks_stream() and publish its events.
+    
+    Args:
+        config: Settings to generate with
+        progress: Job stage callback
+        events: Log that every viewer of the job follows (closed by the job manager)
+    
+    Returns:
+        The saved picks
+    """
+    picks = None
+    try:
+        for event, data in generate_picks_stream(config=config):
+            if events is not None:
+                events.publish(event, data)
+            if event == "stage" and progress:
+                progress(data["stage"])
+            elif event == "done":
+                picks = WeeklyPicksModel.model_validate(data["picks"])
+    except Exception as e:
+        if events is not None:
+            events.publish("error", {"error": str(e)})
+        raise
+    if picks is None:
+        raise RuntimeError("Stream ended without a picks document")
+    return picks
+
+
+async def _poll_job_events(job_id: str, interval_seconds: float = 1.0):
+    """Report a job without an event log here (another worker's, or a /admin/run job) from its status."""
+    reported = 0
+    while True:
+        job = await asyncio.to_thread(job_manager.get, job_id)
+        if job is None:
+            yield "error", {"error": f"Lost track of job {job_id}"}
+            return
+        for stage in job.stages[reported:]:
+            yield "stage", {"stage": stage["stage"]}
+        reported = len(job.stages)
+        if job.status == "succeeded":
+            yield "done", {"picks": job.result.model_dump()}
+            return
+        if job.status == "failed":
+            yield "error", {"error": job.error or "Generation failed"}
+            return
+        await asyncio.sleep(interval_seconds)
+
+
+@app.post("/api/generate/stream")
+async def stream_generation():
+    """
+    Generate picks with the current settings, streaming players as they arrive.
+    
+    Runs as a generation job, so a request with the same settings as a job
+    that is still running follows that job instead of calling OpenAI again.
+    Viewers of a streamed job in this worker get every event from the start;
+    viewers of any other job get its stages and the final picks.
+    
+    Server-Sent Events:
+        job: {"job_id", "coalesced"} first
+        stage: {"stage": ...} as each generation stage completes
+        pick: {"category", "player", "warning"} for each validated player
+        done: {"picks": ...} with the full saved document
+        error: {"error": ...} if generation fails
+    """
+    config = settings_store.current()
+    events = JobEvents()
+    job, coalesced = job_manager.submit(
+        _generation_job_key(config),
+        stream_and_save_picks,
+        config,
+        description=f"Streamed picks for {config.espn_game_data_link}",
+        events=events
+    )
+    # The job drops its log when it finishes; a viewer that arrives later polls instead
+    log = job.events if coalesced else events
+    
+    async def sse():
+        yield _sse_event("job", {"job_id": job.id, "coalesced": coalesced})
+        # Following a log waits on a condition, so it runs in the threadpool
+        source = iterate_in_threadpool(log.follow()) if log else _poll_job_events(job.id)
+        try:
+            async for event, data in source:
+                yield _sse_event(event, data)
+        except Exception as e:
+            yield _sse_event("error", {"error": str(e)})
+    
+    return StreamingResponse(
+        sse(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @app.post("/admin/update-config")
 async def update_config(
     espn_game_data_link: str = Form(...),
@@ -237,18 +507,21 @@ async def update_config(
     Updates settings and returns JSON response for AJAX call.
     """
     try:
-        # Update settings with form values
-        settings.espn_game_data_link = espn_game_data_link
-        settings.slate_description = slate_description
-        settings.note = note
-        settings.focus_games = focus_games
-        settings.prop_focus = prop_focus
-        settings.min_articles_for_sentiment = min_articles_for_sentiment
-        settings.include_long_shots = include_long_shots
+        # Save the form values for every worker
+        config = settings_store.update(
+            espn_game_data_link=espn_game_data_link,
+            slate_description=slate_description,
+            note=note,
+            focus_games=focus_games,
+            prop_focus=prop_focus,
+            min_articles_for_sentiment=min_articles_for_sentiment,
+            include_long_shots=include_long_shots
+        )
         
         return JSONResponse(content={
             "success": True,
-            "message": "Configuration updated successfully"
+            "message": "Configuration updated successfully",
+            "version": settings_store.version
         })
         
     except Exception as e:
@@ -273,11 +546,8 @@ async def save_prompt(prompt_content: str = Form(...)):
         Redirect back to admin page with success/error message.
     """
     try:
-        # Save to the prompt template file
-        prompt_path = Path(__file__).parent / "prompts" / "weekly_picks.txt"
-        
-        with open(prompt_path, "w", encoding="utf-8") as f:
-            f.write(prompt_content)
+        # Validate, save and recompile the template (rejected templates are not written)
+        prompt_template.save(prompt_content)
         
         # Redirect to admin page with success message
         return RedirectResponse(url="/admin?prompt_saved=true", status_code=303)
@@ -293,16 +563,18 @@ async def get_config():
     Get current configuration settings.
     
     Returns:
-        JSON response with current settings.
+        JSON response with current settings and their version.
     """
+    config = settings_store.current()
     return JSONResponse(content={
-        "espn_game_data_link": settings.espn_game_data_link,
-        "slate_description": settings.slate_description,
-        "note": settings.note,
-        "focus_games": settings.focus_games,
-        "prop_focus": settings.prop_focus,
-        "min_articles_for_sentiment": settings.min_articles_for_sentiment,
-        "include_long_shots": settings.include_long_shots
+        "espn_game_data_link": config.espn_game_data_link,
+        "slate_description": config.slate_description,
+        "note": config.note,
+        "focus_games": config.focus_games,
+        "prop_focus": config.prop_focus,
+        "min_articles_for_sentiment": config.min_articles_for_sentiment,
+        "include_long_shots": config.include_long_shots,
+        "version": settings_store.version
     })
 
 
@@ -315,10 +587,7 @@ async def get_prompt_template():
         JSON response with the template content.
     """
     try:
-        prompt_path = Path(__file__).parent / "prompts" / "weekly_picks.txt"
-        with open(prompt_path, "r", encoding="utf-8") as f:
-            template = f.read()
-        return JSONResponse(content={"template": template})
+        return JSONResponse(content={"template": prompt_template.text})
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error reading template: {str(e)}")
 
@@ -329,25 +598,31 @@ async def get_prompt_preview():
     Get the fully rendered prompt with current settings and selected games.
     
     Returns:
-        JSON response with the rendered prompt.
+        JSON response with the rendered prompt and its token accounting.
     """
     try:
-        prompt = render_prompt()
-        return JSONResponse(content={"prompt": prompt})
+        prompt = await render_prompt_async(settings_store.current())
+        return JSONResponse(content={"prompt": prompt, "stats": get_last_render_stats()})
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error rendering prompt: {str(e)}")
 
 
 @app.get("/api/games")
-async def get_games():
+async def get_games(source: Optional[str] = None):
     """
     Fetch and return live game data from ESPN with time slot grouping.
     
+    Args:
+        source: "html" (schedule page) or "json" (scoreboard API); defaults to ESPN_SCHEDULE_SOURCE
+    
     Returns:
         JSON response with scraped game data grouped by time slots.
     """
+    if source is not None and source not in SCHEDULE_SOURCES:
+        raise HTTPException(status_code=400, detail=f"Unknown schedule source '{source}'")
     try:
-        games, metadata = scrape_espn_schedule(settings.espn_game_data_link)
+        config = settings_store.current()
+        games, metadata = await get_cached_schedule_async(config.espn_game_data_link, source)
         game_list = [game.to_dict() for game in games]
         
         # Group games by time slot
@@ -361,7 +636,7 @@ async def get_games():
             "metadata": metadata,
             "games": game_list,
             "time_slots": time_slots,
-            "formatted": format_games_for_prompt(games, settings.focus_games, settings.selected_game_ids if settings.use_game_selection else None)
+            "formatted": format_games_for_prompt(games, config.focus_games, config.selected_game_ids if config.use_game_selection else None)
         })
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching games: {str(e)}")
@@ -388,9 +663,8 @@ async def select_games(request: Request):
         if not isinstance(game_ids, list):
             raise HTTPException(status_code=400, detail="game_ids must be a list")
         
-        # Update settings
-        settings.selected_game_ids = game_ids
-        settings.use_game_selection = True
+        # Save the selection for every worker
+        settings_store.update(selected_game_ids=game_ids, use_game_selection=True)
         
         return JSONResponse(content={
             "success": True,
@@ -401,15 +675,88 @@ async def select_games(request: Request):
         raise HTTPException(status_code=500, detail=f"Error selecting games: {str(e)}")
 
 
+@app.get("/api/jobs/{job_id}")
+async def get_job_status(job_id: str):
+    """
+    Get the status and completed stages of a generation job.
+    
+    Stages are reported in order: prompt_rendered, model_called, validated, saved.
+    
+    Args:
+        job_id: ID returned by /admin/run.
+        
+    Returns:
+        JSON response with job status.
+    """
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return JSONResponse(content=job.to_dict())
+
+
+@app.get("/api/jobs/{job_id}/result")
+async def get_job_result(job_id: str):
+    """
+    Get the generated picks for a finished job.
+    
+    Args:
+        job_id: ID returned by /admin/run.
+        
+    Returns:
+        JSON response with picks data, or 202 with the job status if it's still running.
+    """
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    if job.status == "failed":
+        raise HTTPException(status_code=500, detail=f"Generation failed: {job.error}")
+    if job.status != "succeeded":
+        return JSONResponse(status_code=202, content=job.to_dict())
+    return JSONResponse(content=job.result.model_dump())
+
+
+@app.get("/api/cache/stats")
+async def get_cache_stats():
+    """
+    Report hit/miss counters for the in-process caches.
+    
+    Returns:
+        JSON response with per-cache statistics.
+    """
+    return JSONResponse(content={
+        "depth_chart": depth_chart_cache.stats(),
+        "schedule": schedule_cache.stats(),
+        "prompt_template": prompt_template.stats(),
+        "rendered_prompts": rendered_prompt_cache.stats(),
+        "picks": picks_store.stats(),
+        "completions": completion_cache.stats(),
+        "settings": settings_store.stats(),
+        "openai": openai_clients.stats(),
+        "warmup": cache_warmer.status()
+    })
+
+
 @app.get("/health")
-async def health_check():
+async def health_check(ready: bool = False):
     """
     Health check endpoint for monitoring.
     
+    Args:
+        ready: Readiness mode; also report cache warmth and answer 503 until
+            the warm-up has filled every required cache once
+    
     Returns:
         JSON response with status.
     """
-    return JSONResponse(content={"status": "healthy", "version": "1.0.0"})
+    if not ready:
+        return JSONResponse(content={"status": "healthy", "version": "1.0.0"})
+    
+    warmup = {"enabled": settings.cache_warmup_enabled, **cache_warmer.status()}
+    is_ready = warmup["ready"] or not settings.cache_warmup_enabled
+    return JSONResponse(
+        status_code=200 if is_ready else 503,
+        content={"status": "ready" if is_ready else "warming", "version": "1.0.0", "warmup": warmup}
+    )
 
 
 if __name__ == "__main__":
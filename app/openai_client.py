@@ -0,0 +1,335 @@
+"""Long-lived OpenAI client with retries and a circuit breaker."""
+
+import random
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, Optional, Tuple, TypeVar
+
+from .config import Settings, settings
+
+if TYPE_CHECKING:
+    from openai import OpenAI  # Imported when the first client is built; the SDK is slow to load
+
+T = TypeVar("T")
+
+# Status codes worth retrying: timeouts, conflicts, rate limits and server errors
+RETRYABLE_STATUS_CODES = {408, 409, 429}
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling OpenAI while the circuit breaker is open."""
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Return True for transient OpenAI errors (connection problems, 408/409/429, 5xx)."""
+    openai = sys.modules.get("openai")
+    if openai is None:
+        return False  # The SDK isn't loaded, so this can't be one of its errors
+    if isinstance(error, openai.APIConnectionError):  # Includes APITimeoutError
+        return True
+    if isinstance(error, openai.APIStatusError):
+        return error.status_code in RETRYABLE_STATUS_CODES or error.status_code >= 500
+    return False
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """
+    Read the server's requested delay from an error response.
+
+    Supports retry-after-ms (sent by OpenAI) and Retry-After as seconds or an
+    HTTP date.
+
+    Returns:
+        Seconds to wait, or None if the response didn't say
+    """
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    headers = response.headers
+
+    value = headers.get("retry-after-ms")
+    if value:
+        try:
+            return max(float(value) / 1000, 0.0)
+        except ValueError:
+            pass
+
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter, deferring to Retry-After when present."""
+
+    def __init__(self, max_retries: int = 3, base_delay: float = 1.0, max_delay: float = 30.0,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.sleep = sleep
+
+    def delay(self, attempt: int, error: BaseException) -> float:
+        """
+        Seconds to wait before retry number attempt + 1.
+
+        Args:
+            attempt: Number of failed attempts so far, minus one (0 for the first retry)
+            error: The error that failed the attempt
+
+        Returns:
+            Delay in seconds, never more than max_delay
+        """
+        retry_after = retry_after_seconds(error)
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+
+class CircuitBreaker:
+    """
+    Stops calling OpenAI after repeated transient failures.
+
+    After failure_threshold consecutive failed calls the circuit opens and
+    calls fail fast with CircuitOpenError. Once reset_seconds have passed one
+    trial call is let through (half-open): success closes the circuit, failure
+    opens it again.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_seconds: float = 60.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.clock = clock
+        self.state = "closed"  # "closed", "open" or "half_open"
+        self.failures = 0
+        self.rejected = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_call(self) -> None:
+        """
+        Check that a call may proceed.
+
+        Raises:
+            CircuitOpenError: If the circuit is open (or a half-open trial is already running).
+        """
+        with self._lock:
+            if self.state == "open" and self.clock() - self._opened_at >= self.reset_seconds:
+                self.state = "half_open"
+            if self.state == "half_open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return
+            if self.state != "closed":
+                self.rejected += 1
+                retry_in = max(self.reset_seconds - (self.clock() - self._opened_at), 0.0)
+                raise CircuitOpenError(f"OpenAI circuit breaker is open; retry in {retry_in:.0f}s")
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = "closed"
+            self.failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                if self.state != "open":
+                    print(f"⚠️  OpenAI circuit breaker opened after {self.failures} failed calls")
+                self.state = "open"
+                self._opened_at = self.clock()
+            self._trial_in_flight = False
+
+    def stats(self) -> Dict[str, object]:
+        return {"state": self.state, "failures": self.failures, "rejected": self.rejected}
+
+
+class OpenAIClientManager:
+    """
+    Owns the process-wide OpenAI client and the resilience policy around it.
+
+    The client keeps one pooled httpx connection pool for the life of the
+    app (opened at startup, closed at shutdown) instead of a new client and
+    TLS handshake per generation. The SDK's own retries are disabled; call()
+    applies RetryPolicy and CircuitBreaker to every request instead.
+
+    Requests borrow the client with lease(). When a settings change replaces
+    the client, the old one is closed once its last lease ends, so requests
+    already using it (fan-out workers, running jobs) are not cut off.
+    """
+
+    def __init__(self):
+        self.retry_policy = RetryPolicy()
+        self.breaker = CircuitBreaker()
+        self.calls = 0
+        self.retries = 0
+        self._client: Optional["OpenAI"] = None
+        self._client_key: Optional[Tuple] = None
+        self._leases: Dict[int, int] = {}  # id(client) -> leases in use
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(config: Settings) -> Tuple:
+        return (config.openai_api_key, config.openai_base_url, config.openai_timeout_seconds,
+                config.openai_connect_timeout_seconds, config.openai_max_connections)
+
+    def configure(self, config: Settings) -> None:
+        """Apply retry and circuit breaker settings (breaker state is kept)."""
+        self.retry_policy.max_retries = config.openai_max_retries
+        self.retry_policy.base_delay = config.openai_retry_base_delay
+        self.retry_policy.max_delay = config.openai_retry_max_delay
+        self.breaker.failure_threshold = config.openai_circuit_failure_threshold
+        self.breaker.reset_seconds = config.openai_circuit_reset_seconds
+
+    def get(self, config: Optional[Settings] = None) -> "OpenAI":
+        """
+        Return the shared client, creating it if needed (thread-safe).
+
+        A new client replaces the old one if the API key, endpoint, timeouts
+        or pool size in config differ from the ones it was built with. Use
+        lease() for requests, so a replacement can't close the client mid-request.
+
+        Args:
+            config: Settings to build the client from (defaults to the environment settings)
+
+        Returns:
+            OpenAI client
+        """
+        with self._lock:
+            client, stale = self._current(config or settings)
+        if stale is not None:
+            stale.close()
+        return client
+
+    @contextmanager
+    def lease(self, config: Optional[Settings] = None) -> Iterator["OpenAI"]:
+        """
+        Borrow the shared client for the duration of a request.
+
+        Args:
+            config: Settings to build the client from (defaults to the environment settings)
+
+        Yields:
+            OpenAI client, kept open until the block exits even if it is replaced meanwhile
+        """
+        with self._lock:
+            client, stale = self._current(config or settings)
+            self._leases[id(client)] = self._leases.get(id(client), 0) + 1
+        if stale is not None:
+            stale.close()
+        try:
+            yield client
+        finally:
+            with self._lock:
+                self._leases[id(client)] -= 1
+                retired = False
+                if self._leases[id(client)] == 0:
+                    del self._leases[id(client)]
+                    retired = client is not self._client  # Replaced while leased
+            if retired:
+                client.close()
+
+    def _current(self, config: Settings) -> Tuple["OpenAI", Optional["OpenAI"]]:
+        """Return (client, replaced client that no lease is using, if any). Caller holds the lock."""
+        key = self._key(config)
+        if self._client is not None and self._client_key == key:
+            return self._client, None
+
+        import httpx
+        from openai import DefaultHttpxClient, OpenAI
+        
+        replaced = self._client
+        self.configure(config)
+        self._client = OpenAI(
+            api_key=config.openai_api_key,
+            base_url=config.openai_base_url,
+            max_retries=0,  # Retries are handled by call()
+            http_client=DefaultHttpxClient(
+                timeout=httpx.Timeout(config.openai_timeout_seconds,
+                                      connect=config.openai_connect_timeout_seconds),
+                limits=httpx.Limits(max_connections=config.openai_max_connections,
+                                    max_keepalive_connections=config.openai_max_connections),
+            ),
+        )
+        self._client_key = key
+        # A leased client is closed by its last lease instead
+        stale = replaced if replaced is not None and id(replaced) not in self._leases else None
+        return self._client, stale
+
+    def call(self, request: Callable[[], T]) -> T:
+        """
+        Run one OpenAI request with retries and the circuit breaker.
+
+        Transient errors are retried after RetryPolicy.delay(); once retries
+        run out the failure counts against the circuit breaker. Other errors
+        (bad requests, refusals, parse failures) are raised immediately.
+
+        Args:
+            request: Zero-argument function making the request
+
+        Returns:
+            Whatever request returns
+
+        Raises:
+            CircuitOpenError: If the circuit is open.
+            Exception: The last error from request.
+        """
+        self.breaker.before_call()
+        with self._lock:
+            self.calls += 1
+        attempt = 0
+        while True:
+            try:
+                result = request()
+            except Exception as e:
+                if not is_retryable(e):
+                    self.breaker.record_success()  # The API answered; the request itself failed
+                    raise
+                if attempt >= self.retry_policy.max_retries:
+                    self.breaker.record_failure()
+                    raise
+                delay = self.retry_policy.delay(attempt, e)
+                print(f"⚠️  OpenAI request failed ({e.__class__.__name__}); retrying in {delay:.1f}s")
+                with self._lock:
+                    self.retries += 1
+                self.retry_policy.sleep(delay)
+                attempt += 1
+                continue
+            self.breaker.record_success()
+            return result
+
+    def close(self) -> None:
+        """Close the shared client and its connection pool (called on application shutdown, even if leased)."""
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+            self._client = None
+            self._client_key = None
+
+    def stats(self) -> Dict[str, object]:
+        """Return counters for monitoring."""
+        return {
+            "client_open": self._client is not None,
+            "calls": self.calls,
+            "retries": self.retries,
+            "circuit": self.breaker.stats(),
+        }
+
+
+# Global client manager, opened in the app lifespan and used by ai_client
+openai_clients = OpenAIClientManager()
@@ -0,0 +1,356 @@
+"""Compact msgpack archive format for historical weekly picks.
+
+Usage:
+    python -m app.picks_archive compare [--data-dir app/data]
+    python -m app.picks_archive migrate [--data-dir app/data]
+"""
+
+import argparse
+import importlib.util
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import TypeAdapter
+
+from .atomic_io import atomic_write_bytes, atomic_write_text
+from .models import (
+    LongShotPlayerModel,
+    LongShotPredictionModel,
+    LongShotsModel,
+    MetaModel,
+    PlayerModel,
+    PredictionDetailsModel,
+    WeeklyPicksModel,
+)
+
+# msgpack is optional; without it only the JSON backend is available
+MSGPACK_AVAILABLE = importlib.util.find_spec("msgpack") is not None
+
+ARCHIVE_SUFFIX = ".msgpack"
+POINTER_SUFFIX = ".ptr"  # Small file naming the archive that holds the current picks
+ARCHIVE_FORMAT = "weekly-picks-archive"
+ARCHIVE_VERSION = 1
+
+ARCHIVE_SECTIONS = ("qbs", "rbs", "wrs", "tes", "long_shots")
+PREDICTION_FIELDS = tuple(PredictionDetailsModel.model_fields)
+
+_PLAYER_LIST = TypeAdapter(List[PlayerModel])
+
+
+def _msgpack():
+    if not MSGPACK_AVAILABLE:
+        raise Exception("The archive backend requires msgpack (pip install msgpack)")
+    import msgpack
+    return msgpack
+
+
+class _StringTable:
+    """Interns repeated strings (teams, games, source names, stat names) as integer ids."""
+
+    def __init__(self):
+        self.strings: List[str] = []
+        self._ids: Dict[str, int] = {}
+
+    def intern(self, value: str) -> int:
+        string_id = self._ids.get(value)
+        if string_id is None:
+            string_id = self._ids[value] = len(self.strings)
+            self.strings.append(value)
+        return string_id
+
+
+def _encode_player(player: PlayerModel, table: _StringTable) -> list:
+    return [
+        player.name, table.intern(player.team), table.intern(player.position), table.intern(player.game),
+        player.matchup_note, table.intern(player.injury_status), player.verified,
+        player.what_to_target, player.why,
+        [[table.intern(s.name), table.intern(s.sentiment)] for s in player.sources],
+        [[table.intern(s.stat), s.line, table.intern(s.type), table.intern(s.lean)] for s in player.suggestions],
+    ]
+
+
+def _encode_prediction(prediction: LongShotPredictionModel, table: _StringTable) -> list:
+    details = [getattr(prediction.prediction, field) for field in PREDICTION_FIELDS]
+    return [prediction.label, details, table.intern(prediction.odds_bucket_estimate)]
+
+
+def _encode_long_shot(player: LongShotPlayerModel, table: _StringTable) -> list:
+    return [
+        player.name, table.intern(player.team), table.intern(player.position), table.intern(player.game),
+        _encode_prediction(player.long_shot, table), _encode_prediction(player.ultra_long_shot, table),
+    ]
+
+
+def encode_picks(picks: WeeklyPicksModel) -> bytes:
+    """
+    Serialize picks into the archive format.
+
+    Each category is packed as its own blob so readers can decode one
+    category without touching the others. Repeated strings are stored
+    once in a shared string table.
+
+    Args:
+        picks: Picks to archive
+
+    Returns:
+        Archive bytes
+    """
+    msgpack = _msgpack()
+    table = _StringTable()
+    rows = {
+        category: [_encode_player(p, table) for p in getattr(picks.categories, category)]
+        for category in ARCHIVE_SECTIONS[:-1]
+    }
+    rows["long_shots"] = [_encode_long_shot(p, table) for p in picks.long_shots.players]
+
+    meta = picks.meta
+    return msgpack.packb({
+        "format": ARCHIVE_FORMAT,
+        "version": ARCHIVE_VERSION,
+        "meta": [meta.week, meta.date, meta.slate_description, meta.note],
+        "strings": table.strings,
+        "sections": {name: msgpack.packb(section) for name, section in rows.items()},
+    })
+
+
+class PicksArchive:
+    """
+    A decoded archive header with lazily decoded categories.
+
+    Opening an archive only unpacks the metadata and string table; each
+    category is decoded (and validated) on first access.
+    """
+
+    def __init__(self, data: bytes):
+        self._msgpack = _msgpack()
+        header = self._msgpack.unpackb(data)
+        if header.get("format") != ARCHIVE_FORMAT or header.get("version") != ARCHIVE_VERSION:
+            raise Exception("Unsupported picks archive format")
+        self.strings: List[str] = header["strings"]
+        week, date, slate_description, note = header["meta"]
+        self.meta = MetaModel(week=week, date=date, slate_description=slate_description, note=note)
+        self._sections: Dict[str, bytes] = header["sections"]
+        self._decoded: Dict[str, list] = {}
+
+    @classmethod
+    def open(cls, path: Union[str, Path]) -> "PicksArchive":
+        """Read an archive file."""
+        with open(path, "rb") as f:
+            return cls(f.read())
+
+    def _player_dicts(self, name: str) -> List[Dict[str, Any]]:
+        s = self.strings
+        return [
+            {
+                "name": row[0], "team": s[row[1]], "position": s[row[2]], "game": s[row[3]],
+                "matchup_note": row[4], "injury_status": s[row[5]], "verified": row[6],
+                "what_to_target": row[7], "why": row[8],
+                "sources": [{"name": s[a], "sentiment": s[b]} for a, b in row[9]],
+                "suggestions": [
+                    {"stat": s[stat], "line": line, "type": s[kind], "lean": s[lean]}
+                    for stat, line, kind, lean in row[10]
+                ],
+            }
+            for row in self._msgpack.unpackb(self._sections[name])
+        ]
+
+    def _prediction_dict(self, row: list) -> Dict[str, Any]:
+        label, details, odds = row
+        return {
+            "label": label,
+            "prediction": dict(zip(PREDICTION_FIELDS, details)),
+            "odds_bucket_estimate": self.strings[odds],
+        }
+
+    def _long_shot_dicts(self) -> List[Dict[str, Any]]:
+        s = self.strings
+        return [
+            {
+                "name": row[0], "team": s[row[1]], "position": s[row[2]], "game": s[row[3]],
+                "long_shot": self._prediction_dict(row[4]),
+                "ultra_long_shot": self._prediction_dict(row[5]),
+            }
+            for row in self._msgpack.unpackb(self._sections["long_shots"])
+        ]
+
+    def category(self, name: str) -> List[PlayerModel]:
+        """Decode one player category ("qbs", "rbs", "wrs" or "tes")."""
+        if name not in self._decoded:
+            self._decoded[name] = _PLAYER_LIST.validate_python(self._player_dicts(name))
+        return self._decoded[name]
+
+    def long_shots(self) -> LongShotsModel:
+        """Decode the long shots section."""
+        return LongShotsModel.model_validate({"players": self._long_shot_dicts()})
+
+    def to_model(self) -> WeeklyPicksModel:
+        """Decode every section into a WeeklyPicksModel in one validation pass."""
+        return WeeklyPicksModel.model_validate({
+            "meta": self.meta,
+            "categories": {name: self._player_dicts(name) for name in ARCHIVE_SECTIONS[:-1]},
+            "long_shots": {"players": self._long_shot_dicts()},
+        })
+
+
+def write_archive(path: Union[str, Path], picks: WeeklyPicksModel) -> int:
+    """Write picks as an archive file; returns the number of bytes written."""
+    data = encode_picks(picks)
+    atomic_write_bytes(path, data)
+    return len(data)
+
+
+def read_archive(path: Union[str, Path]) -> WeeklyPicksModel:
+    """Read a whole archive file into a WeeklyPicksModel."""
+    return PicksArchive.open(path).to_model()
+
+
+def write_pointer(path: Union[str, Path], target: Union[str, Path]) -> None:
+    """Point path (e.g. current_picks.ptr) at an archive in the same directory."""
+    atomic_write_text(path, Path(target).name)
+
+
+def resolve_picks_path(filepath: Union[str, Path]) -> List[Path]:
+    """
+    Find the file that holds the picks requested as filepath.
+
+    A JSON path that no longer exists falls back to an archive with the
+    same stem, then to a pointer file with the same stem, so URLs and
+    callers keep using the .json names after migration.
+
+    Args:
+        filepath: Requested picks path
+
+    Returns:
+        Files the picks depend on; the last one holds the data
+        (a pointer is followed by its target)
+
+    Raises:
+        FileNotFoundError: If no JSON, archive or pointer exists
+    """
+    path = Path(filepath)
+    candidates = [path]
+    if path.suffix == ".json":
+        candidates += [path.with_suffix(ARCHIVE_SUFFIX), path.with_suffix(POINTER_SUFFIX)]
+    for candidate in candidates:
+        if not candidate.exists():
+            continue
+        if candidate.suffix == POINTER_SUFFIX:
+            target = candidate.parent / candidate.read_text(encoding="utf-8").strip()
+            if not target.exists():
+                raise FileNotFoundError(f"{candidate} points to missing {target}")
+            return [candidate, target]
+        return [candidate]
+    raise FileNotFoundError(f"No picks file at {path}")
+
+
+def load_picks_file(path: Path) -> WeeklyPicksModel:
+    """Load a JSON or archive picks file (no caching)."""
+    if path.suffix == ARCHIVE_SUFFIX:
+        return read_archive(path)
+    with open(path, "r", encoding="utf-8") as f:
+        return WeeklyPicksModel.model_validate_json(f.read())
+
+
+def _timed(func, repeat: int = 20) -> float:
+    """Best-of-N wall time in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def compare(data_dir: Union[str, Path] = "app/data") -> List[Dict[str, Any]]:
+    """
+    Compare size and load latency of each JSON picks file against its archive form.
+
+    Args:
+        data_dir: Directory holding the picks JSON files
+
+    Returns:
+        One row per file with sizes (bytes) and load times (ms)
+    """
+    results = []
+    for path in sorted(Path(data_dir).glob("*.json")):
+        raw = path.read_bytes()
+        picks = WeeklyPicksModel.model_validate_json(raw)
+        archive = encode_picks(picks)
+        results.append({
+            "file": path.name,
+            "json_bytes": len(raw),
+            "archive_bytes": len(archive),
+            "size_ratio": round(len(archive) / len(raw), 3),
+            "json_load_ms": round(_timed(lambda: WeeklyPicksModel.model_validate_json(raw)), 3),
+            "archive_load_ms": round(_timed(lambda: PicksArchive(archive).to_model()), 3),
+            "archive_one_category_ms": round(_timed(lambda: PicksArchive(archive).category("qbs")), 3),
+        })
+    return results
+
+
+def migrate(data_dir: Union[str, Path] = "app/data") -> Dict[str, Any]:
+    """
+    Convert JSON picks files in data_dir to archives.
+
+    Every archive is decoded and compared with the original before the JSON
+    file is removed. current_picks.json becomes a pointer when its content
+    matches a dated file, so the current week is stored only once.
+
+    Args:
+        data_dir: Directory holding the picks JSON files
+
+    Returns:
+        Summary with migrated file names and bytes before/after
+    """
+    data_dir = Path(data_dir)
+    summary: Dict[str, Any] = {"migrated": [], "pointer": None, "bytes_before": 0, "bytes_after": 0}
+    current_path = data_dir / "current_picks.json"
+    current = load_picks_file(current_path) if current_path.exists() else None
+    current_target: Optional[Path] = None
+
+    for path in sorted(data_dir.glob("week_*.json")):
+        picks = load_picks_file(path)
+        archive_path = path.with_suffix(ARCHIVE_SUFFIX)
+        summary["bytes_before"] += path.stat().st_size
+        summary["bytes_after"] += write_archive(archive_path, picks)
+        if read_archive(archive_path).model_dump() != picks.model_dump():
+            archive_path.unlink()
+            raise Exception(f"Archive round trip mismatch for {path.name}; JSON file kept")
+        if current is not None and picks.model_dump() == current.model_dump():
+            current_target = archive_path
+        path.unlink()
+        summary["migrated"].append(path.name)
+
+    if current_target is not None:
+        summary["bytes_before"] += current_path.stat().st_size
+        pointer_path = current_path.with_suffix(POINTER_SUFFIX)
+        write_pointer(pointer_path, current_target)
+        current_path.unlink()
+        summary["bytes_after"] += pointer_path.stat().st_size
+        summary["pointer"] = current_target.name
+    return summary
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Compact archive storage for weekly picks")
+    parser.add_argument("command", choices=["compare", "migrate"])
+    parser.add_argument("--data-dir", default="app/data")
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        rows = compare(args.data_dir)
+        print(f"{'file':<28} {'json B':>8} {'arch B':>8} {'ratio':>6} {'json ms':>8} {'arch ms':>8} {'1 cat ms':>8}")
+        for row in rows:
+            print(f"{row['file']:<28} {row['json_bytes']:>8} {row['archive_bytes']:>8} {row['size_ratio']:>6} "
+                  f"{row['json_load_ms']:>8} {row['archive_load_ms']:>8} {row['archive_one_category_ms']:>8}")
+    else:
+        summary = migrate(args.data_dir)
+        print(json.dumps(summary, indent=2))
+        print(f"✅ Migrated {len(summary['migrated'])} files: "
+              f"{summary['bytes_before']} -> {summary['bytes_after']} bytes")
+
+
+if __name__ == "__main__":
+    main()
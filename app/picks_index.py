@@ -0,0 +1,244 @@
+"""SQLite index of historical picks files."""
+
+import os
+import re
+import sqlite3
+import threading
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .config import settings
+from .models import WeeklyPicksModel
+from .picks_archive import ARCHIVE_SUFFIX
+from .picks_store import PICKS_DATA_DIR, picks_store
+from .picks_stream import PLAYER_CATEGORIES
+
+# Index database, kept next to the picks files it describes
+DEFAULT_INDEX_PATH = PICKS_DATA_DIR / "picks_index.sqlite3"
+
+# Historical filenames: week_{week_number}_{date}.json (or .msgpack when archived)
+HISTORY_FILENAME_PATTERN = re.compile(r"^week_(\d+)_(.+)\.(?:json|msgpack)$")
+HISTORY_SUFFIXES = (".json", ARCHIVE_SUFFIX)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    filename TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    week INTEGER,
+    date TEXT,
+    slate_description TEXT,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    player_count INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS files_by_week ON files (week, date);
+CREATE TABLE IF NOT EXISTS players (
+    filename TEXT NOT NULL REFERENCES files (filename) ON DELETE CASCADE,
+    category TEXT NOT NULL,
+    name TEXT NOT NULL,
+    name_key TEXT NOT NULL,
+    team TEXT NOT NULL,
+    position TEXT NOT NULL,
+    game TEXT NOT NULL,
+    what_to_target TEXT
+);
+CREATE INDEX IF NOT EXISTS players_by_name ON players (name_key);
+CREATE INDEX IF NOT EXISTS players_by_file ON players (filename);
+"""
+
+
+def player_key(name: str) -> str:
+    """Case/punctuation-insensitive key used for player queries."""
+    return " ".join(re.sub(r"[^a-z0-9 ]", "", name.lower()).split())
+
+
+def _player_rows(filename: str, picks: WeeklyPicksModel) -> List[Tuple]:
+    """One row per player pick in a picks document."""
+    rows = []
+    for category in PLAYER_CATEGORIES:
+        for player in getattr(picks.categories, category):
+            rows.append((filename, category, player.name, player_key(player.name),
+                         player.team, player.position, player.game, player.what_to_target))
+    if picks.long_shots:
+        for player in picks.long_shots.players:
+            rows.append((filename, "long_shots", player.name, player_key(player.name),
+                         player.team, player.position, player.game, player.long_shot.label))
+    return rows
+
+
+class PicksIndex:
+    """
+    Persistent index of the dated picks files in app/data.
+
+    save_picks() adds each new file as it is written; sync() reconciles the
+    index with the directory in one transaction (new, changed and deleted
+    files), so listing and cross-week player queries never glob or parse
+    the JSON files.
+    """
+
+    def __init__(self, db_path: Union[str, Path] = DEFAULT_INDEX_PATH,
+                 data_dir: Union[str, Path] = PICKS_DATA_DIR):
+        self.db_path = Path(db_path)
+        self.data_dir = Path(data_dir)
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection, creating the schema on first use."""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.db_path)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA foreign_keys = ON")
+        if not self._initialized:
+            connection.executescript(SCHEMA)
+            self._initialized = True
+        return connection
+
+    def _is_history_file(self, path: Path) -> bool:
+        return (path.suffix in HISTORY_SUFFIXES and path.name != "current_picks.json"
+                and os.path.abspath(path.parent) == os.path.abspath(self.data_dir))
+
+    def _file_row(self, path: Path, picks: WeeklyPicksModel, player_count: int) -> Tuple:
+        stat = os.stat(path)
+        match = HISTORY_FILENAME_PATTERN.match(path.name)
+        week = int(match.group(1)) if match else None
+        date = match.group(2) if match else None
+        return (path.name, str(path), week, date, picks.meta.slate_description,
+                stat.st_size, stat.st_mtime_ns, player_count)
+
+    def _write(self, connection: sqlite3.Connection, path: Path, picks: WeeklyPicksModel) -> None:
+        """Replace one file's rows. Caller manages the transaction."""
+        players = _player_rows(path.name, picks)
+        # The same week saved in the other format replaces the old row
+        connection.executemany("DELETE FROM files WHERE filename = ?",
+                               [(path.stem + suffix,) for suffix in HISTORY_SUFFIXES])
+        connection.execute("INSERT INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                           self._file_row(path, picks, len(players)))
+        connection.executemany("INSERT INTO players VALUES (?, ?, ?, ?, ?, ?, ?, ?)", players)
+
+    def add(self, filepath: Union[str, Path], picks: WeeklyPicksModel) -> bool:
+        """
+        Index a picks file that was just written.
+
+        Args:
+            filepath: Path of the saved file
+            picks: The saved picks
+
+        Returns:
+            True if indexed, False if the file is not a history file in data_dir
+        """
+        path = Path(filepath)
+        if not self._is_history_file(path):
+            return False
+        with self._lock, closing(self._connect()) as connection, connection:
+            self._write(connection, path, picks)
+        return True
+
+    def sync(self) -> Dict[str, int]:
+        """
+        Bring the index in line with the files on disk in one bulk pass.
+
+        Files whose size and mtime match their index row are skipped; new or
+        changed files are parsed and re-indexed, and rows for deleted files
+        are dropped. Files that fail validation are left out of the index.
+
+        Returns:
+            Counts of indexed, unchanged, removed and invalid files
+        """
+        counts = {"indexed": 0, "unchanged": 0, "removed": 0, "invalid": 0}
+        with self._lock, closing(self._connect()) as connection, connection:
+            known = {
+                row["filename"]: (row["size"], row["mtime_ns"])
+                for row in connection.execute("SELECT filename, size, mtime_ns FROM files")
+            }
+            on_disk = set()
+            paths = [p for suffix in HISTORY_SUFFIXES for p in self.data_dir.glob(f"*{suffix}")]
+            for path in sorted(paths):
+                if not self._is_history_file(path):
+                    continue
+                on_disk.add(path.name)
+                stat = os.stat(path)
+                if known.get(path.name) == (stat.st_size, stat.st_mtime_ns):
+                    counts["unchanged"] += 1
+                    continue
+                try:
+                    picks = picks_store.get(path).picks
+                except Exception as e:
+                    print(f"⚠️  Skipping {path.name} in picks index: {e}")
+                    connection.execute("DELETE FROM files WHERE filename = ?", (path.name,))
+                    counts["invalid"] += 1
+                    continue
+                self._write(connection, path, picks)
+                counts["indexed"] += 1
+
+            removed = [(name,) for name in known if name not in on_disk]
+            connection.executemany("DELETE FROM files WHERE filename = ?", removed)
+            counts["removed"] = len(removed)
+        return counts
+
+    def list_files(self, page: int = 1, page_size: int = 50) -> Dict[str, Any]:
+        """
+        Return one page of indexed files, newest week/date first.
+
+        Args:
+            page: 1-based page number
+            page_size: Files per page
+
+        Returns:
+            Dict with files, total, page and page_size
+        """
+        page = max(page, 1)
+        with closing(self._connect()) as connection:
+            total = connection.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+            rows = connection.execute(
+                "SELECT * FROM files ORDER BY COALESCE(week, 0) DESC, COALESCE(date, '') DESC, filename "
+                "LIMIT ? OFFSET ?",
+                (page_size, (page - 1) * page_size)
+            ).fetchall()
+        files = []
+        for row in rows:
+            entry = {
+                "filename": row["filename"],
+                "slate_description": row["slate_description"],
+                "size": row["size"],
+                "player_count": row["player_count"],
+            }
+            if row["week"] is not None:
+                entry.update({
+                    "week": row["week"],
+                    "date": row["date"],
+                    "display_name": f"Week {row['week']} - {row['date']}",
+                })
+            else:
+                entry["display_name"] = Path(row["filename"]).stem
+            files.append(entry)
+        return {"files": files, "total": total, "page": page, "page_size": page_size}
+
+    def player_history(self, name: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Return every indexed pick for a player across weeks, newest first.
+
+        Args:
+            name: Player name (case and punctuation are ignored)
+            limit: Maximum rows to return
+
+        Returns:
+            List of pick rows with week, date and file details
+        """
+        query = (
+            "SELECT p.category, p.name, p.team, p.position, p.game, p.what_to_target, "
+            "f.filename, f.week, f.date, f.slate_description "
+            "FROM players p JOIN files f ON f.filename = p.filename "
+            "WHERE p.name_key = ? ORDER BY COALESCE(f.week, 0) DESC, COALESCE(f.date, '') DESC"
+        )
+        params: Tuple = (player_key(name),)
+        if limit is not None:
+            query += " LIMIT ?"
+            params += (limit,)
+        with closing(self._connect()) as connection:
+            return [dict(row) for row in connection.execute(query, params)]
+
+
+# Global index of app/data, maintained by save_picks() and synced at startup
+picks_index = PicksIndex(settings.picks_index_path)
@@ -0,0 +1,235 @@
+"""In-memory repository of validated picks files."""
+
+import gzip
+import hashlib
+import importlib.util
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+from .models import WeeklyPicksModel
+from .picks_archive import load_picks_file, resolve_picks_path
+
+# Brotli is optional; without it only gzip variants are served
+BROTLI_AVAILABLE = importlib.util.find_spec("brotli") is not None
+
+# Location of current_picks.json and the dated history files
+PICKS_DATA_DIR = Path("app/data")
+CURRENT_PICKS_PATH = PICKS_DATA_DIR / "current_picks.json"
+
+
+class PicksRecord:
+    """A validated picks document together with its serialized forms."""
+
+    def __init__(self, picks: WeeklyPicksModel, signature: Optional[Tuple[int, ...]] = None):
+        self.picks = picks
+        self.signature = signature
+        self.json_bytes = picks.model_dump_json().encode("utf-8")  # Body for the JSON API
+        self.etag = f'"{hashlib.sha256(self.json_bytes).hexdigest()[:32]}"'
+        self._data: Optional[Dict[str, Any]] = None
+        self._pretty_json: Optional[str] = None
+        self._encoded: Dict[str, bytes] = {"identity": self.json_bytes}
+
+    def body(self, encoding: str = "identity") -> bytes:
+        """
+        Return the JSON body in the given content encoding, compressing it once.
+
+        Args:
+            encoding: "identity", "gzip" or "br"
+
+        Returns:
+            Encoded bytes (cached on the record)
+        """
+        encoded = self._encoded.get(encoding)
+        if encoded is None:
+            if encoding == "gzip":
+                encoded = gzip.compress(self.json_bytes, compresslevel=9, mtime=0)
+            elif encoding == "br" and BROTLI_AVAILABLE:
+                import brotli
+                encoded = brotli.compress(self.json_bytes, quality=11)
+            else:
+                raise ValueError(f"Unsupported content encoding: {encoding}")
+            self._encoded[encoding] = encoded
+        return encoded
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        """model_dump() output for templates (built on first use, read-only)."""
+        if self._data is None:
+            self._data = self.picks.model_dump()
+        return self._data
+
+    @property
+    def pretty_json(self) -> str:
+        """Indented JSON as written to disk and shown on the admin page."""
+        if self._pretty_json is None:
+            self._pretty_json = self.picks.model_dump_json(indent=2)
+        return self._pretty_json
+
+
+def choose_encoding(accept_encoding: str) -> str:
+    """
+    Pick the best precompressed variant a client accepts.
+
+    Args:
+        accept_encoding: Accept-Encoding request header
+
+    Returns:
+        "br", "gzip" or "identity"
+    """
+    accepted = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+
+    def allowed(name: str) -> bool:
+        return accepted.get(name, accepted.get("*", 0.0)) > 0
+
+    if BROTLI_AVAILABLE and allowed("br"):
+        return "br"
+    if allowed("gzip"):
+        return "gzip"
+    return "identity"
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Return True if an If-None-Match header matches etag (weak comparison)."""
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return etag in candidates or f"W/{etag}" in candidates
+
+
+def picks_exist(filepath: Union[str, Path]) -> bool:
+    """Return True if picks can be loaded from filepath (as JSON, archive or pointer)."""
+    try:
+        resolve_picks_path(filepath)
+        return True
+    except FileNotFoundError:
+        return False
+
+
+class PicksStore:
+    """
+    Caches parsed picks files keyed by path.
+
+    A file is read and validated once; later reads only stat() it and are
+    served from memory until its mtime or size changes. save_picks() hands
+    freshly written picks to put(), so the next read does not re-parse them.
+    Callers must treat returned models and dicts as read-only.
+    """
+
+    def __init__(self, max_files: int = 32):
+        self.max_files = max_files
+        self.hits = 0
+        self.misses = 0
+        self._records: "OrderedDict[str, PicksRecord]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(filepath: Union[str, Path]) -> str:
+        return os.path.abspath(filepath)
+
+    @staticmethod
+    def _file_signature(paths) -> Tuple[int, ...]:
+        """Return (mtime_ns, size) for every file; raises FileNotFoundError if one is missing."""
+        signature: Tuple[int, ...] = ()
+        for path in paths:
+            stat = os.stat(path)
+            signature += (stat.st_mtime_ns, stat.st_size)
+        return signature
+
+    def get(self, filepath: Union[str, Path] = CURRENT_PICKS_PATH) -> PicksRecord:
+        """
+        Return the record for a picks file, reloading it if the file changed.
+
+        A .json path that was migrated to the archive format (or replaced by
+        a current-picks pointer) is served from the archive transparently.
+
+        Args:
+            filepath: Path to the JSON file
+
+        Returns:
+            PicksRecord with the validated model and serialized bytes
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist.
+            Exception: If the JSON doesn't match the schema.
+        """
+        key = self._key(filepath)
+        try:
+            paths = resolve_picks_path(filepath)
+            signature = self._file_signature(paths)
+        except FileNotFoundError:
+            with self._lock:
+                self._records.pop(key, None)
+            raise
+
+        with self._lock:
+            record = self._records.get(key)
+            if record is not None and record.signature == signature:
+                self._records.move_to_end(key)
+                self.hits += 1
+                return record
+
+        record = PicksRecord(load_picks_file(paths[-1]), signature)
+
+        with self._lock:
+            self.misses += 1
+            self._store(key, record)
+        return record
+
+    def put(self, filepath: Union[str, Path], picks: WeeklyPicksModel, pretty_json: Optional[str] = None) -> PicksRecord:
+        """
+        Record picks that were just written to filepath.
+
+        Args:
+            filepath: Path the picks were saved to
+            picks: The saved model
+            pretty_json: The exact text written, if already serialized
+
+        Returns:
+            The new PicksRecord
+        """
+        record = PicksRecord(picks, self._file_signature(resolve_picks_path(filepath)))
+        record._pretty_json = pretty_json
+        with self._lock:
+            self._store(self._key(filepath), record)
+        return record
+
+    def invalidate(self, filepath: Optional[Union[str, Path]] = None) -> None:
+        """Forget one file (or every file) so the next read re-parses it."""
+        with self._lock:
+            if filepath is None:
+                self._records.clear()
+            else:
+                self._records.pop(self._key(filepath), None)
+
+    def _store(self, key: str, record: PicksRecord) -> None:
+        """Insert a record, evicting the least recently used. Caller holds the lock."""
+        self._records[key] = record
+        self._records.move_to_end(key)
+        while len(self._records) > self.max_files:
+            self._records.popitem(last=False)
+
+    def stats(self) -> Dict[str, object]:
+        """Return cache counters for monitoring."""
+        return {
+            "files": len(self._records),
+            "max_files": self.max_files,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# Global picks store shared by the dashboard, API and save_picks()
+picks_store = PicksStore()
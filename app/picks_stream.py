@@ -0,0 +1,120 @@
+"""Incremental parsing of streamed WeeklyPicksModel JSON."""
+
+import json
+from typing import Iterator, List, Optional, Tuple, Union
+
+from pydantic import ValidationError
+
+from .models import LongShotPlayerModel, PlayerModel
+
+# Player categories under "categories" in WeeklyPicksModel
+PLAYER_CATEGORIES = ("qbs", "rbs", "wrs", "tes")
+
+Path = Tuple[Union[str, int], ...]
+
+
+class _Frame:
+    """An open JSON object or array while scanning."""
+    __slots__ = ("kind", "path", "start", "key", "expect_key", "index")
+
+    def __init__(self, kind: str, path: Path, start: int):
+        self.kind = kind  # "object" or "array"
+        self.path = path
+        self.start = start
+        self.key: Optional[str] = None
+        self.expect_key = kind == "object"
+        self.index = 0
+
+    def child_path(self) -> Path:
+        return self.path + ((self.key,) if self.kind == "object" else (self.index,))
+
+
+class IncrementalPicksParser:
+    """
+    Extracts complete player objects from a partially received picks document.
+
+    Feed text deltas as they arrive; every player object that has been fully
+    closed is returned once, as (category, model), where category is one of
+    "qbs", "rbs", "wrs", "tes" or "long_shots". The scanner tracks JSON
+    structure (strings, escapes, nesting) in a single pass over each delta,
+    so the total cost is linear in the document size.
+    """
+
+    def __init__(self):
+        self._text = ""
+        self._pos = 0
+        self._stack: List[_Frame] = []
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+
+    @property
+    def text(self) -> str:
+        """All text received so far."""
+        return self._text
+
+    def feed(self, delta: str) -> List[Tuple[str, Union[PlayerModel, LongShotPlayerModel]]]:
+        """
+        Consume a chunk of streamed JSON.
+
+        Args:
+            delta: Next piece of the model's output
+
+        Returns:
+            List of (category, player) for players completed by this chunk
+        """
+        self._text += delta
+        return list(self._scan())
+
+    def _scan(self) -> Iterator[Tuple[str, Union[PlayerModel, LongShotPlayerModel]]]:
+        text = self._text
+        while self._pos < len(text):
+            pos = self._pos
+            char = text[pos]
+            self._pos += 1
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    top = self._stack[-1] if self._stack else None
+                    if top is not None and top.kind == "object" and top.expect_key:
+                        top.key = json.loads(text[self._string_start:pos + 1])
+                        top.expect_key = False
+                continue
+
+            if char == '"':
+                self._in_string = True
+                self._string_start = pos
+            elif char in "{[":
+                path = self._stack[-1].child_path() if self._stack else ()
+                self._stack.append(_Frame("object" if char == "{" else "array", path, pos))
+            elif char in "}]":
+                frame = self._stack.pop()
+                if frame.kind == "object":
+                    player = self._player_at(frame.path, text[frame.start:pos + 1])
+                    if player is not None:
+                        yield player
+            elif char == "," and self._stack:
+                top = self._stack[-1]
+                if top.kind == "object":
+                    top.expect_key = True
+                else:
+                    top.index += 1
+
+    def _player_at(self, path: Path, raw: str) -> Optional[Tuple[str, Union[PlayerModel, LongShotPlayerModel]]]:
+        """Validate a completed object if it sits at a player position in the document."""
+        if len(path) != 3 or not isinstance(path[2], int):
+            return None
+        try:
+            if path[0] == "categories" and path[1] in PLAYER_CATEGORIES:
+                return path[1], PlayerModel.model_validate_json(raw)
+            if path[0] == "long_shots" and path[1] == "players":
+                return "long_shots", LongShotPlayerModel.model_validate_json(raw)
+        except ValidationError:
+            # Malformed partial player; the final document validation reports it
+            return None
+        return None
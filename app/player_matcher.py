@@ -0,0 +1,271 @@
+"""Fuzzy player-name matching against the depth chart roster."""
+
+import argparse
+import heapq
+import random
+import re
+import statistics
+import time
+import unicodedata
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
+
+# Lowest confidence accepted as the same player
+FUZZY_MATCH_MIN_SCORE = 0.85
+
+# Lowest confidence for treating a name as a player on a team other than the
+# claimed one; below this it may be a different player ("Brian Robinson" vs
+# "Bijan Robinson" scores 0.93)
+FUZZY_RENAME_MIN_SCORE = 0.97
+
+# Closest names by trigram overlap that are rescored by edit similarity
+FUZZY_MATCH_CANDIDATES = 5
+
+# Ranking bonus for candidates on the claimed team (the reported score is unchanged)
+TEAM_MATCH_BONUS = 0.1
+
+# Generational suffixes dropped after the first name
+NAME_SUFFIXES = frozenset({"jr", "sr", "ii", "iii", "iv", "v"})
+
+# Common short forms of first names, mapped to one canonical form
+FIRST_NAME_ALIASES: Dict[str, str] = {
+    "alex": "alexander",
+    "andy": "andrew",
+    "ben": "benjamin",
+    "bob": "robert",
+    "bobby": "robert",
+    "cam": "cameron",
+    "chris": "christopher",
+    "dan": "daniel",
+    "danny": "daniel",
+    "dave": "david",
+    "gabe": "gabriel",
+    "greg": "gregory",
+    "jake": "jacob",
+    "jeff": "jeffrey",
+    "jim": "james",
+    "jimmy": "james",
+    "joe": "joseph",
+    "josh": "joshua",
+    "ken": "kenneth",
+    "kenny": "kenneth",
+    "matt": "matthew",
+    "mike": "michael",
+    "nate": "nathaniel",
+    "nick": "nicholas",
+    "ollie": "oliver",
+    "pat": "patrick",
+    "rob": "robert",
+    "robbie": "robert",
+    "sam": "samuel",
+    "steve": "steven",
+    "tom": "thomas",
+    "tommy": "thomas",
+    "tony": "anthony",
+    "will": "william",
+    "zach": "zachary",
+    "zack": "zachary",
+}
+
+
+def canonical_player_name(name: str) -> str:
+    """
+    Reduce a player name to a canonical form for matching.
+
+    Accents, apostrophes and suffixes are dropped, initials are joined
+    ("D.J." and "DJ" both become "dj"), hyphens and periods split words
+    and common first-name short forms are expanded ("Ken" -> "kenneth").
+
+    Args:
+        name: Player name as written by the model or the depth chart
+
+    Returns:
+        Lowercase space-separated canonical name
+    """
+    name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+    tokens = re.findall(r"[a-z0-9]+", name.lower().replace("'", ""))
+
+    words: List[str] = []
+    in_initials = False
+    for token in tokens:
+        if len(token) == 1 and in_initials:
+            words[-1] += token
+        else:
+            words.append(token)
+        in_initials = len(token) == 1
+    words = [words[0]] + [word for word in words[1:] if word not in NAME_SUFFIXES] if words else []
+    if words:
+        words[0] = FIRST_NAME_ALIASES.get(words[0], words[0])
+    return " ".join(words)
+
+
+def trigrams(text: str) -> FrozenSet[str]:
+    """Character trigrams of a canonical name, padded so word edges count."""
+    padded = f"  {text} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+class PlayerMatch(NamedTuple):
+    """Closest depth chart player for a queried name."""
+    name: str  # Depth chart spelling
+    team: str
+    score: float  # Similarity of the canonical names, 1.0 = same canonical name
+
+
+class PlayerNameMatcher:
+    """
+    Trigram index over rostered player names.
+
+    Exact canonical matches are a dict lookup. Otherwise an inverted
+    trigram index counts shared trigrams for just the names that have any,
+    the few closest by Dice coefficient are rescored with difflib's ratio
+    (which tolerates transposed letters better than trigrams), and the best
+    is returned with that ratio as its confidence. No query does an edit
+    distance against every rostered name.
+    """
+
+    def __init__(self, players: Iterable[Tuple[str, str]]):
+        """
+        Args:
+            players: (player name, team) pairs; the first spelling of a canonical name wins
+        """
+        self.names: List[str] = []
+        self.teams: List[str] = []
+        self.canonical: List[str] = []
+        self._sizes: List[int] = []
+        self._exact: Dict[str, int] = {}
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+
+        for name, team in players:
+            canonical = canonical_player_name(name)
+            if not canonical or canonical in self._exact:
+                continue
+            player_id = len(self.names)
+            self._exact[canonical] = player_id
+            self.names.append(name)
+            self.teams.append(team)
+            self.canonical.append(canonical)
+            grams = trigrams(canonical)
+            self._sizes.append(len(grams))
+            for gram in grams:
+                self._postings[gram].append(player_id)
+        self._postings = dict(self._postings)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def match(self, name: str, team: Optional[str] = None,
+              min_score: float = FUZZY_MATCH_MIN_SCORE) -> Optional[PlayerMatch]:
+        """
+        Return the closest rostered player for a name.
+
+        Args:
+            name: Player name to look up
+            team: Depth chart team the name was claimed for; breaks near-ties
+            min_score: Lowest similarity to accept (0-1)
+
+        Returns:
+            PlayerMatch, or None if no name is similar enough
+        """
+        canonical = canonical_player_name(name)
+        player_id = self._exact.get(canonical)
+        if player_id is not None:
+            return PlayerMatch(self.names[player_id], self.teams[player_id], 1.0)
+
+        grams = trigrams(canonical)
+        shared: Dict[int, int] = defaultdict(int)
+        for gram in grams:
+            for candidate in self._postings.get(gram, ()):
+                shared[candidate] += 1
+        size = len(grams)
+        closest = heapq.nlargest(FUZZY_MATCH_CANDIDATES, shared,
+                                 key=lambda candidate: shared[candidate] / (size + self._sizes[candidate]))
+
+        best: Optional[Tuple[float, float, int]] = None
+        similarity = SequenceMatcher(autojunk=False)
+        similarity.set_seq2(canonical)  # The matcher caches its analysis of the second sequence
+        for candidate in closest:
+            similarity.set_seq1(self.canonical[candidate])
+            score = similarity.ratio()
+            rank = score + (TEAM_MATCH_BONUS if team and self.teams[candidate] == team else 0.0)
+            if best is None or rank > best[0]:
+                best = (rank, score, candidate)
+
+        if best is None or best[1] < min_score:
+            return None
+        _, score, candidate = best
+        return PlayerMatch(self.names[candidate], self.teams[candidate], round(score, 3))
+
+
+def _misspell(name: str, rng: random.Random) -> str:
+    """Swap two adjacent letters of the last name (a typical typo)."""
+    first, _, last = name.rpartition(" ")
+    if len(last) < 4:
+        return name
+    i = rng.randrange(1, len(last) - 2)
+    return f"{first} {last[:i]}{last[i + 1]}{last[i]}{last[i + 2:]}"
+
+
+def benchmark(players: List[Tuple[str, str]], repeat: int = 5, seed: int = 13) -> Dict[str, object]:
+    """
+    Time index construction and lookups over every rostered name.
+
+    Each name is queried as written, with its punctuation stripped, and with
+    one adjacent-letter swap in the last name.
+
+    Args:
+        players: (player name, team) pairs, e.g. from the depth chart
+        repeat: Timed passes over all queries
+        seed: Seed for the typo generator
+
+    Returns:
+        Dict with name count, build time (ms), per-query mean/p99 time (µs)
+        per query kind and the share of typo queries matched to the right player
+    """
+    started = time.perf_counter()
+    matcher = PlayerNameMatcher(players)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    rng = random.Random(seed)
+    queries = {
+        "exact": [name for name in matcher.names],
+        "punctuation": [re.sub(r"[.'\-]", "", name) for name in matcher.names],
+        "typo": [_misspell(name, rng) for name in matcher.names],
+    }
+
+    results: Dict[str, object] = {"names": len(matcher), "build_ms": round(build_ms, 3)}
+    for kind, names in queries.items():
+        timings = []
+        for _ in range(repeat):
+            for name in names:
+                started = time.perf_counter()
+                matcher.match(name)
+                timings.append((time.perf_counter() - started) * 1_000_000)
+        timings.sort()
+        results[f"{kind}_mean_us"] = round(statistics.fmean(timings), 2)
+        results[f"{kind}_p99_us"] = round(timings[int(len(timings) * 0.99) - 1], 2)
+
+    found = [matcher.match(query) for query in queries["typo"]]
+    correct = sum(1 for match, name in zip(found, matcher.names) if match and match.name == name)
+    results["typo_accuracy"] = round(correct / len(matcher), 3)
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    from .depth_chart_parser import DEFAULT_DEPTH_CHART_PATH, parse_depth_chart
+
+    parser = argparse.ArgumentParser(description="Benchmark fuzzy player-name matching over the depth chart")
+    parser.add_argument("csv", nargs="?", default=str(DEFAULT_DEPTH_CHART_PATH))
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    depth_chart = parse_depth_chart(args.csv)
+    players = [(name, team) for team, positions in depth_chart.items()
+               for names in positions.values() for name in names]
+    for key, value in benchmark(players, args.repeat).items():
+        print(f"{key:<20} {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+"""Compiled prompt template for the weekly picks prompt."""
+
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+
+from .atomic_io import atomic_write_text
+
+# Default location of the editable prompt template
+DEFAULT_PROMPT_PATH = Path(__file__).parent / "prompts" / "weekly_picks.txt"
+
+# Legacy marker for the live game data, treated as the GAME_DATA slot
+GAME_DATA_MARKER = "[LIVE GAME DATA WILL BE INSERTED HERE]"
+
+PLACEHOLDER_PATTERN = re.compile(r"\{\{([A-Za-z0-9_]+)\}\}|" + re.escape(GAME_DATA_MARKER))
+
+# Every slot render_prompt() knows how to fill
+PROMPT_VARIABLES = (
+    "SLATE_DESCRIPTION",
+    "NOTE",
+    "FOCUS_GAMES",
+    "PROP_FOCUS",
+    "MIN_ARTICLES_FOR_SENTIMENT",
+    "INCLUDE_LONG_SHOTS",
+    "ESPN_GAME_DATA_LINK",
+    "YEAR",
+    "WEEK_NUMBER",
+    "DATE",
+    "GAME_DATA",
+    "DEPTH_CHART_DATA",
+)
+
+# Slots a template must contain; without them the model never sees the slate
+REQUIRED_VARIABLES = ("GAME_DATA", "DEPTH_CHART_DATA")
+
+
+class TemplateError(ValueError):
+    """Raised when a prompt template has unknown or missing placeholders."""
+
+
+class CompiledTemplate:
+    """
+    A prompt template split into literal segments and named slots.
+
+    Placeholders are located once at compile time, so rendering is a single
+    join over segments and values instead of one full-copy str.replace per
+    variable. Values are inserted verbatim; placeholder-like text inside a
+    value (e.g. in a note) is never expanded.
+    """
+
+    def __init__(self, text: str, version: int = 0):
+        self.text = text
+        self.version = version
+        self.segments: List[str] = []  # Literal text around the slots (len(slots) + 1)
+        self.slots: List[str] = []  # Slot name at each gap between segments
+        self.renders = 0
+        self.total_render_seconds = 0.0
+        self.last_render_seconds = 0.0
+
+        unknown = []
+        position = 0
+        for match in PLACEHOLDER_PATTERN.finditer(text):
+            name = match.group(1) or "GAME_DATA"
+            if name not in PROMPT_VARIABLES:
+                unknown.append(match.group(0))
+            self.segments.append(text[position:match.start()])
+            self.slots.append(name)
+            position = match.end()
+        self.segments.append(text[position:])
+
+        if unknown:
+            raise TemplateError(f"Unknown placeholders in prompt template: {', '.join(sorted(set(unknown)))}")
+
+        self.placeholders = sorted(set(self.slots))
+        self.missing = [name for name in PROMPT_VARIABLES if name not in self.placeholders]
+        missing_required = [name for name in REQUIRED_VARIABLES if name in self.missing]
+        if missing_required:
+            raise TemplateError(
+                "Prompt template is missing required placeholders: "
+                + ", ".join(_placeholder_text(name) for name in missing_required)
+            )
+
+    def render(self, values: Mapping[str, str]) -> str:
+        """
+        Fill every slot in one pass.
+
+        Args:
+            values: Slot name -> text
+
+        Returns:
+            Rendered prompt
+
+        Raises:
+            TemplateError: If a slot used by the template has no value
+        """
+        started = time.perf_counter()
+        parts = [self.segments[0]]
+        try:
+            for name, segment in zip(self.slots, self.segments[1:]):
+                parts.append(values[name])
+                parts.append(segment)
+        except KeyError as e:
+            raise TemplateError(f"No value for prompt placeholder {_placeholder_text(e.args[0])}")
+        rendered = "".join(parts)
+
+        elapsed = time.perf_counter() - started
+        self.renders += 1
+        self.total_render_seconds += elapsed
+        self.last_render_seconds = elapsed
+        return rendered
+
+
+def _placeholder_text(name: str) -> str:
+    """How a slot is written in the template file."""
+    return GAME_DATA_MARKER if name == "GAME_DATA" else f"{{{{{name}}}}}"
+
+
+class PromptTemplateStore:
+    """
+    Holds the compiled prompt template for the process.
+
+    The file is read and compiled once; it is recompiled only when save()
+    writes a new template or the file's mtime/size changes on disk.
+    """
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_PROMPT_PATH):
+        self.path = Path(path)
+        self.version = 0  # Bumped every time a template is compiled
+        self._lock = threading.Lock()
+        self._signature: Optional[Tuple[int, int]] = None
+        self._compiled: Optional[CompiledTemplate] = None
+
+    def _file_signature(self) -> Tuple[int, int]:
+        """Return (mtime_ns, size) for the template; raises FileNotFoundError if missing."""
+        stat = os.stat(self.path)
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def get(self) -> CompiledTemplate:
+        """Return the compiled template, recompiling it if the file changed."""
+        with self._lock:
+            signature = self._file_signature()
+            if self._compiled is None or signature != self._signature:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    text = f.read()
+                self._compiled = CompiledTemplate(text, self.version + 1)
+                self.version += 1
+                self._signature = signature
+            return self._compiled
+
+    @property
+    def text(self) -> str:
+        """Raw template source."""
+        return self.get().text
+
+    def render(self, values: Mapping[str, str]) -> str:
+        """Render the current template with the given slot values."""
+        return self.get().render(values)
+
+    def save(self, text: str) -> CompiledTemplate:
+        """
+        Validate and write a new template, replacing the compiled one.
+
+        Args:
+            text: New template source
+
+        Returns:
+            The compiled template
+
+        Raises:
+            TemplateError: If the template has unknown or missing placeholders
+                (nothing is written in that case)
+        """
+        with self._lock:
+            compiled = CompiledTemplate(text, self.version + 1)
+            atomic_write_text(self.path, text)
+            self.version += 1
+            self._compiled = compiled
+            self._signature = self._file_signature()
+            return compiled
+
+    def stats(self) -> Dict[str, object]:
+        """Return template and render timing details for monitoring."""
+        compiled = self._compiled
+        if compiled is None:
+            return {"path": str(self.path), "loaded": False, "version": self.version}
+        renders = compiled.renders
+        return {
+            "path": str(self.path),
+            "loaded": True,
+            "version": compiled.version,
+            "placeholders": compiled.placeholders,
+            "missing_placeholders": compiled.missing,
+            "renders": renders,
+            "last_render_ms": round(compiled.last_render_seconds * 1000, 3),
+            "avg_render_ms": round(compiled.total_render_seconds * 1000 / renders, 3) if renders else 0.0,
+        }
+
+
+class RenderedPromptCache:
+    """
+    Small LRU of fully rendered prompts keyed by an input fingerprint.
+
+    Each entry also remembers the objects it was rendered from (the schedule
+    game list and compiled template). A lookup only hits if those are the
+    very same objects, so a fingerprint can never be matched against a
+    different schedule or template that happens to share a version number.
+    """
+
+    def __init__(self, max_entries: int = 8):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[tuple, str, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, fingerprint: str, sources: tuple) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Return (prompt, render stats) for a fingerprint, or None on a miss.
+
+        Args:
+            fingerprint: Digest of every input that affects the rendering
+            sources: Objects the rendering must have been built from
+        """
+        with self._lock:
+            entry = self._entries.get(fingerprint)
+            if entry is None or len(entry[0]) != len(sources) or any(
+                a is not b for a, b in zip(entry[0], sources)
+            ):
+                self.misses += 1
+                return None
+            self._entries.move_to_end(fingerprint)
+            self.hits += 1
+            return entry[1], entry[2]
+
+    def put(self, fingerprint: str, sources: tuple, prompt: str, stats: Dict[str, Any]) -> None:
+        """Store a rendering, evicting the least recently used beyond max_entries."""
+        with self._lock:
+            self._entries[fingerprint] = (sources, prompt, stats)
+            self._entries.move_to_end(fingerprint)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached rendering."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, object]:
+        """Return cache counters for monitoring."""
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# Global prompt template shared by render_prompt and the admin endpoints
+prompt_template = PromptTemplateStore()
+
+# Recently rendered prompts, so repeated previews skip rendering
+rendered_prompt_cache = RenderedPromptCache()
@@ -0,0 +1,250 @@
+"""Compact, array-backed depth chart roster storage."""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from array import array
+from collections.abc import Mapping
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Position codes in depth chart order
+POSITIONS: Tuple[str, ...] = ("QB", "RB", "WR", "TE")
+_POSITION_IDS = {position: i for i, position in enumerate(POSITIONS)}
+
+
+class PlayerRecord:
+    """One rostered player. Built on demand from the roster's arrays."""
+
+    __slots__ = ("name", "team", "position", "rank", "ecr")
+
+    def __init__(self, name: str, team: str, position: str, rank: int, ecr: Optional[int] = None):
+        self.name = name
+        self.team = team
+        self.position = position
+        self.rank = rank  # Depth at the position, 1 = starter
+        self.ecr = ecr  # FantasyPros expert consensus rank, None if unranked
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PlayerRecord):
+            return NotImplemented
+        return (self.name, self.team, self.position, self.rank, self.ecr) == \
+            (other.name, other.team, other.position, other.rank, other.ecr)
+
+    def __repr__(self) -> str:
+        return (f"PlayerRecord(name={self.name!r}, team={self.team!r}, position={self.position!r}, "
+                f"rank={self.rank}, ecr={self.ecr})")
+
+
+class Roster:
+    """
+    Every team's depth chart in a handful of flat arrays.
+
+    Players are stored team by team, then position by position, so each
+    (team, position) depth chart is a contiguous slice. Names and team codes
+    are interned, so loading several seasons shares the strings of players
+    who appear in more than one. Per player the roster keeps a name
+    reference plus five bytes of array storage (team, position, rank and
+    ECR) instead of list slots, dict entries and tuples.
+    """
+
+    def __init__(self, players: Iterable[Tuple[str, str, str, Optional[int]]], teams: Iterable[str] = ()):
+        """
+        Args:
+            players: (team, position, name, ECR or None) in depth order within each position
+            teams: Teams to include even if they list no players (e.g. from a bare team row)
+        """
+        grouped: Dict[str, List[List[Tuple[str, int]]]] = {}
+        for team in teams:
+            grouped.setdefault(sys.intern(team), [[] for _ in POSITIONS])
+        for team, position, name, ecr in players:
+            depth = grouped.setdefault(sys.intern(team), [[] for _ in POSITIONS])
+            depth[_POSITION_IDS[position]].append((sys.intern(name), ecr or 0))
+
+        self.teams: List[str] = list(grouped)
+        self.names: List[str] = []
+        self._team_ids = array("B")
+        self._position_ids = array("B")
+        self._ranks = array("B")
+        self._ecr = array("H")  # 0 = unranked
+        self._offsets = array("I", [0])  # Slice bounds per (team, position)
+        self._team_ids_by_name = {team: i for i, team in enumerate(self.teams)}
+
+        for team_id, team in enumerate(self.teams):
+            for position_id, players_at in enumerate(grouped[team]):
+                for rank, (name, ecr) in enumerate(players_at, start=1):
+                    self.names.append(name)
+                    self._team_ids.append(team_id)
+                    self._position_ids.append(position_id)
+                    self._ranks.append(min(rank, 255))
+                    self._ecr.append(min(ecr, 65535))
+                self._offsets.append(len(self.names))
+
+    @classmethod
+    def from_depth_chart(cls, depth_chart: Mapping) -> "Roster":
+        """Build a roster from parse_depth_chart()-style nested dicts (without ECR)."""
+        return cls(
+            ((team, position, name, None)
+             for team, positions in depth_chart.items()
+             for position, names in positions.items()
+             for name in names),
+            teams=depth_chart.keys()
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __iter__(self) -> Iterator[PlayerRecord]:
+        return (self.record(i) for i in range(len(self.names)))
+
+    def record(self, player_id: int) -> PlayerRecord:
+        """Materialize the record for one player id (an index into names)."""
+        ecr = self._ecr[player_id]
+        return PlayerRecord(
+            self.names[player_id],
+            self.teams[self._team_ids[player_id]],
+            POSITIONS[self._position_ids[player_id]],
+            self._ranks[player_id],
+            ecr or None
+        )
+
+    def _slice(self, team: str, position: str) -> Tuple[int, int]:
+        """(start, end) player ids of one team's depth at a position; KeyError if unknown."""
+        slot = self._team_ids_by_name[team] * len(POSITIONS) + _POSITION_IDS[position]
+        return self._offsets[slot], self._offsets[slot + 1]
+
+    def names_at(self, team: str, position: str) -> List[str]:
+        """Player names of one team at one position, in depth order."""
+        start, end = self._slice(team, position)
+        return self.names[start:end]
+
+    def players_at(self, team: str, position: str) -> List[PlayerRecord]:
+        """Player records of one team at one position, in depth order."""
+        start, end = self._slice(team, position)
+        return [self.record(i) for i in range(start, end)]
+
+    def as_depth_chart(self) -> "DepthChartView":
+        """Read-only {team: {position: [names]}} view for existing callers."""
+        return DepthChartView(self)
+
+    def to_dict(self) -> Dict[str, Dict[str, List[str]]]:
+        """Copy into parse_depth_chart()'s nested dict format."""
+        return {team: {position: self.names_at(team, position) for position in POSITIONS} for team in self.teams}
+
+
+class DepthChartView(Mapping):
+    """
+    The {team: {position: [names]}} shape callers of parse_depth_chart() expect.
+
+    Nothing is copied up front; position lists are sliced from the roster
+    when read.
+    """
+
+    def __init__(self, roster: Roster):
+        self.roster = roster
+
+    def __getitem__(self, team: str) -> "TeamView":
+        if team not in self.roster._team_ids_by_name:
+            raise KeyError(team)
+        return TeamView(self.roster, team)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.roster.teams)
+
+    def __len__(self) -> int:
+        return len(self.roster.teams)
+
+    def __contains__(self, team: object) -> bool:
+        return team in self.roster._team_ids_by_name
+
+
+class TeamView(Mapping):
+    """One team's {position: [names]} within a DepthChartView."""
+
+    def __init__(self, roster: Roster, team: str):
+        self.roster = roster
+        self.team = team
+
+    def __getitem__(self, position: str) -> List[str]:
+        if position not in _POSITION_IDS:
+            raise KeyError(position)
+        return self.roster.names_at(self.team, position)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(POSITIONS)
+
+    def __len__(self) -> int:
+        return len(POSITIONS)
+
+
+def _retained_bytes(load: Callable[[], object]) -> Tuple[int, object]:
+    """Python memory still allocated after load() returns (what its result holds)."""
+    gc.collect()
+    tracemalloc.start()
+    result = load()
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return retained, result
+
+
+def benchmark(csv_path: str, seasons: int = 3) -> Dict[str, object]:
+    """
+    Compare the memory held by the nested dict depth chart and by Roster.
+
+    Each "season" is a separate parse of the CSV, as when several seasons or
+    sources are loaded side by side. Both forms are measured with the lookup
+    index built on top, since that is how the app holds them: the dict form
+    with the former name -> (team, position, rank) tuple index, the roster
+    with its name -> player id index.
+
+    Args:
+        csv_path: FantasyPros depth chart CSV
+        seasons: Number of copies loaded
+
+    Returns:
+        Dict with player count and retained KiB for each form, plus the
+        Roster's share of the dict form's memory
+    """
+    from .depth_chart_parser import DepthChartIndex, normalize_player_name, parse_depth_chart, parse_roster
+
+    def load_dicts():
+        loaded = []
+        for _ in range(seasons):
+            depth_chart = parse_depth_chart(csv_path)
+            players = {}
+            for team, positions in depth_chart.items():
+                for position, names in positions.items():
+                    for rank, name in enumerate(names, start=1):
+                        players.setdefault(normalize_player_name(name), (team, position, rank))
+            loaded.append((depth_chart, players))
+        return loaded
+
+    def load_rosters():
+        return [DepthChartIndex(parse_roster(csv_path)) for _ in range(seasons)]
+
+    dict_bytes, _ = _retained_bytes(load_dicts)
+    roster_bytes, indexes = _retained_bytes(load_rosters)
+    return {
+        "seasons": seasons,
+        "players": len(indexes[0].roster),
+        "dict_kib": round(dict_bytes / 1024, 1),
+        "roster_kib": round(roster_bytes / 1024, 1),
+        "roster_share": round(roster_bytes / dict_bytes, 3),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    from .depth_chart_parser import DEFAULT_DEPTH_CHART_PATH
+
+    parser = argparse.ArgumentParser(description="Compare depth chart memory: nested dicts vs Roster")
+    parser.add_argument("csv", nargs="?", default=str(DEFAULT_DEPTH_CHART_PATH))
+    parser.add_argument("--seasons", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    for key, value in benchmark(args.csv, args.seasons).items():
+        print(f"{key:<14} {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+"""Pluggable HTML parser backends for ESPN schedule pages."""
+
+import abc
+import argparse
+import gc
+import importlib.util
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# C-backed parsers are optional; BeautifulSoup's html.parser always works
+SELECTOLAX_AVAILABLE = importlib.util.find_spec("selectolax") is not None
+LXML_AVAILABLE = importlib.util.find_spec("lxml") is not None
+
+# Backend names, fastest first ("auto" picks the first one installed)
+PARSER_PREFERENCE = ("selectolax", "lxml", "html.parser")
+
+# Rows inside the schedule tables, and every table row as a fallback if ESPN moves the tables
+SCHEDULE_ROW_SELECTOR = ".ScheduleTables tr.Table__TR"
+ROW_SELECTOR = "tr.Table__TR"
+
+# One table cell: its text and its team links as (text, href) pairs
+Cell = Tuple[str, List[Tuple[str, str]]]
+
+# One table row: (date header text, []) for header rows, (None, first three cells) otherwise
+ScheduleRow = Tuple[Optional[str], List[Cell]]
+
+
+class ParserBackend(abc.ABC):
+    """
+    Extracts schedule rows from an ESPN page with one HTML library.
+
+    parse() builds the document once; rows() then walks either just the
+    schedule tables or, as a fallback, every Table__TR row on the page.
+    Cell and header text is each text node stripped and concatenated, like
+    BeautifulSoup's get_text(strip=True).
+    """
+
+    name = ""
+
+    @abc.abstractmethod
+    def parse(self, content: bytes) -> Any:
+        """Parse a page into this library's document object."""
+
+    @abc.abstractmethod
+    def rows(self, document: Any, schedule_only: bool = True) -> Iterator[ScheduleRow]:
+        """Yield the schedule rows of a parsed document."""
+
+
+class SoupBackend(ParserBackend):
+    """BeautifulSoup with the pure-Python html.parser."""
+
+    name = "html.parser"
+
+    def __init__(self):
+        from bs4 import BeautifulSoup  # Only loaded if this backend is used
+        self._soup_class = BeautifulSoup
+
+    def parse(self, content: bytes) -> Any:
+        return self._soup_class(content, "html.parser")
+
+    def rows(self, document: Any, schedule_only: bool = True) -> Iterator[ScheduleRow]:
+        for row in document.select(SCHEDULE_ROW_SELECTOR if schedule_only else ROW_SELECTOR):
+            header = row.find("th", class_="Table__TH")
+            if header is not None:
+                yield header.get_text(strip=True), []
+                continue
+            cells = []
+            for cell in row.find_all("td", limit=3):
+                links = [(a.get_text(strip=True), a.get("href", "")) for a in cell.find_all("a", class_="AnchorLink")]
+                cells.append((cell.get_text(strip=True), links))
+            yield None, cells
+
+
+class LxmlBackend(ParserBackend):
+    """libxml2 through lxml, walking rows with precompiled XPath."""
+
+    name = "lxml"
+
+    def __init__(self):
+        from lxml import etree, html
+
+        def has_class(name: str) -> str:
+            return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+        self._html = html
+        self._parser = html.HTMLParser(encoding="utf-8")
+        self._schedule_rows = etree.XPath(f"//div[{has_class('ScheduleTables')}]//tr[{has_class('Table__TR')}]")
+        self._all_rows = etree.XPath(f"//tr[{has_class('Table__TR')}]")
+        self._header = etree.XPath(f".//th[{has_class('Table__TH')}]")
+        self._cells = etree.XPath(".//td")
+        self._links = etree.XPath(f".//a[{has_class('AnchorLink')}]")
+        self._text = etree.XPath(".//text()")
+
+    def _text_of(self, element) -> str:
+        return "".join(text.strip() for text in self._text(element))
+
+    def parse(self, content: bytes) -> Any:
+        return self._html.document_fromstring(content, parser=self._parser)
+
+    def rows(self, document: Any, schedule_only: bool = True) -> Iterator[ScheduleRow]:
+        for row in (self._schedule_rows if schedule_only else self._all_rows)(document):
+            headers = self._header(row)
+            if headers:
+                yield self._text_of(headers[0]), []
+                continue
+            cells = []
+            for cell in self._cells(row)[:3]:
+                links = [(self._text_of(a), a.get("href", "")) for a in self._links(cell)]
+                cells.append((self._text_of(cell), links))
+            yield None, cells
+
+
+class SelectolaxBackend(ParserBackend):
+    """The lexbor engine through selectolax (fastest)."""
+
+    name = "selectolax"
+
+    def __init__(self):
+        from selectolax.lexbor import LexborHTMLParser
+        self._parser_class = LexborHTMLParser
+
+    def parse(self, content: bytes) -> Any:
+        return self._parser_class(content)
+
+    def rows(self, document: Any, schedule_only: bool = True) -> Iterator[ScheduleRow]:
+        for row in document.css(SCHEDULE_ROW_SELECTOR if schedule_only else ROW_SELECTOR):
+            header = row.css_first("th.Table__TH")
+            if header is not None:
+                yield header.text(separator="", strip=True), []
+                continue
+            cells = []
+            for cell in row.css("td")[:3]:
+                links = [(a.text(separator="", strip=True), a.attributes.get("href") or "")
+                         for a in cell.css("a.AnchorLink")]
+                cells.append((cell.text(separator="", strip=True), links))
+            yield None, cells
+
+
+_BACKEND_CLASSES = {
+    "selectolax": (SelectolaxBackend, SELECTOLAX_AVAILABLE),
+    "lxml": (LxmlBackend, LXML_AVAILABLE),
+    "html.parser": (SoupBackend, True),
+}
+_backends: Dict[str, ParserBackend] = {}
+_default_parser = "auto"
+
+
+def available_parsers() -> List[str]:
+    """Installed backend names, fastest first."""
+    return [name for name in PARSER_PREFERENCE if _BACKEND_CLASSES[name][1]]
+
+
+def get_parser(name: Optional[str] = None) -> ParserBackend:
+    """
+    Return a parser backend by name.
+
+    Args:
+        name: "selectolax", "lxml", "html.parser", "auto" (fastest installed)
+            or None for the configured default
+
+    Returns:
+        ParserBackend instance (shared, stateless)
+
+    Raises:
+        ValueError: If the backend is unknown or not installed.
+    """
+    name = name or _default_parser
+    if name == "auto":
+        name = available_parsers()[0]
+    if name not in _BACKEND_CLASSES:
+        raise ValueError(f"Unknown schedule parser '{name}' (expected one of auto, {', '.join(PARSER_PREFERENCE)})")
+    backend_class, available = _BACKEND_CLASSES[name]
+    if not available:
+        raise ValueError(f"Schedule parser '{name}' is not installed")
+    backend = _backends.get(name)
+    if backend is None:
+        backend = _backends[name] = backend_class()
+    return backend
+
+
+def set_default_parser(name: str) -> None:
+    """
+    Choose the backend used when none is given (e.g. from application settings).
+
+    An unavailable backend falls back to "auto" with a warning.
+    """
+    global _default_parser
+    try:
+        get_parser(name)
+    except ValueError as e:
+        print(f"⚠️  {e}; using the fastest installed parser")
+        name = "auto"
+    _default_parser = name
+
+
+def benchmark(paths: List[Path], parsers: Optional[List[str]] = None, repeat: int = 20) -> List[Dict[str, Any]]:
+    """
+    Time parse_espn_schedule_html() with each backend on saved schedule pages.
+
+    Memory is measured with tracemalloc over a single parse: the peak while
+    parsing and what is still held afterwards (the returned games). Only
+    Python allocations are traced; memory used inside libxml2 or lexbor is
+    not included.
+
+    Args:
+        paths: Saved ESPN schedule HTML files
+        parsers: Backend names (defaults to every installed backend)
+        repeat: Timed runs per file and backend
+
+    Returns:
+        One row per file and backend with games found, median/best parse
+        time (ms), and peak/retained Python memory (KiB)
+    """
+    from .espn_scraper import parse_espn_schedule_html
+
+    results = []
+    for path in paths:
+        content = path.read_bytes()
+        url = "https://www.espn.com/nfl/schedule/_/week/1/year/2025/seasontype/2"
+        for name in parsers or available_parsers():
+            parse = lambda: parse_espn_schedule_html(content, url, parser=name)
+            games, _ = parse()  # Warm up (backend construction, XPath compilation)
+
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                parse()
+                timings.append((time.perf_counter() - started) * 1000)
+
+            gc.collect()
+            tracemalloc.start()
+            result = parse()
+            gc.collect()  # BeautifulSoup trees are reference cycles
+            retained, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del result
+
+            results.append({
+                "file": path.name,
+                "bytes": len(content),
+                "parser": name,
+                "games": len(games),
+                "median_ms": round(statistics.median(timings), 3),
+                "best_ms": round(min(timings), 3),
+                "peak_kib": round(peak / 1024, 1),
+                "retained_kib": round(retained / 1024, 1),
+            })
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark ESPN schedule parser backends")
+    parser.add_argument("files", nargs="*", type=Path, help="Saved schedule pages (default: fixtures/espn_schedule_*.html)")
+    parser.add_argument("--parser", action="append", choices=list(PARSER_PREFERENCE), dest="parsers")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    files = args.files or sorted(Path("fixtures").glob("espn_schedule_*.html"))
+    print(f"{'file':<28} {'parser':<12} {'games':>5} {'median ms':>10} {'best ms':>8} {'peak KiB':>9} {'kept KiB':>9}")
+    for row in benchmark(files, args.parsers, args.repeat):
+        print(f"{row['file']:<28} {row['parser']:<12} {row['games']:>5} {row['median_ms']:>10} "
+              f"{row['best_ms']:>8} {row['peak_kib']:>9} {row['retained_kib']:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+"""Runtime settings shared by every worker process."""
+
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from pydantic import TypeAdapter
+
+from .config import Settings, settings
+
+# Settings the admin UI and API may change while the app is running. Everything
+# else comes from the environment and is fixed for the life of the process.
+RUNTIME_FIELDS = (
+    "espn_game_data_link",
+    "slate_description",
+    "note",
+    "focus_games",
+    "prop_focus",
+    "min_articles_for_sentiment",
+    "include_long_shots",
+    "use_game_selection",
+    "selected_game_ids",
+)
+
+_ADAPTERS = {name: TypeAdapter(Settings.model_fields[name].annotation) for name in RUNTIME_FIELDS}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS settings (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS state_version (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    version INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO state_version VALUES (1, 0);
+"""
+
+
+def _encode(name: str, value: Any) -> str:
+    """Validate a runtime setting and serialize it as JSON."""
+    adapter = _ADAPTERS.get(name)
+    if adapter is None:
+        raise ValueError(f"Setting {name} cannot be changed at runtime")
+    return adapter.dump_json(adapter.validate_python(value)).decode("utf-8")
+
+
+class MemorySettingsBackend:
+    """Keeps overrides in this process only (single worker, tests)."""
+
+    name = "memory"
+
+    def __init__(self):
+        self._values: Dict[str, str] = {}
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def version(self) -> int:
+        return self._version
+
+    def load(self) -> Tuple[int, Dict[str, str]]:
+        with self._lock:
+            return self._version, dict(self._values)
+
+    def save(self, values: Dict[str, str]) -> int:
+        with self._lock:
+            self._values.update(values)
+            self._version += 1
+            return self._version
+
+
+class SQLiteSettingsBackend:
+    """
+    Keeps overrides in a SQLite file that every worker opens.
+
+    A single-row table holds a version counter that each write bumps in the
+    same transaction as the values, so readers can check for changes with one
+    primary-key lookup and reload only when it moves.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, db_path: Union[str, Path]):
+        self.db_path = Path(db_path)
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return this process's connection, opening it on first use. Caller holds the lock."""
+        if self._connection is None or self._pid != os.getpid():
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.db_path, timeout=10, check_same_thread=False, isolation_level=None)
+            connection.execute("PRAGMA journal_mode = WAL")  # Readers never block the writer
+            connection.executescript(SCHEMA)
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def version(self) -> int:
+        with self._lock:
+            return self._connect().execute("SELECT version FROM state_version WHERE id = 1").fetchone()[0]
+
+    def load(self) -> Tuple[int, Dict[str, str]]:
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN")
+            try:
+                version = connection.execute("SELECT version FROM state_version WHERE id = 1").fetchone()[0]
+                values = dict(connection.execute("SELECT name, value FROM settings"))
+            finally:
+                connection.execute("COMMIT")
+            return version, values
+
+    def save(self, values: Dict[str, str]) -> int:
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.executemany(
+                    "INSERT INTO settings VALUES (?, ?) ON CONFLICT (name) DO UPDATE SET value = excluded.value",
+                    values.items()
+                )
+                connection.execute("UPDATE state_version SET version = version + 1 WHERE id = 1")
+                version = connection.execute("SELECT version FROM state_version WHERE id = 1").fetchone()[0]
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+            return version
+
+
+class SettingsStore:
+    """
+    Environment settings plus the runtime overrides saved by any worker.
+
+    current() checks the backend's version counter on every call and only
+    rebuilds the Settings object when another update has landed, so all
+    workers see the same configuration without sticky sessions. Returned
+    Settings objects are shared snapshots and must not be mutated; use
+    update() instead.
+    """
+
+    def __init__(self, base: Settings, backend):
+        self.base = base
+        self.backend = backend
+        self.reads = 0
+        self.reloads = 0
+        self.updates = 0
+        self._version: Optional[int] = None
+        self._current = base
+        self._listeners: List[Callable[[Settings, int], None]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> Optional[int]:
+        """Version of the settings last seen by this worker."""
+        return self._version
+
+    def current(self) -> Settings:
+        """
+        Return the current settings, reloading them if any worker changed them.
+
+        Returns:
+            Settings snapshot (read-only)
+        """
+        version = self.backend.version()
+        with self._lock:
+            self.reads += 1
+            if version == self._version:
+                return self._current
+        return self._reload()
+
+    def update(self, **changes: Any) -> Settings:
+        """
+        Save runtime settings for every worker.
+
+        Args:
+            **changes: Values for fields in RUNTIME_FIELDS
+
+        Returns:
+            The updated settings
+
+        Raises:
+            ValueError: If a field cannot be changed at runtime or a value is invalid.
+        """
+        values = {name: _encode(name, value) for name, value in changes.items()}
+        self.backend.save(values)
+        with self._lock:
+            self.updates += 1
+        return self._reload()
+
+    def subscribe(self, callback: Callable[[Settings, int], None]) -> None:
+        """
+        Call callback(settings, version) whenever this worker sees new settings.
+
+        Changes made by other workers are noticed on the next current() call.
+        """
+        self._listeners.append(callback)
+
+    def _reload(self) -> Settings:
+        version, stored = self.backend.load()
+        overrides = {}
+        for name, value in stored.items():
+            adapter = _ADAPTERS.get(name)
+            if adapter is None:
+                continue  # Field is no longer a runtime setting
+            try:
+                overrides[name] = adapter.validate_json(value)
+            except ValueError as e:
+                print(f"⚠️  Ignoring stored setting {name}: {e}")
+
+        with self._lock:
+            if self._version is not None and version <= self._version:
+                return self._current  # Another thread already loaded this version
+            self._current = self.base.model_copy(update=overrides)
+            self._version = version
+            self.reloads += 1
+            config = self._current
+
+        for callback in list(self._listeners):
+            try:
+                callback(config, version)
+            except Exception as e:
+                print(f"⚠️  Settings listener failed: {e}")
+        return config
+
+    def stats(self) -> Dict[str, object]:
+        """Return counters for monitoring."""
+        return {
+            "backend": self.backend.name,
+            "version": self._version,
+            "reads": self.reads,
+            "reloads": self.reloads,
+            "updates": self.updates,
+        }
+
+
+def create_settings_store(config: Settings = settings) -> SettingsStore:
+    """
+    Build the settings store selected by config.runtime_state_backend.
+
+    Args:
+        config: Environment settings used as the base
+
+    Returns:
+        SettingsStore backed by SQLite (shared by workers) or memory
+    """
+    if config.runtime_state_backend == "memory":
+        backend = MemorySettingsBackend()
+    else:
+        if config.runtime_state_backend != "sqlite":
+            print(f"⚠️  Unknown settings backend {config.runtime_state_backend!r}; using sqlite")
+        backend = SQLiteSettingsBackend(config.runtime_state_path)
+    return SettingsStore(config, backend)
+
+
+# Global runtime settings, read by request handlers instead of mutating config.settings
+settings_store = create_settings_store()
@@ -0,0 +1,124 @@
+"""Profile what the web app imports at startup and how soon it can answer a request."""
+
+import argparse
+import os
+import re
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from typing import Dict, List, NamedTuple, Optional
+
+# Loaded on first use, never while the app starts
+LAZY_MODULES = ("openai", "bs4", "requests", "httpx")
+
+# One line of -X importtime output: "import time: <self us> | <cumulative us> | <indent><module>"
+IMPORT_TIME_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+
+class ImportTiming(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int  # Nesting level; 0 = imported by the profiled module itself
+
+
+def import_profile(module: str = "app.main", env: Optional[Dict[str, str]] = None) -> List[ImportTiming]:
+    """
+    Import a module in a fresh interpreter under -X importtime.
+
+    Args:
+        module: Module to import
+        env: Environment for the interpreter (defaults to this process's)
+
+    Returns:
+        One entry per module imported, in import order
+
+    Raises:
+        RuntimeError: If the import fails.
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            capture_output=True, text=True, env=env)
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+
+    timings = []
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            timings.append(ImportTiming(name, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return timings
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def time_to_first_response(app: str = "app.main:app", path: str = "/health", timeout: float = 60.0,
+                           env: Optional[Dict[str, str]] = None) -> float:
+    """
+    Start the app under uvicorn, as the Procfile does, and time its first successful response.
+
+    Args:
+        app: uvicorn application path
+        path: URL path to poll
+        timeout: Seconds to wait before giving up
+        env: Environment for the server (defaults to this process's)
+
+    Returns:
+        Seconds from launching the process to the first 200 response
+
+    Raises:
+        TimeoutError: If the server doesn't answer within timeout.
+    """
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}{path}"
+    started = time.perf_counter()
+    server = subprocess.Popen([sys.executable, "-m", "uvicorn", app, "--host", "127.0.0.1", "--port", str(port),
+                               "--log-level", "warning"], env=env)
+    try:
+        while time.perf_counter() - started < timeout:
+            if server.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with status {server.returncode}")
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - started
+            except OSError:
+                pass  # Not listening yet
+            time.sleep(0.01)
+        raise TimeoutError(f"No response from {url} within {timeout:.0f}s")
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Profile web app imports and time to first response")
+    parser.add_argument("module", nargs="?", default="app.main")
+    parser.add_argument("--top", type=int, default=15, help="Slowest imports to list")
+    parser.add_argument("--no-server", action="store_true", help="Skip the time-to-first-response check")
+    args = parser.parse_args(argv)
+
+    timings = import_profile(args.module)
+    total = next(t for t in reversed(timings) if t.module == args.module)
+    print(f"import {args.module}: {total.cumulative_us / 1000:.1f} ms, {len(timings)} modules")
+    print(f"{'module':<40} {'self ms':>8} {'total ms':>9}")
+    for timing in sorted(timings, key=lambda t: t.cumulative_us, reverse=True)[:args.top]:
+        print(f"{'  ' * timing.depth + timing.module:<40} {timing.self_us / 1000:>8.1f} {timing.cumulative_us / 1000:>9.1f}")
+
+    imported = {timing.module.split(".")[0] for timing in timings}
+    eager = [module for module in LAZY_MODULES if module in imported]
+    print(f"lazy modules imported eagerly: {', '.join(eager) or 'none'}")
+
+    if not args.no_server:
+        env = dict(os.environ, CACHE_WARMUP_ENABLED=os.environ.get("CACHE_WARMUP_ENABLED", "false"))
+        print(f"time to first /health response: {time_to_first_response(env=env) * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
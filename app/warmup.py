@@ -0,0 +1,172 @@
+"""Background cache warm-up: fill the in-process caches at startup and keep them fresh."""
+
+import asyncio
+import re
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+# Regular season weeks; later weeks live under a different season type
+REGULAR_SEASON_WEEKS = 18
+
+
+def next_week_url(espn_url: str) -> Optional[str]:
+    """
+    ESPN schedule URL of the week after espn_url's.
+
+    Args:
+        espn_url: ESPN NFL schedule URL (e.g., https://www.espn.com/nfl/schedule/_/week/13/year/2025/seasontype/2)
+
+    Returns:
+        The same URL with the week incremented, or None if the URL has no
+        week or is the last regular season week
+    """
+    week_match = re.search(r'/week/(\d+)', espn_url)
+    if not week_match:
+        return None
+    week = int(week_match.group(1))
+    season_type_match = re.search(r'/seasontype/(\d+)', espn_url)
+    if week >= REGULAR_SEASON_WEEKS and (not season_type_match or season_type_match.group(1) == "2"):
+        return None
+    return espn_url[:week_match.start(1)] + str(week + 1) + espn_url[week_match.end(1):]
+
+
+class WarmupTask:
+    """One cache refresh and the outcome of its latest run."""
+
+    def __init__(self, name: str, refresh: Callable[[], Awaitable[Any]], interval_seconds: float,
+                 required: bool = True):
+        self.name = name
+        self.refresh = refresh
+        self.interval_seconds = interval_seconds
+        self.required = required  # Whether readiness waits for this task
+        self.runs = 0
+        self.failures = 0
+        self.last_refresh: Optional[float] = None  # time.monotonic() of the last success
+        self.last_refresh_at: Optional[str] = None
+        self.last_error: Optional[str] = None
+        self.last_duration_ms: Optional[float] = None
+        self.detail: Any = None  # What the last successful refresh returned
+
+    @property
+    def warm(self) -> bool:
+        return self.last_refresh is not None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        age = None if self.last_refresh is None else round(time.monotonic() - self.last_refresh, 1)
+        return {
+            "warm": self.warm,
+            "required": self.required,
+            "interval_seconds": self.interval_seconds,
+            "last_refresh_at": self.last_refresh_at,
+            "last_refresh_age_seconds": age,
+            "last_duration_ms": self.last_duration_ms,
+            "last_error": self.last_error,
+            "runs": self.runs,
+            "failures": self.failures,
+            "detail": self.detail,
+        }
+
+
+class CacheWarmer:
+    """
+    Runs cache refresh tasks in the background of the event loop.
+
+    On start() every task runs once, in the order added (so later tasks,
+    like rendering the prompt, find the caches earlier ones filled), and
+    then each repeats on its own interval. A failing refresh is recorded
+    and retried on the next interval; it never stops the others.
+    """
+
+    def __init__(self):
+        self.tasks: List[WarmupTask] = []
+        self.started_at: Optional[str] = None
+        self._runner: Optional[asyncio.Task] = None
+
+    def add(self, name: str, refresh: Callable[[], Awaitable[Any]], interval_seconds: float,
+            required: bool = True) -> WarmupTask:
+        """
+        Register a refresh task.
+
+        Args:
+            name: Label used in status reports
+            refresh: Coroutine function that refreshes one cache; its return value is reported as detail
+            interval_seconds: Delay between refreshes (0 = only at startup)
+            required: Whether readiness waits for this task's first success
+
+        Returns:
+            The registered task
+        """
+        task = WarmupTask(name, refresh, interval_seconds, required)
+        self.tasks.append(task)
+        return task
+
+    async def run_task(self, task: WarmupTask) -> bool:
+        """Run one refresh now, recording its outcome. Returns True on success."""
+        started = time.perf_counter()
+        task.runs += 1
+        try:
+            task.detail = await task.refresh()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            task.failures += 1
+            task.last_error = str(e)
+            print(f"⚠️  Cache warm-up '{task.name}' failed: {e}")
+            return False
+        finally:
+            task.last_duration_ms = round((time.perf_counter() - started) * 1000, 3)
+        task.last_refresh = time.monotonic()
+        task.last_refresh_at = datetime.now().isoformat()
+        task.last_error = None
+        return True
+
+    async def run_all(self) -> None:
+        """Run every task once, in order."""
+        for task in self.tasks:
+            await self.run_task(task)
+
+    async def _repeat(self, task: WarmupTask) -> None:
+        while True:
+            await asyncio.sleep(task.interval_seconds)
+            await self.run_task(task)
+
+    async def _run(self) -> None:
+        await self.run_all()
+        await asyncio.gather(*(self._repeat(task) for task in self.tasks if task.interval_seconds > 0))
+
+    def start(self) -> None:
+        """Start warming in the background; must be called from the running event loop."""
+        if self._runner is None:
+            self.started_at = datetime.now().isoformat()
+            self._runner = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the background refreshes and wait for them to finish."""
+        runner, self._runner = self._runner, None
+        if runner is None:
+            return
+        runner.cancel()
+        try:
+            await runner
+        except asyncio.CancelledError:
+            pass
+
+    @property
+    def running(self) -> bool:
+        return self._runner is not None and not self._runner.done()
+
+    @property
+    def ready(self) -> bool:
+        """True once every required task has refreshed successfully at least once."""
+        return all(task.warm for task in self.tasks if task.required)
+
+    def status(self) -> Dict[str, Any]:
+        """Readiness, plus each task's warmth and last refresh age."""
+        return {
+            "ready": self.ready,
+            "running": self.running,
+            "started_at": self.started_at,
+            "tasks": {task.name: task.to_dict() for task in self.tasks},
+        }
@@ -0,0 +1,33 @@
+"""Shared pytest setup."""
+
+import os
+
+import pytest
+
+# Tests drive the caches themselves; keep the app's background warm-up out of their way
+os.environ.setdefault("CACHE_WARMUP_ENABLED", "false")
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+
+@pytest.fixture(autouse=True)
+def isolated_runtime_state(monkeypatch, tmp_path):
+    """Point the app's job store, picks index and runtime settings at tmp_path instead of app/data."""
+    from app import ai_client, main
+    from app.jobs import JobManager, SQLiteJobStore
+    from app.models import WeeklyPicksModel
+    from app.picks_index import PicksIndex
+    from app.picks_store import PICKS_DATA_DIR
+    from app.settings_store import MemorySettingsBackend, SettingsStore
+
+    job_manager = JobManager(store=SQLiteJobStore(
+        tmp_path / "state.sqlite3",
+        dump_result=lambda picks: picks.model_dump_json(),
+        load_result=WeeklyPicksModel.model_validate_json
+    ))
+    store = SettingsStore(main.settings, MemorySettingsBackend())
+    monkeypatch.setattr(main, "job_manager", job_manager)
+    monkeypatch.setattr(main, "picks_index", PicksIndex(tmp_path / "picks_index.sqlite3", PICKS_DATA_DIR))
+    monkeypatch.setattr(main, "settings_store", store)
+    monkeypatch.setattr(ai_client, "settings_store", store)
+    yield
+    job_manager.shutdown()
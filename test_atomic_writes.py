@@ -0,0 +1,106 @@
+"""Stress test concurrent reads while picks and the prompt template are rewritten."""
+
+import os
+import threading
+import time
+
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from app.ai_client import load_picks, save_picks
+from app.atomic_io import atomic_write_text
+from app.config import settings
+from app.models import WeeklyPicksModel
+from app.prompt_template import DEFAULT_PROMPT_PATH, CompiledTemplate, PromptTemplateStore
+
+WEEK_13 = "app/data/week_13_2025-12-06.json"
+WEEK_14 = "app/data/week_14_2025-12-06.json"
+STRESS_SECONDS = 1.0
+
+
+def run_concurrently(writer, readers, seconds=STRESS_SECONDS):
+    """Run writer() in a loop alongside reader threads; return (writes, reads, errors)."""
+    stop = threading.Event()
+    errors = []
+    counts = {"writes": 0, "reads": 0}
+    lock = threading.Lock()
+
+    def write_loop():
+        while not stop.is_set():
+            writer()
+            counts["writes"] += 1
+
+    def read_loop(reader):
+        while not stop.is_set():
+            try:
+                reader()
+                with lock:
+                    counts["reads"] += 1
+            except Exception as e:
+                errors.append(repr(e))
+
+    threads = [threading.Thread(target=write_loop)]
+    threads += [threading.Thread(target=read_loop, args=(r,)) for r in readers]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return counts["writes"], counts["reads"], errors
+
+
+def test_readers_never_see_partial_picks(tmp_path):
+    documents = [load_picks(WEEK_13), load_picks(WEEK_14)]
+    current = tmp_path / "current_picks.json"
+    save_picks(documents[0], str(current), settings)
+    expected = {doc.meta.week: doc for doc in documents}
+    toggle = {"i": 0}
+
+    def write():
+        toggle["i"] ^= 1
+        save_picks(documents[toggle["i"]], str(current), settings)
+
+    def read_raw():
+        picks = WeeklyPicksModel.model_validate_json(current.read_bytes())
+        assert picks == expected[picks.meta.week]
+
+    def read_cached():
+        picks = load_picks(str(current))
+        assert picks == expected[picks.meta.week]
+
+    writes, reads, errors = run_concurrently(write, [read_raw, read_raw, read_cached])
+    assert writes > 10 and reads > 100
+    assert errors == []
+    # No temporary files are left behind
+    assert sorted(p.name for p in tmp_path.iterdir() if p.name.startswith(".")) == []
+
+
+def test_readers_never_see_partial_prompt_template(tmp_path):
+    path = tmp_path / "weekly_picks.txt"
+    original = DEFAULT_PROMPT_PATH.read_text(encoding="utf-8")
+    path.write_text(original, encoding="utf-8")
+    store = PromptTemplateStore(path)
+    versions = [original, original + "\n\nExtra instructions.\n" * 50]
+    toggle = {"i": 0}
+
+    def write():
+        toggle["i"] ^= 1
+        store.save(versions[toggle["i"]])
+
+    def read():
+        text = path.read_text(encoding="utf-8")
+        assert text in versions
+        CompiledTemplate(text)
+
+    writes, reads, errors = run_concurrently(write, [read, read])
+    assert writes > 10 and reads > 100
+    assert errors == []
+
+
+def test_atomic_write_keeps_permissions(tmp_path):
+    path = tmp_path / "file.txt"
+    path.write_text("old", encoding="utf-8")
+    os.chmod(path, 0o640)
+    atomic_write_text(path, "new")
+    assert path.read_text(encoding="utf-8") == "new"
+    assert os.stat(path).st_mode & 0o777 == 0o640
@@ -0,0 +1,112 @@
+"""Test the disk cache of model completions."""
+
+import os
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from app import ai_client, completion_cache
+from app.completion_cache import CompletionCache
+from app.config import settings
+from app.models import WeeklyPicksModel
+
+SAMPLE_PICKS = WeeklyPicksModel.model_validate_json(
+    Path("app/data/week_14_2025-12-06.json").read_text(encoding="utf-8")
+)
+
+
+class CountingClient:
+    """Returns the given picks and counts model calls."""
+
+    def __init__(self, picks: WeeklyPicksModel = SAMPLE_PICKS):
+        self.picks = picks
+        self.calls = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(parse=self.parse))
+
+    def parse(self, model, messages, response_format, temperature):
+        self.calls += 1
+        message = SimpleNamespace(parsed=self.picks, refusal=None)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def with_week(week: int) -> WeeklyPicksModel:
+    return SAMPLE_PICKS.model_copy(update={"meta": SAMPLE_PICKS.meta.model_copy(update={"week": week})})
+
+
+def test_identical_requests_are_served_from_disk(tmp_path, monkeypatch):
+    cache = CompletionCache(tmp_path)
+    monkeypatch.setattr(ai_client, "completion_cache", cache)
+    monkeypatch.setattr(ai_client, "render_prompt", lambda schedule=None, config=None: "prompt")
+    config = settings.model_copy(update={"generation_fanout": "off"})
+    client = CountingClient()
+
+    first = ai_client.generate_picks(config, client=client)
+    second = ai_client.generate_picks(config, client=client)
+    assert client.calls == 1
+    assert second.model_dump() == first.model_dump()
+
+    # A new process (another worker) reads the same entry in milliseconds
+    monkeypatch.setattr(ai_client, "completion_cache", CompletionCache(tmp_path))
+    start = time.perf_counter()
+    cached = ai_client.request_picks(client, "prompt", cache_mode="use")
+    assert time.perf_counter() - start < 0.1
+    assert isinstance(cached, WeeklyPicksModel) and client.calls == 1
+
+    # Bypassing calls the model and replaces the cached response
+    client.picks = with_week(15)
+    assert ai_client.generate_picks(config, client=client, bypass_cache=True).meta.week == 15
+    assert client.calls == 2
+    assert ai_client.generate_picks(config, client=client).meta.week == 15
+    assert client.calls == 2
+
+    # Disabled entirely: always calls the model
+    ai_client.generate_picks(config.model_copy(update={"completion_cache_enabled": False}), client=client)
+    assert client.calls == 3
+
+
+def test_key_covers_every_request_input():
+    key = ai_client.completion_cache_key("prompt")
+    assert ai_client.completion_cache_key("prompt") == key
+    assert ai_client.completion_cache_key("prompt ") != key
+    assert ai_client.completion_cache_key("prompt", temperature=0.2) != key
+    assert ai_client.completion_cache_key("prompt", model="gpt-4o-mini") != key
+
+
+def test_size_bound_evicts_least_recently_used(tmp_path):
+    entry_size = len(SAMPLE_PICKS.model_dump_json().encode("utf-8"))
+    cache = CompletionCache(tmp_path, max_bytes=entry_size * 3)
+    for i, key in enumerate(["a", "b", "c"]):
+        cache.put(key, SAMPLE_PICKS)
+        os.utime(tmp_path / f"{key}.json", ns=((i + 1) * 10**9, (i + 1) * 10**9))
+
+    assert cache.get("a") is not None  # Now the most recently used
+    cache.put("d", SAMPLE_PICKS)
+
+    assert sorted(p.stem for p in tmp_path.glob("*.json")) == ["a", "c", "d"]
+    stats = cache.stats()
+    assert stats["entries"] == 3 and stats["bytes"] <= stats["max_bytes"]
+    assert stats["evictions"] == 1 and stats["hits"] == 1
+
+
+def test_unreadable_entries_are_dropped(tmp_path):
+    cache = CompletionCache(tmp_path)
+    (tmp_path / "old.json").write_text('{"meta": {}}', encoding="utf-8")
+    assert cache.get("old") is None
+    assert not (tmp_path / "old.json").exists()
+    assert cache.get("missing") is None
+    assert cache.stats()["misses"] == 2
+
+
+def test_entry_evicted_after_read_is_still_a_hit(tmp_path, monkeypatch):
+    cache = CompletionCache(tmp_path)
+    cache.put("a", SAMPLE_PICKS)
+
+    def evicted_by_another_process(path, *args, **kwargs):
+        Path(path).unlink()
+        raise FileNotFoundError(path)
+
+    monkeypatch.setattr(completion_cache.os, "utime", evicted_by_another_process)
+    assert cache.get("a") == SAMPLE_PICKS
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 0
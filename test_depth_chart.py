@@ -1,12 +1,24 @@
 """Test script for depth chart integration."""
 
+import os
+import shutil
+import tempfile
 from pathlib import Path
+
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from app.ai_client import validate_and_correct_picks
 from app.depth_chart_parser import (
+    DepthChartCache,
+    DepthChartIndex,
     parse_depth_chart,
     get_player_team,
     validate_player_team,
     format_all_depth_charts_compact
 )
+from app.models import WeeklyPicksModel
+
+DEPTH_CHART_PATH = Path("data/FantasyPros_Fantasy_Football_2025_Depth_Charts.csv")
 
 
 def test_depth_chart_parser():
@@ -95,5 +107,83 @@ def test_depth_chart_parser():
     print("=" * 60)
 
 
+def test_depth_chart_index():
+    """The index must agree with a linear scan and resolve team aliases."""
+    depth_chart = parse_depth_chart(str(DEPTH_CHART_PATH))
+    index = DepthChartIndex(depth_chart)
+    
+    # Every rostered player resolves to the team/rank a full scan would find
+    for team, positions in depth_chart.items():
+        for position, players in positions.items():
+            for rank, player in enumerate(players, start=1):
+                entry = index.lookup(player)
+                assert entry is not None
+                if entry.team == team and entry.position == position:
+                    assert entry.rank == rank
+    
+    assert index.team_of("Derrick Henry") == "Baltimore Ravens"
+    assert index.team_of("Not A Player") is None
+    assert index.rank_of("Josh Allen") == 1
+    
+    # Team aliases: nickname, abbreviation, unambiguous city
+    assert index.validate("Derrick Henry", "Baltimore Ravens")
+    assert index.validate("Derrick Henry", "Ravens")
+    assert index.validate("Derrick Henry", "BAL")
+    assert index.validate("Derrick Henry", "Baltimore")
+    assert not index.validate("Derrick Henry", "Tennessee Titans")
+    assert index.resolve_team("New York") is None  # Giants or Jets
+    assert index.resolve_team("NYJ") == "New York Jets"
+    
+    # Module-level helpers delegate to the index
+    assert get_player_team("Saquon Barkley", depth_chart) == "Philadelphia Eagles"
+    assert validate_player_team("Saquon Barkley", "Philadelphia Eagles", index)
+
+
+def test_team_aliases_are_stored_as_depth_chart_names():
+    """A pick's team alias passes validation but is saved as the depth chart team."""
+    picks = WeeklyPicksModel.model_validate_json(Path("app/data/week_14_2025-12-06.json").read_text(encoding="utf-8"))
+    player = picks.categories.qbs[0]
+    player.name, player.team, player.verified = "Josh Allen", "BUF", True
+    long_shot = picks.long_shots.players[0]
+    long_shot.name, long_shot.team = "Derrick Henry", "Ravens"
+    
+    validate_and_correct_picks(picks, DepthChartIndex(parse_depth_chart(str(DEPTH_CHART_PATH))))
+    
+    assert player.team == "Buffalo Bills" and player.verified
+    assert "[TEAM CORRECTED]" not in player.matchup_note
+    assert long_shot.team == "Baltimore Ravens"
+
+
+def test_depth_chart_cache():
+    """The cache parses once and reloads only when the CSV's mtime/size change."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = Path(tmp_dir) / "depth_chart.csv"
+        shutil.copy(DEPTH_CHART_PATH, csv_path)
+        cache = DepthChartCache(csv_path)
+        
+        first = cache.get()
+        assert cache.get() is first
+        assert cache.get_compact() == format_all_depth_charts_compact(first)
+        assert cache.get_index().team_of("Derrick Henry") == "Baltimore Ravens"
+        assert cache.misses == 1
+        assert cache.hits == 3
+        assert cache.version == 1
+        
+        # Changing the file (new size and mtime) triggers exactly one reload
+        with open(csv_path, "a", encoding="utf-8") as f:
+            f.write('\n"Test Team"\n"13","Test Quarterback","","","","","",""\n')
+        stat = os.stat(csv_path)
+        os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        reloaded = cache.get()
+        assert reloaded is not first
+        assert "Test Team" in reloaded
+        assert cache.get_index().team_of("Test Quarterback") == "Test Team"
+        assert cache.misses == 2
+        assert cache.version == 2
+
+
 if __name__ == "__main__":
-    test_depth_chart_parser()
\ No newline at end of file
+    test_depth_chart_parser()
+    test_depth_chart_index()
+    test_depth_chart_cache()
\ No newline at end of file
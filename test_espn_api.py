@@ -0,0 +1,160 @@
+"""Test the ESPN scoreboard API source against recorded responses served locally."""
+
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+from app.espn_api import compare_sources, parse_scoreboard_json, scoreboard_url
+from app.espn_scraper import ScheduleCache, parse_espn_schedule_html
+
+HTML_FIXTURE = Path("fixtures/espn_schedule_week13.html")
+JSON_FIXTURE = Path("fixtures/espn_scoreboard_week13.json")
+SCHEDULE_PATH = "/nfl/schedule/_/week/13/year/2025/seasontype/2"
+SCOREBOARD_PATH = "/apis/site/v2/sports/football/nfl/scoreboard"
+
+# Fields both sources fill in the same way
+SHARED_FIELDS = ["away_team", "home_team", "time", "kickoff", "matchup", "day_of_week",
+                 "away_abbrev", "home_abbrev", "time_slot", "game_id"]
+
+
+class FakeEspn:
+    """Serves the recorded schedule page and scoreboard response."""
+
+    def __init__(self):
+        self.requests = []
+        self.api_available = True
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                fake.requests.append(self.path)
+                if self.path.startswith(SCOREBOARD_PATH) and fake.api_available:
+                    body, content_type = JSON_FIXTURE.read_bytes(), "application/json"
+                elif self.path == SCHEDULE_PATH:
+                    body, content_type = HTML_FIXTURE.read_bytes(), "text/html; charset=utf-8"
+                else:
+                    self.send_response(503)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def base(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def cache(self, **options) -> ScheduleCache:
+        return ScheduleCache(scoreboard_url=self.base + SCOREBOARD_PATH, **options)
+
+
+@pytest.fixture
+def espn():
+    fake = FakeEspn()
+    fake.thread.start()
+    yield fake
+    fake.server.shutdown()
+    fake.server.server_close()
+
+
+def test_scoreboard_matches_schedule_page():
+    html_games, html_meta = parse_espn_schedule_html(HTML_FIXTURE.read_bytes(), "https://www.espn.com" + SCHEDULE_PATH)
+    json_games, json_meta = parse_scoreboard_json(JSON_FIXTURE.read_bytes())
+
+    assert [{k: g.to_dict()[k] for k in SHARED_FIELDS} for g in json_games] == \
+        [{k: g.to_dict()[k] for k in SHARED_FIELDS} for g in html_games]
+    assert (json_meta["week"], json_meta["year"], json_meta["games_found"]) == (13, 2025, 16)
+    assert (html_meta["week"], html_meta["year"]) == (13, 2025)
+
+    # Only the API has venues
+    first = json_games[0].to_dict()
+    assert first["kickoff"] == "2025-11-27T18:00:00+00:00" and first["venue"] == "Ford Field"
+    assert json_games[-1].time == "8:15 PM" and json_games[-1].day_of_week == "Monday"
+    assert html_games[0].to_dict()["venue"] == ""
+
+
+def test_unscheduled_kickoffs_and_bad_responses():
+    data = json.loads(JSON_FIXTURE.read_text(encoding="utf-8"))
+    data["events"][14]["competitions"][0]["timeValid"] = False
+    games, _ = parse_scoreboard_json(json.dumps(data).encode("utf-8"))
+    assert games[14].time == "TBD" and games[14].kickoff is None
+    assert games[14].day_of_week == "Sunday" and games[14].time_slot == "tbd"
+
+    with pytest.raises(ValueError):
+        parse_scoreboard_json(b"<html></html>")
+    assert scoreboard_url("https://www.espn.com" + SCHEDULE_PATH) == \
+        "https://site.api.espn.com" + SCOREBOARD_PATH + "?dates=2025&seasontype=2&week=13"
+    with pytest.raises(ValueError):
+        scoreboard_url("https://www.espn.com/nfl/schedule")
+
+
+def test_source_is_selectable_per_request(espn):
+    cache = espn.cache(source="html")
+    page_url = espn.base + SCHEDULE_PATH
+
+    games, metadata = cache.get(page_url, "json")
+    assert len(games) == 16 and games[0].venue == "Ford Field"
+    assert metadata["source"] == "json" and metadata["fetch_ms"] > 0 and metadata["parse_ms"] > 0
+    assert espn.requests == [SCOREBOARD_PATH + "?dates=2025&seasontype=2&week=13"]
+
+    games, metadata = cache.get(page_url)
+    assert len(games) == 16 and games[0].venue == "" and metadata["source"] == "html"
+    assert cache.version_of(page_url, "json") != cache.version_of(page_url)
+
+    # Both sources are cached separately, with fetch/parse latency per source
+    cache.get(page_url, "json")
+    stats = cache.stats()
+    assert len(espn.requests) == 2 and stats["entries"] == 2 and stats["hits"] == 1
+    assert stats["latency"]["json"]["fetches"] == 1 and stats["latency"]["html"]["fetches"] == 1
+    assert stats["latency"]["json"]["avg_parse_ms"] > 0
+
+    with pytest.raises(ValueError):
+        cache.get(page_url, "xml")
+
+
+def test_api_failure_falls_back_to_schedule_page(espn):
+    espn.api_available = False
+    cache = espn.cache(source="json")
+    page_url = espn.base + SCHEDULE_PATH
+
+    games, metadata = cache.get(page_url)
+    assert len(games) == 16 and metadata["source"] == "html"
+    assert cache.stats()["fallbacks"] == 1 and cache.stats()["errors"] == 1
+    assert cache.version_of(page_url) is not None  # The page's version is what was served
+
+    # A URL without a week can't be mapped to the API at all
+    with pytest.raises(Exception):
+        cache.get(espn.base + "/nfl/schedule")
+    assert cache.stats()["fallbacks"] == 2
+
+
+def test_latency_comparison(espn):
+    with httpx.Client() as client:
+        rows = compare_sources(espn.base + SCHEDULE_PATH, lambda url, headers: client.get(url, headers=headers),
+                               repeat=2, base_url=espn.base + SCOREBOARD_PATH)
+    assert [row["source"] for row in rows] == ["html", "json"]
+    for row in rows:
+        assert row["games"] == 16
+        assert row["fetch_ms"] > 0 and row["parse_ms"] > 0 and row["total_ms"] >= row["fetch_ms"]
+
+
+def test_games_endpoint_rejects_unknown_source():
+    response = TestClient(main.app).get("/api/games", params={"source": "xml"})
+    assert response.status_code == 400
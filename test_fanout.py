@@ -0,0 +1,122 @@
+"""Test parallel fan-out pick generation with a mock OpenAI client."""
+
+import json
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from app import ai_client
+from app.completion_cache import CompletionCache
+from app.config import Settings
+from app.espn_scraper import parse_espn_schedule_html
+from app.models import WeeklyPicksModel
+
+FIXTURE_URL = "https://www.espn.com/nfl/schedule/_/week/13/year/2025/seasontype/2"
+SAMPLE_PICKS_PATH = "app/data/week_14_2025-12-06.json"
+
+
+def load_fixture_schedule():
+    with open("fixtures/espn_schedule_week13.html", "rb") as f:
+        return parse_espn_schedule_html(f.read(), FIXTURE_URL)
+
+
+class MockClient:
+    """Answers each request after a fixed delay, tracking concurrency and prompts."""
+
+    def __init__(self, respond, delay: float = 0.2):
+        self.respond = respond
+        self.delay = delay
+        self.prompts = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self.chat = SimpleNamespace(completions=SimpleNamespace(parse=self.parse))
+
+    def parse(self, model, messages, response_format, temperature):
+        prompt = messages[-1]["content"]
+        with self._lock:
+            self.prompts.append(prompt)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        message = SimpleNamespace(parsed=self.respond(prompt), refusal=None)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def sample_picks() -> dict:
+    with open(SAMPLE_PICKS_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_time_slot_fanout_runs_concurrently_and_dedupes(monkeypatch, tmp_path):
+    schedule = load_fixture_schedule()
+    monkeypatch.setattr(ai_client, "get_cached_schedule", lambda url: schedule)
+    monkeypatch.setattr(ai_client, "completion_cache", CompletionCache(tmp_path))
+    sample = sample_picks()
+
+    def respond(prompt):
+        # Every slot "recommends" Josh Allen; each also adds one slot-specific QB
+        data = json.loads(json.dumps(sample))
+        allen = data["categories"]["qbs"][0]
+        extra = dict(allen, name=f"Slot QB {prompt.count('**') // 2}")
+        data["categories"]["qbs"] = [allen, extra]
+        return WeeklyPicksModel.model_validate(data)
+
+    client = MockClient(respond)
+    config = Settings(espn_game_data_link=FIXTURE_URL, use_game_selection=False)
+    stages = []
+
+    started = time.perf_counter()
+    picks = ai_client.generate_picks_fanout(config, mode="time_slot", max_concurrency=5,
+                                            progress=stages.append, client=client)
+    elapsed = time.perf_counter() - started
+
+    # Fixture has five slots: thursday, early, afternoon, night, monday
+    assert len(client.prompts) == 5
+    assert client.max_in_flight == 5
+    assert elapsed < 5 * client.delay * 0.8  # Clearly faster than sequential
+
+    # Each request only sees its own slot's games
+    afternoon = [p for p in client.prompts if "**Buffalo @ Pittsburgh**" in p]
+    assert len(afternoon) == 1
+    assert "**Green Bay @ Detroit**" not in afternoon[0]
+
+    names = [p.name for p in picks.categories.qbs]
+    assert names.count("Josh Allen") == 1
+    assert stages == ["prompt_rendered", "model_called", "validated"]
+
+
+def test_position_fanout_keeps_only_requested_category(monkeypatch, tmp_path):
+    schedule = load_fixture_schedule()
+    monkeypatch.setattr(ai_client, "get_cached_schedule", lambda url: schedule)
+    monkeypatch.setattr(ai_client, "completion_cache", CompletionCache(tmp_path))
+    sample = sample_picks()
+
+    def respond(prompt):
+        # The model over-delivers; merge must keep only the requested category
+        return WeeklyPicksModel.model_validate(sample)
+
+    client = MockClient(respond, delay=0.05)
+    config = Settings(espn_game_data_link=FIXTURE_URL, include_long_shots=True)
+    picks = ai_client.generate_picks_fanout(config, mode="position", max_concurrency=2, client=client)
+
+    assert len(client.prompts) == 5
+    assert client.max_in_flight == 2
+    assert any("Only provide tight ends" in p for p in client.prompts)
+    for category in ("qbs", "rbs", "wrs", "tes"):
+        assert len(getattr(picks.categories, category)) == len(sample["categories"][category])
+    assert len(picks.long_shots.players) == len(sample["long_shots"]["players"])
+
+
+def test_generate_picks_dispatches_to_fanout(monkeypatch):
+    calls = []
+    monkeypatch.setattr(ai_client, "generate_picks_fanout",
+                        lambda config, mode, progress, client, bypass_cache: calls.append(mode) or "merged")
+    config = Settings(generation_fanout="position")
+    assert ai_client.generate_picks(config) == "merged"
+    assert calls == ["position"]
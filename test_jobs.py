@@ -0,0 +1,281 @@
+"""Test the background job queue used for pick generation."""
+
+import os
+import sqlite3
+import threading
+import time
+
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from fastapi.testclient import TestClient
+
+from app import main
+from app.ai_client import load_picks
+from app.jobs import JobEvents, JobManager, SQLiteJobStore
+
+
+def wait_until_done(manager: JobManager, job_id: str, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = manager.get(job_id)
+        if job.done:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+def test_duplicate_submissions_coalesce():
+    manager = JobManager(max_workers=2)
+    release = threading.Event()
+    calls = []
+
+    def work(value, progress):
+        calls.append(value)
+        progress("prompt_rendered")
+        release.wait(5)
+        progress("saved")
+        return value * 2
+
+    first, coalesced_first = manager.submit("same-inputs", work, 21)
+    second, coalesced_second = manager.submit("same-inputs", work, 21)
+    other, _ = manager.submit("other-inputs", work, 1)
+
+    assert not coalesced_first and coalesced_second
+    assert second is first and first.submissions == 2
+    assert other is not first
+
+    release.set()
+    job = wait_until_done(manager, first.id)
+    assert job.status == "succeeded" and job.result == 42
+    assert [s["stage"] for s in job.stages] == ["prompt_rendered", "saved"]
+    wait_until_done(manager, other.id)
+    assert sorted(calls) == [1, 21]
+
+    # Once finished, the same inputs start a fresh job
+    again, coalesced = manager.submit("same-inputs", work, 21)
+    assert not coalesced and again.id != first.id
+    wait_until_done(manager, again.id)
+    manager.shutdown()
+
+
+def test_failed_job_reports_error_and_prunes_history():
+    manager = JobManager(max_workers=1, max_finished_jobs=2)
+
+    def fail(progress):
+        progress("prompt_rendered")
+        raise Exception("OpenAI unavailable")
+
+    job, _ = manager.submit("failing", fail)
+    job = wait_until_done(manager, job.id)
+    assert job.status == "failed" and job.error == "OpenAI unavailable"
+    assert job.to_dict()["stage"] == "prompt_rendered"
+
+    for i in range(3):
+        finished, _ = manager.submit(f"job-{i}", lambda progress: None)
+        wait_until_done(manager, finished.id)
+    assert len(manager.list()) == 2
+    manager.shutdown()
+
+
+def test_job_events_are_replayed_and_released_when_the_job_finishes():
+    manager = JobManager(max_workers=1)
+    release = threading.Event()
+
+    def work(progress, events):
+        events.publish("pick", 1)
+        release.wait(5)
+        events.publish("pick", 2)
+        return "done"
+
+    events = JobEvents()
+    job, _ = manager.submit("streamed", work, events=events)
+    assert job.events is events
+    follower = events.follow()
+    assert next(follower) == ("pick", 1)
+
+    release.set()
+    wait_until_done(manager, job.id)
+    assert job.events is None  # Nothing outlives the job, even if no viewer reads on
+    assert list(follower) == [("pick", 2)]
+    assert list(events.follow()) == [("pick", 1), ("pick", 2)]  # Late followers get everything
+    manager.shutdown()
+
+
+def test_workers_share_jobs_through_sqlite(tmp_path):
+    db_path = tmp_path / "state.sqlite3"
+    first, second = JobManager(store=SQLiteJobStore(db_path)), JobManager(store=SQLiteJobStore(db_path))
+    release = threading.Event()
+
+    def work(progress):
+        progress("prompt_rendered")
+        release.wait(5)
+        return {"week": 14}
+
+    job, _ = first.submit("same-inputs", work)
+    elsewhere, coalesced = second.submit("same-inputs", work)  # Another worker: no second run
+    assert coalesced and elsewhere.id == job.id and elsewhere.submissions == 2
+
+    deadline = time.monotonic() + 5
+    while second.get(job.id).stages == [] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    polled = second.get(job.id)
+    assert polled.status == "running" and polled.stages[0]["stage"] == "prompt_rendered"
+
+    release.set()
+    wait_until_done(first, job.id)
+    polled = second.get(job.id)
+    assert polled.status == "succeeded" and polled.result == {"week": 14}
+    assert polled.to_dict()["submissions"] == 2
+    assert second.get("unknown") is None
+    first.shutdown()
+    second.shutdown()
+
+
+def test_jobs_of_stopped_workers_are_failed(tmp_path):
+    store = SQLiteJobStore(tmp_path / "state.sqlite3")
+    stopped = JobManager(store=store)
+    release = threading.Event()
+    job, _ = stopped.submit("same-inputs", lambda progress: release.wait(5))
+
+    # A worker on this host whose process is gone
+    store._write(lambda connection: connection.execute("UPDATE jobs SET owner = ? WHERE id = ?",
+                                                       (f"{store._host}:999999999", job.id)))
+    survivor = JobManager(store=SQLiteJobStore(tmp_path / "state.sqlite3"))
+    lost = survivor.get(job.id)
+    assert lost.status == "failed" and lost.error == "Worker stopped before the job finished"
+
+    retried, coalesced = survivor.submit("same-inputs", lambda progress: "done")
+    assert not coalesced and retried.id != job.id
+    assert wait_until_done(survivor, retried.id).result == "done"
+    release.set()
+    stopped.shutdown()
+    survivor.shutdown()
+
+
+def test_polls_read_without_the_write_lock(tmp_path):
+    store = SQLiteJobStore(tmp_path / "state.sqlite3")
+    manager = JobManager(store=store)
+    release = threading.Event()
+    job, _ = manager.submit("same-inputs", lambda progress: release.wait(5))
+
+    # Another worker is mid-write (e.g. saving job progress)
+    writer = sqlite3.connect(tmp_path / "state.sqlite3", isolation_level=None)
+    writer.execute("BEGIN IMMEDIATE")
+    started = time.monotonic()
+    assert SQLiteJobStore(tmp_path / "state.sqlite3").load(job.id).status in ("queued", "running")
+    assert time.monotonic() - started < 1
+    writer.execute("ROLLBACK")
+    writer.close()
+    release.set()
+    wait_until_done(manager, job.id)
+    manager.shutdown()
+
+
+def test_nothing_coalesces_onto_a_finishing_job(tmp_path):
+    saving_result, finish = threading.Event(), threading.Event()
+
+    class SlowStore(SQLiteJobStore):
+        def save(self, job):
+            if job.done:
+                saving_result.set()
+                finish.wait(5)
+            super().save(job)
+
+    manager = JobManager(store=SlowStore(tmp_path / "state.sqlite3"))
+    job, _ = manager.submit("same-inputs", lambda progress: "first")
+    assert saving_result.wait(5)
+
+    submitted = []
+    submitter = threading.Thread(target=lambda: submitted.append(manager.submit("same-inputs", lambda progress: "second")))
+    submitter.start()
+    time.sleep(0.1)
+    finish.set()
+    submitter.join(5)
+
+    again, coalesced = submitted[0]
+    assert not coalesced and again.id != job.id
+    assert wait_until_done(manager, again.id).result == "second"
+    manager.shutdown()
+
+
+def test_run_endpoint_returns_job_immediately(monkeypatch):
+    release = threading.Event()
+
+    def fake_generate_and_save(config, progress, bypass_cache=False):
+        for stage in ("prompt_rendered", "model_called", "validated"):
+            progress(stage)
+        release.wait(5)
+        progress("saved")
+        return load_picks("app/data/week_14_2025-12-06.json")
+
+    monkeypatch.setattr(main, "generate_and_save_picks", fake_generate_and_save)
+    form = {
+        "espn_game_data_link": "https://www.espn.com/nfl/schedule/_/week/14/year/2025/seasontype/2",
+        "slate_description": "Sunday main slate",
+        "note": "Test run",
+        "focus_games": "all",
+        "prop_focus": "mix",
+        "min_articles_for_sentiment": "3",
+        "include_long_shots": "true",
+    }
+
+    with TestClient(main.app) as client:
+        headers = {"Accept": "application/json"}
+        response = client.post("/admin/run", data=form, headers=headers)
+        assert response.status_code == 202
+        job_id = response.json()["job_id"]
+
+        duplicate = client.post("/admin/run", data=form, headers=headers).json()
+        assert duplicate["job_id"] == job_id and duplicate["coalesced"]
+
+        assert client.get(f"/api/jobs/{job_id}/result").status_code == 202
+
+        release.set()
+        wait_until_done(main.job_manager, job_id)
+        status = client.get(f"/api/jobs/{job_id}").json()
+        assert status["status"] == "succeeded"
+        assert [s["stage"] for s in status["stages"]] == ["prompt_rendered", "model_called", "validated", "saved"]
+
+        result = client.get(f"/api/jobs/{job_id}/result")
+        assert result.status_code == 200
+        assert result.json()["meta"]["week"] == 14
+
+        assert client.get("/api/jobs/unknown").status_code == 404
+
+
+def test_run_endpoint_errors_match_the_requested_format(monkeypatch):
+    class FailingStore:
+        def __init__(self, error):
+            self.error = error
+
+        def update(self, **changes):
+            raise self.error
+
+    form = {
+        "espn_game_data_link": "https://www.espn.com/nfl/schedule/_/week/14/year/2025/seasontype/2",
+        "slate_description": "Sunday main slate",
+        "note": "Test run",
+        "focus_games": "all",
+        "prop_focus": "mix",
+        "min_articles_for_sentiment": "3",
+    }
+    client = TestClient(main.app)
+    headers = {"Accept": "application/json"}
+
+    monkeypatch.setattr(main, "settings_store", FailingStore(ValueError("bad selection")))
+    response = client.post("/admin/run", data=form, headers=headers)
+    assert response.status_code == 400 and "bad selection" in response.json()["detail"]
+
+    monkeypatch.setattr(main, "settings_store", FailingStore(RuntimeError("database is locked")))
+    response = client.post("/admin/run", data=form, headers=headers)
+    assert response.status_code == 500 and "database is locked" in response.json()["detail"]
+
+    # Plain form posts still return to the admin page with the error
+    response = client.post("/admin/run", data=form, follow_redirects=False)
+    assert response.status_code == 303 and "error=" in response.headers["location"]
+
+
+if __name__ == "__main__":
+    test_duplicate_submissions_coalesce()
+    test_failed_job_reports_error_and_prunes_history()
+    print("✅ Job queue tests passed")
@@ -0,0 +1,196 @@
+"""Test the shared OpenAI client against a local fake OpenAI-compatible server."""
+
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+import openai
+import pytest
+from fastapi.testclient import TestClient
+
+from app import ai_client, main
+from app.config import settings
+from app.openai_client import CircuitOpenError, OpenAIClientManager
+
+PICKS_JSON = Path("app/data/week_14_2025-12-06.json").read_text(encoding="utf-8")
+
+
+def completion(content: str) -> dict:
+    return {
+        "id": "chatcmpl-test",
+        "object": "chat.completion",
+        "created": 0,
+        "model": ai_client.OPENAI_MODEL,
+        "choices": [{
+            "index": 0,
+            "finish_reason": "stop",
+            "message": {"role": "assistant", "content": content, "refusal": None},
+        }],
+    }
+
+
+class FakeOpenAI:
+    """Serves scripted (status, headers, body) responses to /v1/chat/completions."""
+
+    def __init__(self):
+        self.responses = []
+        self.requests = []  # (path, client port) per request
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep-alive, so connection reuse is visible
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                fake.requests.append((self.path, self.client_address[1]))
+                status, headers, body = fake.responses.pop(0)
+                data = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_address[1]}/v1"
+
+    def reply(self, status: int, body: dict, **headers) -> None:
+        self.responses.append((status, headers, body))
+
+    def error(self, status: int, **headers) -> None:
+        self.reply(status, {"error": {"message": f"status {status}", "type": "server_error"}}, **headers)
+
+
+@pytest.fixture
+def fake_openai():
+    fake = FakeOpenAI()
+    fake.thread.start()
+    yield fake
+    fake.server.shutdown()
+    fake.server.server_close()
+
+
+@pytest.fixture
+def manager(fake_openai, monkeypatch):
+    clients = OpenAIClientManager()
+    monkeypatch.setattr(ai_client, "openai_clients", clients)
+    yield clients
+    clients.close()
+
+
+def client_config(fake: FakeOpenAI, **update):
+    return settings.model_copy(update={"openai_base_url": fake.base_url, "openai_max_retries": 3,
+                                       "openai_retry_base_delay": 0.01, **update})
+
+
+def test_retries_honor_retry_after_on_one_pooled_connection(fake_openai, manager):
+    client = manager.get(client_config(fake_openai))
+    delays = []
+    manager.retry_policy.sleep = delays.append
+
+    fake_openai.error(503)
+    fake_openai.error(429, **{"retry-after-ms": "250"})
+    fake_openai.error(429, **{"Retry-After": "2"})
+    fake_openai.reply(200, completion(PICKS_JSON))
+
+    picks = ai_client.request_picks(client, "prompt")
+    assert picks.meta.week == 14
+    assert 0 <= delays[0] <= 0.01 and delays[1:] == [0.25, 2.0]
+    assert manager.stats()["retries"] == 3
+
+    # The same client (and TCP connection) serves every attempt and later calls
+    fake_openai.reply(200, completion(PICKS_JSON))
+    assert manager.get(client_config(fake_openai)) is client
+    ai_client.request_picks(client, "prompt")
+    assert [path for path, _ in fake_openai.requests] == ["/v1/chat/completions"] * 5
+    assert len({port for _, port in fake_openai.requests}) == 1
+
+
+def test_retries_give_up_and_client_errors_are_not_retried(fake_openai, manager):
+    client = manager.get(client_config(fake_openai, openai_max_retries=1))
+    manager.retry_policy.sleep = lambda delay: None
+
+    fake_openai.error(500)
+    fake_openai.error(502)
+    with pytest.raises(openai.InternalServerError):
+        ai_client.request_picks(client, "prompt")
+    assert len(fake_openai.requests) == 2
+
+    fake_openai.error(400)
+    with pytest.raises(openai.BadRequestError):
+        ai_client.request_picks(client, "prompt")
+    assert len(fake_openai.requests) == 3
+    assert manager.breaker.state == "closed" and manager.breaker.failures == 0
+
+
+def test_circuit_breaker_fails_fast_then_recovers(fake_openai, manager):
+    client = manager.get(client_config(fake_openai, openai_max_retries=0, openai_circuit_failure_threshold=2,
+                                       openai_circuit_reset_seconds=30))
+    now = [0.0]
+    manager.breaker.clock = lambda: now[0]
+
+    for _ in range(2):
+        fake_openai.error(503)
+        with pytest.raises(openai.InternalServerError):
+            ai_client.request_picks(client, "prompt")
+    assert manager.breaker.state == "open"
+
+    with pytest.raises(CircuitOpenError):
+        ai_client.request_picks(client, "prompt")
+    assert len(fake_openai.requests) == 2  # Rejected without a request
+
+    # After the reset timeout one trial call goes through; a failure reopens the circuit
+    now[0] = 31.0
+    fake_openai.error(503)
+    with pytest.raises(openai.InternalServerError):
+        ai_client.request_picks(client, "prompt")
+    assert manager.breaker.state == "open"
+
+    now[0] = 62.0
+    fake_openai.reply(200, completion(PICKS_JSON))
+    assert ai_client.request_picks(client, "prompt").meta.week == 14
+    assert manager.breaker.stats() == {"state": "closed", "failures": 0, "rejected": 1}
+
+
+def test_replaced_client_stays_open_for_requests_using_it(fake_openai, manager):
+    old_config = client_config(fake_openai)
+    new_config = client_config(fake_openai, openai_timeout_seconds=5)
+
+    with manager.lease(old_config) as leased:
+        replacement = manager.get(new_config)
+        assert replacement is not leased and not leased.is_closed()
+        fake_openai.reply(200, completion(PICKS_JSON))
+        assert ai_client.request_picks(leased, "prompt").meta.week == 14
+    assert leased.is_closed() and not replacement.is_closed()
+
+    # A client nobody is using is closed as soon as it is replaced
+    manager.get(old_config)
+    assert replacement.is_closed()
+
+
+def test_lifespan_opens_and_closes_client(monkeypatch):
+    clients = OpenAIClientManager()
+    monkeypatch.setattr(main, "openai_clients", clients)
+
+    with TestClient(main.app) as client:
+        assert client.get("/api/cache/stats").status_code == 200
+        for _ in range(500):  # Opened in the background, off the startup path
+            if clients.stats()["client_open"]:
+                break
+            time.sleep(0.01)
+        assert clients.stats()["client_open"]
+    assert not clients.stats()["client_open"]
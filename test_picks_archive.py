@@ -0,0 +1,99 @@
+"""Test the compact archive storage backend for picks."""
+
+import os
+import shutil
+from pathlib import Path
+
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from app.ai_client import load_picks, save_picks
+from app.config import settings
+from app.picks_archive import (
+    PicksArchive,
+    compare,
+    encode_picks,
+    migrate,
+    read_archive,
+    resolve_picks_path,
+)
+from app.picks_index import PicksIndex
+from app.picks_store import PicksStore
+
+SOURCE_DIR = Path("app/data")
+SAMPLE_PICKS_PATH = SOURCE_DIR / "week_14_2025-12-06.json"
+
+
+def test_archive_round_trips_every_picks_file():
+    for path in sorted(SOURCE_DIR.glob("week_*.json")):
+        picks = load_picks(str(path))
+        archive = PicksArchive(encode_picks(picks))
+        assert archive.to_model() == picks
+        assert len(encode_picks(picks)) < path.stat().st_size / 2
+
+
+def test_categories_decode_lazily():
+    picks = load_picks(str(SAMPLE_PICKS_PATH))
+    archive = PicksArchive(encode_picks(picks))
+    assert archive.meta == picks.meta
+
+    assert archive.category("wrs") == picks.categories.wrs
+    assert list(archive._decoded) == ["wrs"]
+    assert archive.category("wrs") is archive.category("wrs")
+    assert archive.long_shots() == picks.long_shots
+
+    # Teams and source names are stored once in the string table
+    assert len(archive.strings) == len(set(archive.strings))
+    assert "Kansas City Chiefs" in archive.strings
+
+
+def test_archive_backend_stores_current_week_once(tmp_path):
+    picks = load_picks(str(SAMPLE_PICKS_PATH))
+    current = tmp_path / "current_picks.json"
+    archive_config = settings.model_copy(update={"picks_storage_backend": "archive"})
+
+    save_picks(picks, str(current), archive_config)
+    archives = list(tmp_path.glob("week_*.msgpack"))
+    assert len(archives) == 1
+    assert not list(tmp_path.glob("*.json"))
+    assert resolve_picks_path(current) == [tmp_path / "current_picks.ptr", archives[0]]
+    assert (tmp_path / "current_picks.ptr").stat().st_size < 64
+
+    # Readers keep using the .json names
+    store = PicksStore()
+    assert store.get(current).picks == picks
+    assert store.get(archives[0].with_suffix(".json")).picks == picks
+    index = PicksIndex(tmp_path / "index.sqlite3", tmp_path)
+    assert index.sync()["indexed"] == 1
+    assert index.list_files()["files"][0]["filename"] == archives[0].name
+
+    # Switching back to JSON replaces the archive copies
+    save_picks(picks, str(current), settings.model_copy(update={"picks_storage_backend": "json"}))
+    assert not list(tmp_path.glob("week_*.msgpack")) and not (tmp_path / "current_picks.ptr").exists()
+    assert store.get(current).picks == picks
+    assert index.sync() == {"indexed": 1, "unchanged": 0, "removed": 1, "invalid": 0}
+
+
+def test_migrate_and_compare(tmp_path):
+    for path in SOURCE_DIR.glob("week_*.json"):
+        shutil.copy(path, tmp_path / path.name)
+    shutil.copy(SAMPLE_PICKS_PATH, tmp_path / "current_picks.json")
+
+    rows = compare(tmp_path)
+    assert {row["file"] for row in rows} >= {"current_picks.json", SAMPLE_PICKS_PATH.name}
+    assert all(row["archive_bytes"] < row["json_bytes"] for row in rows)
+
+    summary = migrate(tmp_path)
+    assert len(summary["migrated"]) == len(list(SOURCE_DIR.glob("week_*.json")))
+    assert summary["pointer"] == SAMPLE_PICKS_PATH.with_suffix(".msgpack").name
+    assert summary["bytes_after"] < summary["bytes_before"] / 3
+    assert not list(tmp_path.glob("*.json"))
+
+    store = PicksStore()
+    assert store.get(tmp_path / "current_picks.json").picks == load_picks(str(SAMPLE_PICKS_PATH))
+    assert read_archive(tmp_path / SAMPLE_PICKS_PATH.with_suffix(".msgpack").name).meta.week == 14
+
+
+if __name__ == "__main__":
+    test_archive_round_trips_every_picks_file()
+    test_categories_decode_lazily()
+    print("✅ Picks archive tests passed")
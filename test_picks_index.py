@@ -0,0 +1,87 @@
+"""Test the SQLite index of historical picks."""
+
+import os
+import shutil
+from pathlib import Path
+
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from fastapi.testclient import TestClient
+
+from app import main
+from app.ai_client import load_picks
+from app.picks_index import PicksIndex
+
+SOURCE_DIR = Path("app/data")
+HISTORY_FILES = ["week_13_2025-12-06.json", "week_14_2025-12-03.json", "week_14_2025-12-06.json"]
+
+
+def make_index(tmp_path) -> PicksIndex:
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    for name in HISTORY_FILES:
+        shutil.copy(SOURCE_DIR / name, data_dir / name)
+    return PicksIndex(data_dir / "picks_index.sqlite3", data_dir)
+
+
+def test_sync_builds_index_in_one_pass_and_is_incremental(tmp_path):
+    index = make_index(tmp_path)
+    assert index.sync() == {"indexed": 3, "unchanged": 0, "removed": 0, "invalid": 0}
+    assert index.sync()["unchanged"] == 3
+
+    (index.data_dir / "week_14_2025-12-03.json").unlink()
+    (index.data_dir / "week_12_2025-11-20.json").write_text("{not json", encoding="utf-8")
+    counts = index.sync()
+    assert counts["removed"] == 1 and counts["invalid"] == 1 and counts["unchanged"] == 2
+
+    # A fresh process reuses the persisted index
+    reopened = PicksIndex(index.db_path, index.data_dir)
+    assert reopened.list_files()["total"] == 2
+
+
+def test_listing_is_paginated_newest_first(tmp_path):
+    index = make_index(tmp_path)
+    index.sync()
+
+    first = index.list_files(page=1, page_size=2)
+    assert first["total"] == 3
+    assert [f["filename"] for f in first["files"]] == ["week_14_2025-12-06.json", "week_14_2025-12-03.json"]
+    assert first["files"][0]["display_name"] == "Week 14 - 2025-12-06"
+    assert first["files"][0]["player_count"] > 0
+
+    second = index.list_files(page=2, page_size=2)
+    assert [f["filename"] for f in second["files"]] == ["week_13_2025-12-06.json"]
+
+
+def test_player_history_across_weeks(tmp_path):
+    index = make_index(tmp_path)
+    index.sync()
+
+    history = index.player_history("patrick mahomes")
+    assert [row["week"] for row in history] == [14, 14, 13]
+    assert all(row["category"] == "qbs" and row["position"] == "QB" for row in history)
+    assert index.player_history("Patrick Mahomes", limit=1)[0]["filename"] == "week_14_2025-12-06.json"
+    assert index.player_history("Javonte Williams")[0]["category"] == "long_shots"
+    assert index.player_history("Nobody") == []
+
+    # Files saved later are added without a resync
+    picks = load_picks(str(SOURCE_DIR / "week_13_2025-12-06.json"))
+    saved = index.data_dir / "week_15_2025-12-13.json"
+    saved.write_text(picks.model_dump_json(indent=2), encoding="utf-8")
+    assert index.add(saved, picks)
+    assert index.player_history("Patrick Mahomes")[0]["week"] == 15
+    assert not index.add(tmp_path / "elsewhere.json", picks)
+
+
+def test_endpoints_use_index(tmp_path, monkeypatch):
+    index = make_index(tmp_path)
+    monkeypatch.setattr(main, "picks_index", index)
+
+    with TestClient(main.app) as client:  # Startup syncs the index
+        listing = client.get("/api/picks/list", params={"page_size": 2}).json()
+        assert listing["total"] == 3 and listing["page"] == 1
+        assert len([f for f in listing["files"] if f["filename"] != "current_picks.json"]) == 2
+
+        history = client.get("/api/players/Patrick Mahomes/picks", params={"limit": 2}).json()
+        assert history["count"] == 2
+        assert {row["filename"] for row in history["picks"]} == {"week_14_2025-12-03.json", "week_14_2025-12-06.json"}
@@ -0,0 +1,119 @@
+"""Test the in-memory picks store and cached picks responses."""
+
+import json
+import os
+import shutil
+
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from fastapi.testclient import TestClient
+
+from app import main
+from app.ai_client import load_picks, save_picks
+from app.config import settings
+from app.picks_store import BROTLI_AVAILABLE, PicksStore, choose_encoding, etag_matches, picks_store
+
+SAMPLE_PICKS_PATH = "app/data/week_14_2025-12-06.json"
+
+
+def bump_mtime(path):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_file_is_parsed_once_until_it_changes(tmp_path):
+    path = tmp_path / "current_picks.json"
+    shutil.copy(SAMPLE_PICKS_PATH, path)
+    store = PicksStore()
+
+    record = store.get(path)
+    assert store.get(path) is record
+    assert store.stats()["misses"] == 1 and store.stats()["hits"] == 1
+    assert json.loads(record.json_bytes) == record.picks.model_dump(mode="json")
+    assert record.data["meta"]["week"] == 14
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data["meta"]["slate_description"] = "Edited slate"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    bump_mtime(path)
+    reloaded = store.get(path)
+    assert reloaded is not record and reloaded.picks.meta.slate_description == "Edited slate"
+
+    path.unlink()
+    try:
+        store.get(path)
+        assert False, "deleted file should raise"
+    except FileNotFoundError:
+        pass
+    assert store.stats()["files"] == 0
+
+
+def test_save_picks_updates_store_without_reparse(tmp_path):
+    picks = load_picks(SAMPLE_PICKS_PATH)
+    current = tmp_path / "current_picks.json"
+    misses = picks_store.stats()["misses"]
+
+    save_picks(picks, str(current), settings)
+    record = picks_store.get(current)
+    assert record.picks is picks
+    assert record.pretty_json == current.read_text(encoding="utf-8")
+    history = [p for p in tmp_path.glob("week_*.json")]
+    assert len(history) == 1 and picks_store.get(history[0]).picks is picks
+    assert picks_store.stats()["misses"] == misses
+
+
+def test_api_serves_precomputed_bytes():
+    filename = os.path.basename(SAMPLE_PICKS_PATH)
+    with TestClient(main.app) as client:
+        first = client.get(f"/api/picks/{filename}")
+        hits = picks_store.stats()["hits"]
+        second = client.get(f"/api/picks/{filename}")
+        assert first.status_code == 200 and first.headers["content-type"] == "application/json"
+        assert first.content == second.content == picks_store.get(SAMPLE_PICKS_PATH).json_bytes
+        assert picks_store.stats()["hits"] > hits
+        assert second.json()["meta"]["week"] == 14
+        assert client.get("/api/picks/missing.json").status_code == 404
+
+
+def test_etag_revalidation_and_precompressed_variants():
+    filename = os.path.basename(SAMPLE_PICKS_PATH)
+    record = picks_store.get(SAMPLE_PICKS_PATH)
+    with TestClient(main.app) as client:
+        plain = client.get(f"/api/picks/{filename}", headers={"Accept-Encoding": "identity"})
+        assert plain.headers["etag"] == record.etag
+        assert "content-encoding" not in plain.headers
+        assert plain.headers["vary"] == "Accept-Encoding"
+
+        not_modified = client.get(f"/api/picks/{filename}", headers={"If-None-Match": record.etag})
+        assert not_modified.status_code == 304 and not_modified.content == b""
+        assert not_modified.headers["etag"] == record.etag
+        stale = client.get(f"/api/picks/{filename}", headers={"If-None-Match": '"old"'})
+        assert stale.status_code == 200
+
+        gzipped = client.get(f"/api/picks/{filename}", headers={"Accept-Encoding": "gzip"})
+        assert gzipped.headers["content-encoding"] == "gzip"
+        assert gzipped.json() == plain.json()
+        assert int(gzipped.headers["content-length"]) < len(record.json_bytes) / 3
+        assert record.body("gzip") is record.body("gzip")  # Compressed once
+
+        if BROTLI_AVAILABLE:
+            brotli = client.get(f"/api/picks/{filename}", headers={"Accept-Encoding": "gzip, br"})
+            assert brotli.headers["content-encoding"] == "br"
+            assert brotli.json() == plain.json()
+
+
+def test_choose_encoding_honours_quality_values():
+    assert choose_encoding("") == "identity"
+    assert choose_encoding("gzip;q=0, identity") == "identity"
+    assert choose_encoding("gzip, deflate") == "gzip"
+    assert choose_encoding("*") == ("br" if BROTLI_AVAILABLE else "gzip")
+    assert choose_encoding("br;q=0, gzip") == "gzip"
+    assert etag_matches('"a", W/"b"', '"b"') and etag_matches("*", '"c"')
+    assert not etag_matches('"a"', '"b"')
+
+
+if __name__ == "__main__":
+    test_api_serves_precomputed_bytes()
+    test_etag_revalidation_and_precompressed_variants()
+    test_choose_encoding_honours_quality_values()
+    print("✅ Picks store tests passed")
@@ -0,0 +1,102 @@
+"""Test fuzzy player-name matching against the depth chart."""
+
+import os
+from pathlib import Path
+
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from app.ai_client import validate_and_correct_picks
+from app.depth_chart_parser import DepthChartIndex, parse_depth_chart
+from app.models import WeeklyPicksModel
+from app.player_matcher import PlayerNameMatcher, benchmark, canonical_player_name
+
+DEPTH_CHART_PATH = Path("data/FantasyPros_Fantasy_Football_2025_Depth_Charts.csv")
+SAMPLE_PICKS_PATH = Path("app/data/week_14_2025-12-06.json")
+
+
+def load_index() -> DepthChartIndex:
+    return DepthChartIndex(parse_depth_chart(str(DEPTH_CHART_PATH)))
+
+
+def test_canonical_names():
+    assert canonical_player_name("D.J. Moore") == canonical_player_name("DJ Moore") == "dj moore"
+    assert canonical_player_name("C. J. Stroud") == "cj stroud"
+    assert canonical_player_name("Kenneth Walker III") == canonical_player_name("Ken Walker") == "kenneth walker"
+    assert canonical_player_name("Ja'Marr Chase") == "jamarr chase"
+    assert canonical_player_name("Amon-Ra St. Brown") == "amon ra st brown"
+    assert canonical_player_name("José Núñez Jr.") == "jose nunez"
+
+
+def test_fuzzy_match_on_depth_chart():
+    index = load_index()
+
+    cases = {
+        "DJ Moore": "DJ Moore",
+        "D.J. Moore": "DJ Moore",
+        "Kenneth Walker": "Kenneth Walker III",
+        "Jamarr Chase": "Ja'Marr Chase",
+        "Jaxon Smith Njigba": "Jaxon Smith-Njigba",
+        "Christian Mccaffery": "Christian McCaffrey",
+        "Jayden Reid": "Jayden Reed",
+    }
+    for query, expected in cases.items():
+        match = index.fuzzy_match(query)
+        assert match is not None and match.name == expected, query
+    assert index.fuzzy_match("D.J. Moore").score == 1.0
+    assert 0.85 <= index.fuzzy_match("Jayden Reid").score < 1.0
+    assert index.fuzzy_match("Jayden Reid").team == "Green Bay Packers"
+
+    # Names nobody on a roster resembles are rejected
+    assert index.fuzzy_match("Tom Brady") is None
+    assert index.fuzzy_match("Joe Smith") is None
+
+
+def test_claimed_team_breaks_ties():
+    matcher = PlayerNameMatcher([("Mike Williams", "New York Jets"), ("Mike Williamson", "Test Team")])
+    assert matcher.match("Mike Wiliamso").name == "Mike Williamson"
+    assert matcher.match("Mike Wiliamso", team="New York Jets").name == "Mike Williams"
+
+
+def test_validation_renames_close_spellings():
+    picks = WeeklyPicksModel.model_validate_json(SAMPLE_PICKS_PATH.read_text(encoding="utf-8"))
+    picks.categories.qbs[0].name = "Josh  Alen"
+    picks.categories.rbs[0].name = "Ken Walker"
+    picks.categories.rbs[0].team = "Seattle Seahawks"
+    picks.categories.rbs[0].verified = True
+    picks.long_shots.players[0].name = "Javonte Wiliams"
+    picks.long_shots.players[0].team = "Cowboys"
+
+    validate_and_correct_picks(picks, load_index())
+
+    assert picks.categories.qbs[0].name == "Josh Allen" and not picks.categories.qbs[0].verified
+    walker = picks.categories.rbs[0]
+    assert walker.name == "Kenneth Walker III" and walker.verified  # Same canonical name: still verified
+    assert "[NOT IN DEPTH CHART]" not in walker.matchup_note
+    assert picks.long_shots.players[0].name == "Javonte Williams"
+
+
+def test_similar_player_on_another_team_is_not_applied(capsys):
+    # A week-scoped chart without Brian Robinson Jr. (e.g. his team is on bye)
+    depth_chart = parse_depth_chart(str(DEPTH_CHART_PATH))
+    index = DepthChartIndex({team: depth_chart[team] for team in ("Atlanta Falcons", "Washington Commanders")})
+    picks = WeeklyPicksModel.model_validate_json(SAMPLE_PICKS_PATH.read_text(encoding="utf-8"))
+    robinson = picks.categories.rbs[0]
+    robinson.name, robinson.team, robinson.verified = "Brian Robinson", "Washington Commanders", True
+    picks.long_shots.players[0].name = "Javonte Wiliams"  # Claimed for Denver; Williams plays for Dallas
+
+    validate_and_correct_picks(picks, index)
+
+    assert (robinson.name, robinson.team) == ("Brian Robinson", "Washington Commanders")
+    assert not robinson.verified and "[NOT IN DEPTH CHART]" in robinson.matchup_note
+    assert "closest is 'Bijan Robinson' (Atlanta Falcons" in capsys.readouterr().out
+    assert picks.long_shots.players[0].name == "Javonte Wiliams"
+
+
+def test_benchmark_is_sub_millisecond_over_full_roster():
+    depth_chart = parse_depth_chart(str(DEPTH_CHART_PATH))
+    players = [(name, team) for team, positions in depth_chart.items()
+               for names in positions.values() for name in names]
+    results = benchmark(players, repeat=1)
+    assert results["names"] == len({canonical_player_name(name) for name, _ in players})
+    assert results["exact_mean_us"] < 1000 and results["typo_mean_us"] < 1000
+    assert results["typo_accuracy"] >= 0.95
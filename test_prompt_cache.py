@@ -0,0 +1,131 @@
+"""Test memoization of rendered prompts."""
+
+import asyncio
+import os
+import shutil
+import threading
+from pathlib import Path
+
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from app import ai_client
+from app.config import settings
+from app.depth_chart_parser import DEFAULT_DEPTH_CHART_PATH, DepthChartCache
+from app.espn_scraper import parse_espn_schedule_html
+from app.prompt_template import DEFAULT_PROMPT_PATH, PromptTemplateStore, RenderedPromptCache
+
+FIXTURE_PATH = Path("fixtures/espn_schedule_week13.html")
+
+
+def load_schedule():
+    return parse_espn_schedule_html(FIXTURE_PATH.read_bytes(), "https://www.espn.com/nfl/schedule/_/week/13/year/2025")
+
+
+def use_fresh_caches(monkeypatch, tmp_path, max_entries=8):
+    """Point render_prompt at a private prompt cache, template and depth chart copy."""
+    cache = RenderedPromptCache(max_entries=max_entries)
+    template_path = tmp_path / "weekly_picks.txt"
+    csv_path = tmp_path / "depth_charts.csv"
+    shutil.copy(DEFAULT_PROMPT_PATH, template_path)
+    shutil.copy(DEFAULT_DEPTH_CHART_PATH, csv_path)
+    store = PromptTemplateStore(template_path)
+    depth_charts = DepthChartCache(csv_path)
+    monkeypatch.setattr(ai_client, "rendered_prompt_cache", cache)
+    monkeypatch.setattr(ai_client, "prompt_template", store)
+    monkeypatch.setattr(ai_client, "depth_chart_cache", depth_charts)
+    return cache, store, csv_path
+
+
+def config_with(**update):
+    return settings.model_copy(update={"use_game_selection": True, **update})
+
+
+def test_unchanged_inputs_return_cached_prompt(monkeypatch, tmp_path):
+    cache, _, _ = use_fresh_caches(monkeypatch, tmp_path)
+    schedule = load_schedule()
+    a = config_with(selected_game_ids=["Buffalo_Pittsburgh_afternoon"])
+    b = config_with(selected_game_ids=["Denver_Washington_night"])
+
+    first = ai_client.render_prompt(schedule, a)
+    assert not ai_client.get_last_render_stats()["cache_hit"]
+    assert ai_client.render_prompt(schedule, a) is first
+    assert ai_client.get_last_render_stats()["cache_hit"]
+
+    # Toggling between configurations stays cached
+    second = ai_client.render_prompt(schedule, b)
+    assert "DENVER BRONCOS" in second and second is not first
+    assert ai_client.render_prompt(schedule, a) is first
+    assert ai_client.render_prompt(schedule, b) is second
+    assert cache.stats()["hits"] == 3 and cache.stats()["entries"] == 2
+
+    # Settings that do not appear in the prompt do not invalidate it
+    assert ai_client.render_prompt(schedule, a.model_copy(update={"generation_workers": 9})) is first
+
+    changed = ai_client.render_prompt(schedule, a.model_copy(update={"slate_description": "Late window"}))
+    assert "Late window" in changed
+
+
+def test_template_schedule_and_depth_chart_changes_invalidate(monkeypatch, tmp_path):
+    _, store, csv_path = use_fresh_caches(monkeypatch, tmp_path)
+    schedule = load_schedule()
+    config = config_with(selected_game_ids=["Buffalo_Pittsburgh_afternoon"])
+    first = ai_client.render_prompt(schedule, config)
+
+    store.save(store.text.replace("{{SLATE_DESCRIPTION}}", "{{SLATE_DESCRIPTION}} (edited)", 1))
+    edited = ai_client.render_prompt(schedule, config)
+    assert edited != first and "(edited)" in edited
+
+    # A re-fetched schedule is a different object and is never matched
+    ai_client.render_prompt(load_schedule(), config)
+    assert not ai_client.get_last_render_stats()["cache_hit"]
+
+    with open(csv_path, "a", encoding="utf-8") as f:
+        f.write("\n")
+    ai_client.render_prompt(schedule, config)
+    assert not ai_client.get_last_render_stats()["cache_hit"]
+
+    # Failed fetches are not cached
+    offline = ([], {"error": "ESPN unavailable"})
+    ai_client.render_prompt(offline, config)
+    ai_client.render_prompt(offline, config)
+    assert not ai_client.get_last_render_stats()["cache_hit"]
+
+
+def test_lru_keeps_most_recent_configurations(monkeypatch, tmp_path):
+    cache, _, _ = use_fresh_caches(monkeypatch, tmp_path, max_entries=2)
+    schedule = load_schedule()
+    configs = [config_with(note=f"note {i}", slate_description=f"slate {i}") for i in range(3)]
+
+    for config in configs:
+        ai_client.render_prompt(schedule, config)
+    assert cache.stats()["entries"] == 2
+
+    ai_client.render_prompt(schedule, configs[2])
+    assert ai_client.get_last_render_stats()["cache_hit"]
+    ai_client.render_prompt(schedule, configs[0])
+    assert not ai_client.get_last_render_stats()["cache_hit"]
+
+
+def test_async_render_runs_off_the_event_loop(monkeypatch, tmp_path):
+    use_fresh_caches(monkeypatch, tmp_path)
+    schedule = load_schedule()
+
+    async def cached_schedule(url):
+        return schedule
+
+    monkeypatch.setattr(ai_client, "get_cached_schedule_async", cached_schedule)
+    render_prompt = ai_client.render_prompt
+    render_threads = []
+
+    def recording_render(*args):
+        render_threads.append(threading.current_thread())
+        return render_prompt(*args)
+
+    monkeypatch.setattr(ai_client, "render_prompt", recording_render)
+
+    async def run():
+        return threading.current_thread(), await ai_client.render_prompt_async(config_with())
+
+    loop_thread, prompt = asyncio.run(run())
+    assert render_threads and render_threads[0] is not loop_thread
+    assert prompt == render_prompt(schedule, config_with())
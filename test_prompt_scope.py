@@ -0,0 +1,84 @@
+"""Test that the prompt only carries depth charts for teams in the selected games."""
+
+import os
+from pathlib import Path
+
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from app.ai_client import get_last_render_stats, render_prompt
+from app.config import settings
+from app.depth_chart_parser import DepthChartIndex, format_depth_chart_for_prompt, parse_depth_chart
+from app.espn_scraper import parse_espn_schedule_html
+
+FIXTURE_PATH = Path("fixtures/espn_schedule_week13.html")
+DEPTH_CHART_PATH = "data/FantasyPros_Fantasy_Football_2025_Depth_Charts.csv"
+
+
+def load_schedule():
+    return parse_espn_schedule_html(FIXTURE_PATH.read_bytes(), "https://www.espn.com/nfl/schedule/_/week/13/year/2025")
+
+
+def test_resolver_uses_espn_team_codes():
+    index = DepthChartIndex(parse_depth_chart(DEPTH_CHART_PATH))
+    games, _ = load_schedule()
+    by_id = {g.game_id: g for g in games}
+
+    assert index.teams_for_games([by_id["Atlanta_NewYork_early"]]) == ["Atlanta Falcons", "New York Jets"]
+    assert index.teams_for_games([by_id["NewYork_NewEngland_monday"]]) == ["New England Patriots", "New York Giants"]
+    assert index.teams_for_games([by_id["LasVegas_LosAngeles_afternoon"]]) == ["Las Vegas Raiders", "Los Angeles Chargers"]
+    assert index.teams_for_games([by_id["Denver_Washington_night"]]) == ["Denver Broncos", "Washington Commanders"]
+    assert len(index.teams_for_games(games)) == 32
+
+    # Without a team code a shared city keeps both teams rather than guessing
+    assert index.resolve_game_team("New York") == ["New York Giants", "New York Jets"]
+    assert index.resolve_game_team("New England") == ["New England Patriots"]
+    assert index.resolve_game_team("Nowhere") == []
+
+    text = format_depth_chart_for_prompt(index, [{"away_team": "Buffalo", "home_team": "Pittsburgh"}])
+    assert "BUFFALO BILLS" in text and "PITTSBURGH STEELERS" in text
+    assert "MIAMI DOLPHINS" not in text
+
+
+def test_prompt_includes_only_selected_teams():
+    schedule = load_schedule()
+    config = settings.model_copy(update={
+        "use_game_selection": True,
+        "selected_game_ids": ["Buffalo_Pittsburgh_afternoon", "NewYork_NewEngland_monday"],
+    })
+
+    prompt = render_prompt(schedule, config)
+    stats = get_last_render_stats()
+    assert stats["depth_chart_scope"] == "games"
+    assert stats["teams_included"] == [
+        "Buffalo Bills", "New England Patriots", "New York Giants", "Pittsburgh Steelers"
+    ]
+    assert "NEW YORK GIANTS" in prompt and "NEW YORK JETS" not in prompt
+    assert "DALLAS COWBOYS" not in prompt
+    assert stats["tokens_saved"] == stats["full_depth_chart_tokens"] - stats["depth_chart_tokens"]
+    assert stats["tokens_saved"] > stats["depth_chart_tokens"]
+    assert stats["prompt_tokens"] > 0
+
+
+def test_full_slate_and_disabled_scoping_use_compact_chart():
+    schedule = load_schedule()
+    full_slate = settings.model_copy(update={"use_game_selection": True, "selected_game_ids": [], "focus_games": "all"})
+    render_prompt(schedule, full_slate)
+    stats = get_last_render_stats()
+    assert stats["depth_chart_scope"] == "all"
+    assert len(stats["teams_included"]) == 32 and stats["tokens_saved"] == 0
+
+    disabled = settings.model_copy(update={
+        "use_game_selection": True,
+        "selected_game_ids": ["Buffalo_Pittsburgh_afternoon"],
+        "scope_depth_chart_to_games": False,
+    })
+    prompt = render_prompt(schedule, disabled)
+    assert get_last_render_stats()["depth_chart_scope"] == "all"
+    assert "DALLAS COWBOYS" in prompt
+
+
+if __name__ == "__main__":
+    test_resolver_uses_espn_team_codes()
+    test_prompt_includes_only_selected_teams()
+    test_full_slate_and_disabled_scoping_use_compact_chart()
+    print("✅ Prompt scoping tests passed")
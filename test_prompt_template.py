@@ -0,0 +1,126 @@
+"""Test the compiled prompt template."""
+
+import os
+import shutil
+from pathlib import Path
+
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from fastapi.testclient import TestClient
+
+from app import ai_client, main
+from app.prompt_template import (
+    DEFAULT_PROMPT_PATH,
+    GAME_DATA_MARKER,
+    PROMPT_VARIABLES,
+    CompiledTemplate,
+    PromptTemplateStore,
+    TemplateError,
+)
+
+
+def sample_values():
+    return {name: f"<{name.lower()}>" for name in PROMPT_VARIABLES}
+
+
+def legacy_render(template: str, values: dict) -> str:
+    """The sequential str.replace rendering the compiled template replaces."""
+    prompt = template
+    for name, value in values.items():
+        placeholder = GAME_DATA_MARKER if name == "GAME_DATA" else "{{" + name + "}}"
+        prompt = prompt.replace(placeholder, value)
+    return prompt
+
+
+def test_compiled_render_matches_sequential_replace():
+    text = DEFAULT_PROMPT_PATH.read_text(encoding="utf-8")
+    compiled = CompiledTemplate(text)
+    values = sample_values()
+
+    assert compiled.render(values) == legacy_render(text, values)
+    assert len(compiled.segments) == len(compiled.slots) + 1
+    assert compiled.slots.count("PROP_FOCUS") == 2
+    assert compiled.renders == 1 and compiled.last_render_seconds >= 0
+
+    # Values are inserted verbatim, never re-expanded
+    values["SLATE_DESCRIPTION"] = "Use {{DATE}} literally"
+    assert "Use {{DATE}} literally" in compiled.render(values)
+
+
+def test_compile_time_validation():
+    base = "Week {{WEEK_NUMBER}}\n" + GAME_DATA_MARKER + "\n{{DEPTH_CHART_DATA}}"
+    compiled = CompiledTemplate(base)
+    assert "SLATE_DESCRIPTION" in compiled.missing
+
+    try:
+        CompiledTemplate(base + " {{WEEK_NUMBR}}")
+        assert False, "unknown placeholder should be rejected"
+    except TemplateError as e:
+        assert "{{WEEK_NUMBR}}" in str(e)
+
+    try:
+        CompiledTemplate("Week {{WEEK_NUMBER}} {{DEPTH_CHART_DATA}}")
+        assert False, "template without game data should be rejected"
+    except TemplateError as e:
+        assert GAME_DATA_MARKER in str(e)
+
+    try:
+        compiled.render({"WEEK_NUMBER": "13", "GAME_DATA": ""})
+        assert False, "render without a slot value should fail"
+    except TemplateError as e:
+        assert "{{DEPTH_CHART_DATA}}" in str(e)
+
+
+def test_store_loads_once_and_reloads_on_save(tmp_path):
+    path = tmp_path / "weekly_picks.txt"
+    shutil.copy(DEFAULT_PROMPT_PATH, path)
+    store = PromptTemplateStore(path)
+
+    first = store.get()
+    assert store.get() is first and store.version == 1
+
+    saved = store.save("Short {{WEEK_NUMBER}}\n" + GAME_DATA_MARKER + "\n{{DEPTH_CHART_DATA}}")
+    assert store.get() is saved and store.version == 2
+    assert path.read_text(encoding="utf-8").startswith("Short")
+
+    try:
+        store.save("Broken {{NOPE}}")
+        assert False, "invalid template should not be saved"
+    except TemplateError:
+        pass
+    assert path.read_text(encoding="utf-8").startswith("Short")
+    assert store.get() is saved
+
+    # Edits made outside the app are picked up too
+    path.write_text("Edited " + GAME_DATA_MARKER + " {{DEPTH_CHART_DATA}}!", encoding="utf-8")
+    assert store.get().text.startswith("Edited") and store.version == 3
+    assert store.stats()["renders"] == 0
+
+
+def test_save_prompt_endpoint_recompiles(tmp_path, monkeypatch):
+    path = tmp_path / "weekly_picks.txt"
+    shutil.copy(DEFAULT_PROMPT_PATH, path)
+    store = PromptTemplateStore(path)
+    monkeypatch.setattr(main, "prompt_template", store)
+    monkeypatch.setattr(ai_client, "prompt_template", store)
+
+    with TestClient(main.app) as client:
+        content = "Custom prompt for week {{WEEK_NUMBER}}\n" + GAME_DATA_MARKER + "\n{{DEPTH_CHART_DATA}}"
+        response = client.post("/admin/save-prompt", data={"prompt_content": content}, follow_redirects=False)
+        assert response.status_code == 303 and "prompt_saved" in response.headers["location"]
+        assert client.get("/api/prompt-template").json()["template"] == content
+
+        rendered = ai_client.render_prompt(([], {"error": "offline"}))
+        assert rendered.startswith("Custom prompt for week")
+        assert ai_client.get_last_render_stats()["template_version"] == store.version
+
+        response = client.post("/admin/save-prompt", data={"prompt_content": "{{BOGUS}}"}, follow_redirects=False)
+        assert "error=" in response.headers["location"]
+        assert Path(path).read_text(encoding="utf-8") == content
+        assert client.get("/api/cache/stats").json()["prompt_template"]["renders"] == 1
+
+
+if __name__ == "__main__":
+    test_compiled_render_matches_sequential_replace()
+    test_compile_time_validation()
+    print("✅ Prompt template tests passed")
@@ -0,0 +1,67 @@
+"""Test the compact roster storage and its depth chart compatibility view."""
+
+from pathlib import Path
+
+import pytest
+
+from app.depth_chart_parser import DepthChartCache, DepthChartIndex, format_all_depth_charts_compact, parse_depth_chart, parse_roster
+from app.espn_scraper import GameData
+from app.roster import POSITIONS, PlayerRecord, Roster, benchmark
+
+DEPTH_CHART_PATH = Path("data/FantasyPros_Fantasy_Football_2025_Depth_Charts.csv")
+
+
+def test_roster_keeps_ecr_and_depth_rank():
+    roster = parse_roster(str(DEPTH_CHART_PATH))
+    assert len(roster) == 521 and len(roster.teams) == 32
+
+    assert roster.players_at("Arizona Cardinals", "QB") == [
+        PlayerRecord("Jacoby Brissett", "Arizona Cardinals", "QB", 1, 13),
+        PlayerRecord("Jeff Driskel", "Arizona Cardinals", "QB", 2, 64),
+    ]
+    assert roster.players_at("Arizona Cardinals", "TE")[0] == PlayerRecord("Trey McBride", "Arizona Cardinals", "TE", 1, 1)
+
+    record = DepthChartIndex(roster).lookup("Derrick Henry")
+    assert (record.team, record.position, record.rank) == ("Baltimore Ravens", "RB", 1) and record.ecr
+    assert not hasattr(record, "__dict__")
+
+
+def test_view_matches_dict_format():
+    roster = parse_roster(str(DEPTH_CHART_PATH))
+    view = roster.as_depth_chart()
+    depth_chart = parse_depth_chart(str(DEPTH_CHART_PATH))
+
+    assert view == depth_chart and list(view) == list(depth_chart)
+    assert view["Seattle Seahawks"]["RB"][:2] == ["Kenneth Walker III", "Zach Charbonnet"]
+    assert "Test Team" not in view and list(view["Seattle Seahawks"]) == list(POSITIONS)
+    assert format_all_depth_charts_compact(view) == format_all_depth_charts_compact(depth_chart)
+    with pytest.raises(KeyError):
+        view["Nowhere"]
+    with pytest.raises(TypeError):
+        view["Seattle Seahawks"] = {}
+
+    # Dict input still works and builds the same index
+    assert Roster.from_depth_chart(depth_chart).to_dict() == depth_chart
+    assert DepthChartIndex(depth_chart).team_of("Josh Allen") == DepthChartIndex(roster).team_of("Josh Allen")
+
+
+def test_cache_serves_roster_view(tmp_path):
+    csv_path = tmp_path / "depth_chart.csv"
+    csv_path.write_bytes(DEPTH_CHART_PATH.read_bytes())
+    cache = DepthChartCache(csv_path)
+
+    assert cache.get().roster is cache.get_roster()
+    assert cache.get_index().roster is cache.get_roster()
+    assert cache.stats()["players"] == 521
+
+
+def test_game_data_has_no_instance_dict():
+    game = GameData("Green Bay", "Detroit", "1:00 PM", day_of_week="Thursday")
+    assert not hasattr(game, "__dict__")
+    assert game.to_dict()["game_id"] == "GreenBay_Detroit_thursday"
+
+
+def test_memory_benchmark_favors_roster():
+    results = benchmark(str(DEPTH_CHART_PATH), seasons=2)
+    assert results["players"] == 521
+    assert results["roster_kib"] < results["dict_kib"]
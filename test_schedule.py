@@ -0,0 +1,81 @@
+"""Test kickoff parsing, the kickoff-sorted Schedule and slot grouping."""
+
+from datetime import datetime, time, timezone
+from pathlib import Path
+
+from app.espn_scraper import (
+    ESPN_TIMEZONE,
+    GameData,
+    Schedule,
+    filter_games,
+    group_games_by_time_slot,
+    parse_espn_schedule_html,
+    parse_kickoff_time,
+)
+
+FIXTURE_PATH = Path("fixtures/espn_schedule_week13.html")
+FIXTURE_URL = "https://www.espn.com/nfl/schedule/_/week/13/year/2025/seasontype/2"
+
+
+def week13() -> Schedule:
+    games, _ = parse_espn_schedule_html(FIXTURE_PATH.read_bytes(), FIXTURE_URL)
+    return Schedule(games)
+
+
+def eastern(day: int, hour: int, month: int = 11) -> datetime:
+    return datetime(2025, month, day, hour, tzinfo=ESPN_TIMEZONE)
+
+
+def test_kickoff_time_parsing():
+    assert parse_kickoff_time("1:00 PM") == time(13, 0)
+    assert parse_kickoff_time("12:30 PM") == time(12, 30)
+    assert parse_kickoff_time("9:30 a.m.") == time(9, 30)
+    assert parse_kickoff_time("TBD") is None
+
+    tbd = GameData("Denver", "Washington", "TBD", day_of_week="Sunday")
+    assert tbd.time_slot == "tbd" and tbd.kickoff is None
+    assert tbd.game_id == "Denver_Washington_early"  # Unchanged from before the 'tbd' slot
+    assert GameData("Chicago", "Philadelphia", "3:00 PM", day_of_week="Friday").time_slot == "early"
+
+
+def test_schedule_page_kickoffs_are_timezone_aware():
+    schedule = week13()
+    first, last = schedule[0], schedule[-1]
+    assert first.matchup == "Green Bay @ Detroit"
+    assert first.kickoff == datetime(2025, 11, 27, 18, 0, tzinfo=timezone.utc)
+    assert last.matchup == "New York @ New England" and last.kickoff.astimezone(ESPN_TIMEZONE).hour == 20
+    assert all(game.kickoff is not None for game in schedule)
+
+
+def test_kickoff_range_queries():
+    schedule = week13()
+    late_sunday = schedule.kicking_off(eastern(30, 16), eastern(1, 0, month=12))
+    assert [g.home_team for g in late_sunday] == ["Seattle", "Los Angeles", "Pittsburgh", "Washington"]
+    assert len(schedule.kicking_off(end=eastern(28, 0))) == 3  # Thursday
+    assert schedule.kicking_off(eastern(2, 0, month=12)) == []
+
+    remaining = schedule.remaining(now=eastern(30, 14))
+    assert len(remaining) == 5 and remaining[0].home_team == "Seattle"
+
+    # Games without a kickoff sort last and always count as remaining
+    tbd = GameData("Denver", "Washington", "TBD", day_of_week="Sunday")
+    with_tbd = Schedule(list(schedule) + [tbd])
+    assert with_tbd[-1] is tbd and with_tbd.remaining(now=eastern(2, 0, month=12)) == [tbd]
+
+
+def test_slots_are_grouped_once_per_schedule():
+    schedule = week13()
+    grouped = group_games_by_time_slot(schedule)
+    assert grouped is group_games_by_time_slot(schedule)
+    assert {slot: len(games) for slot, games in grouped.items()} == {
+        "early": 8, "afternoon": 3, "night": 1, "monday": 1, "thursday": 3, "tbd": 0
+    }
+    assert group_games_by_time_slot(list(schedule)) == grouped
+
+
+def test_legacy_focus_filters_use_kickoff_hour():
+    schedule = week13()
+    assert len(filter_games(schedule, "afternoon_only")) == 7  # 4:00 PM onward, incl. Thu/Sun/Mon night
+    assert len(filter_games(schedule, "early")) == 9  # Before 4 PM, incl. Thursday 1:00 and Friday 3:00
+    assert [g.time for g in filter_games(schedule, "primetime")] == ["8:20 PM", "8:20 PM", "8:15 PM"]
+    assert isinstance(filter_games(schedule), list)
@@ -0,0 +1,233 @@
+"""Test the ESPN schedule cache against a local HTTP stand-in for ESPN."""
+
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from app import espn_scraper
+from app.espn_scraper import ScheduleCache, get_async_http_client, get_http_client, scrape_espn_schedule
+
+FIXTURE_PATH = Path("fixtures/espn_schedule_week13.html")
+
+
+class FakeEspnServer:
+    """Serves the saved schedule page with ETag/Last-Modified support."""
+
+    def __init__(self):
+        self.body = FIXTURE_PATH.read_bytes()
+        self.etag = '"week13-v1"'
+        self.last_modified = "Sun, 30 Nov 2025 12:00:00 GMT"
+        self.requests = []  # (path, If-None-Match) per request
+        self.available = True
+        self.gate = None  # threading.Event requests wait on (up to 5 s) before being answered
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests.append((self.path, self.headers.get("If-None-Match")))
+                if server.gate is not None:
+                    server.gate.wait(5)
+                if not server.available:
+                    self.send_response(503)
+                    self.end_headers()
+                    return
+                if self.headers.get("If-None-Match") == server.etag:
+                    self.send_response(304)
+                    self.send_header("ETag", server.etag)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(server.body)))
+                self.send_header("ETag", server.etag)
+                self.send_header("Last-Modified", server.last_modified)
+                self.end_headers()
+                self.wfile.write(server.body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def url(self, week: int = 13) -> str:
+        host, port = self.httpd.server_address
+        return f"http://{host}:{port}/nfl/schedule/_/week/{week}/year/2025/seasontype/2"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_fresh_hits_skip_the_network():
+    with FakeEspnServer() as server:
+        clock = FakeClock()
+        cache = ScheduleCache(ttl_seconds=60, stale_seconds=120, clock=clock)
+
+        games, metadata = cache.get(server.url())
+        assert len(games) == 16
+        assert metadata["week"] == 13 and metadata["year"] == 2025
+
+        clock.now += 30
+        cached_games, _ = cache.get(server.url())
+        assert [g.game_id for g in cached_games] == [g.game_id for g in games]
+        assert len(server.requests) == 1
+
+        stats = cache.stats()
+        assert stats["misses"] == 1 and stats["hits"] == 1
+
+
+def test_expired_entry_revalidates_with_etag():
+    with FakeEspnServer() as server:
+        clock = FakeClock()
+        cache = ScheduleCache(ttl_seconds=60, stale_seconds=0, clock=clock)
+        cache.get(server.url())
+        version = cache.version_of(server.url())
+
+        clock.now += 61
+        games, _ = cache.get(server.url())
+        assert len(games) == 16
+        assert server.requests[-1][1] == server.etag  # Conditional request sent
+        assert cache.stats()["revalidations"] == 1
+        assert cache.version_of(server.url()) == version  # 304 -> no re-parse
+
+        # New page content -> full refresh and version bump
+        server.etag = '"week13-v2"'
+        clock.now += 61
+        cache.get(server.url())
+        assert cache.stats()["refreshes"] == 1
+        assert cache.version_of(server.url()) > version
+
+
+def test_stale_while_revalidate_serves_immediately():
+    with FakeEspnServer() as server:
+        clock = FakeClock()
+        cache = ScheduleCache(ttl_seconds=60, stale_seconds=600, clock=clock)
+        cache.get(server.url())
+
+        clock.now += 120  # Past TTL, inside the stale window
+        games, _ = cache.get(server.url())
+        assert len(games) == 16
+        cache.wait_for_revalidation(timeout=5)
+
+        stats = cache.stats()
+        assert stats["stale_hits"] == 1
+        assert stats["revalidations"] == 1
+        assert len(server.requests) == 2
+
+        # Revalidation reset the entry's age, so this is a fresh hit
+        cache.get(server.url())
+        assert cache.stats()["hits"] == 1
+
+
+def test_lru_bound_and_stale_if_error():
+    with FakeEspnServer() as server:
+        clock = FakeClock()
+        cache = ScheduleCache(ttl_seconds=60, stale_seconds=0, max_weeks=2, clock=clock)
+        for week in (12, 13, 14):
+            cache.get(server.url(week))
+
+        stats = cache.stats()
+        assert stats["entries"] == 2 and stats["evictions"] == 1
+        assert cache.version_of(server.url(12)) is None
+
+        # ESPN down: the last good copy is still served
+        server.available = False
+        clock.now += 61
+        games, _ = cache.get(server.url(14))
+        assert len(games) == 16
+        assert cache.stats()["errors"] == 1
+
+        try:
+            cache.get(server.url(15))
+            assert False, "uncached URL should raise when ESPN is down"
+        except Exception as e:
+            assert "Error scraping ESPN" in str(e)
+
+
+def test_sync_wrapper_uses_pooled_client():
+    with FakeEspnServer() as server:
+        async_client = espn_scraper._async_client
+        for _ in range(2):
+            games, metadata = scrape_espn_schedule(server.url())
+            assert len(games) == 16
+            assert metadata["games_found"] == 16
+        assert get_http_client() is get_http_client()
+        assert espn_scraper._async_client is async_client  # No event loop or async client per call
+
+        # Usable from code that is already running an event loop
+        async def inside_loop():
+            return scrape_espn_schedule(server.url())
+
+        games, _ = asyncio.run(inside_loop())
+        assert len(games) == 16
+
+
+def test_async_fetch_does_not_block_event_loop():
+    with FakeEspnServer() as server:
+        server.gate = threading.Event()
+        cache = ScheduleCache(ttl_seconds=60, stale_seconds=600)
+
+        async def run():
+            fetches = [asyncio.create_task(cache.aget(server.url(week))) for week in (13, 14)]
+            # This loop keeps polling while the server holds the first request,
+            # so the second one is sent before either is answered
+            deadline = time.monotonic() + 5
+            while len(server.requests) < 2 and time.monotonic() < deadline:
+                await asyncio.sleep(0.01)
+            in_flight = len(server.requests) == 2 and not any(fetch.done() for fetch in fetches)
+            server.gate.set()
+            results = await asyncio.gather(*fetches)
+            assert get_async_http_client() is get_async_http_client()
+            return in_flight, results
+
+        in_flight, (week13, week14) = asyncio.run(run())
+        assert in_flight
+        assert len(week13[0]) == 16 and len(week14[0]) == 16
+        assert cache.stats()["misses"] == 2
+
+
+def test_async_stale_while_revalidate():
+    with FakeEspnServer() as server:
+        clock = FakeClock()
+        cache = ScheduleCache(ttl_seconds=60, stale_seconds=600, clock=clock)
+
+        async def run():
+            await cache.aget(server.url())
+            clock.now += 120
+            games, _ = await cache.aget(server.url())
+            # Let the background revalidation task complete
+            while cache._revalidating:
+                await asyncio.sleep(0.01)
+            return games
+
+        games = asyncio.run(run())
+        assert len(games) == 16
+        stats = cache.stats()
+        assert stats["stale_hits"] == 1 and stats["revalidations"] == 1
+
+
+if __name__ == "__main__":
+    test_fresh_hits_skip_the_network()
+    test_expired_entry_revalidates_with_etag()
+    test_stale_while_revalidate_serves_immediately()
+    test_lru_bound_and_stale_if_error()
+    test_sync_wrapper_uses_pooled_client()
+    test_async_fetch_does_not_block_event_loop()
+    test_async_stale_while_revalidate()
+    print("✅ Schedule cache tests passed")
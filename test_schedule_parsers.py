@@ -0,0 +1,68 @@
+"""Test the ESPN schedule parser backends against the saved schedule page."""
+
+from pathlib import Path
+
+import pytest
+
+from app import schedule_parsers
+from app.espn_scraper import parse_espn_schedule_html
+from app.schedule_parsers import available_parsers, benchmark, get_parser, set_default_parser
+
+FIXTURE_PATH = Path("fixtures/espn_schedule_week13.html")
+FIXTURE_URL = "https://www.espn.com/nfl/schedule/_/week/13/year/2025/seasontype/2"
+
+# A Table__TR row outside the schedule tables (e.g. a standings widget)
+STRAY_TABLE = (
+    b'<table><tr class="Table__TR"><td><a class="AnchorLink" href="/nfl/team/_/name/xx/x">Nowhere</a></td>'
+    b'<td>@Somewhere</td><td>9:00 PM</td></tr></table>'
+)
+
+
+def parse_games(content: bytes, parser: str):
+    games, metadata = parse_espn_schedule_html(content, FIXTURE_URL, parser=parser)
+    assert metadata["games_found"] == len(games)
+    return [game.to_dict() for game in games]
+
+
+@pytest.mark.parametrize("parser", available_parsers())
+def test_backends_agree_with_html_parser(parser):
+    content = FIXTURE_PATH.read_bytes()
+    games = parse_games(content, parser)
+    assert len(games) == 16
+    assert games == parse_games(content, "html.parser")
+    assert games[0]["matchup"] == "Green Bay @ Detroit" and games[0]["day_of_week"] == "Thursday"
+    assert games[0]["away_abbrev"] == "GB" and games[0]["home_abbrev"] == "DET"
+
+
+@pytest.mark.parametrize("parser", available_parsers())
+def test_only_schedule_tables_are_walked_with_fallback(parser):
+    content = FIXTURE_PATH.read_bytes().replace(b"</body>", STRAY_TABLE + b"</body>")
+    games = parse_games(content, parser)
+    assert len(games) == 16 and all(g["away_team"] != "Nowhere" for g in games)
+
+    # Without the ScheduleTables wrapper every table row on the page is used
+    renamed = content.replace(b"ScheduleTables", b"ScheduleList")
+    fallback = parse_games(renamed, parser)
+    assert len(fallback) == 17 and fallback[-1]["matchup"] == "Nowhere @ Somewhere"
+
+
+def test_parser_selection(monkeypatch):
+    assert available_parsers()[-1] == "html.parser"
+    assert get_parser("auto").name == available_parsers()[0]
+    assert get_parser("html.parser") is get_parser("html.parser")
+    with pytest.raises(ValueError):
+        get_parser("regex")
+
+    monkeypatch.setattr(schedule_parsers, "_default_parser", "auto")
+    set_default_parser("regex")  # Unknown: warns and keeps "auto"
+    assert get_parser().name == available_parsers()[0]
+    set_default_parser("html.parser")
+    assert get_parser().name == "html.parser"
+
+
+def test_benchmark_reports_time_and_memory_per_backend():
+    rows = benchmark([FIXTURE_PATH], repeat=2)
+    assert [row["parser"] for row in rows] == available_parsers()
+    for row in rows:
+        assert row["games"] == 16
+        assert row["median_ms"] > 0 and row["peak_kib"] > 0
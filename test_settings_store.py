@@ -0,0 +1,88 @@
+"""Test the runtime settings store shared by uvicorn workers."""
+
+import os
+import subprocess
+import sys
+
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+from app.config import settings
+from app.settings_store import MemorySettingsBackend, SettingsStore, SQLiteSettingsBackend
+
+
+def make_worker(db_path) -> SettingsStore:
+    """A store as one worker process would build it."""
+    return SettingsStore(settings, SQLiteSettingsBackend(db_path))
+
+
+def test_workers_see_each_others_updates(tmp_path):
+    db_path = tmp_path / "state.sqlite3"
+    first, second = make_worker(db_path), make_worker(db_path)
+
+    assert first.current().slate_description == settings.slate_description
+    first.update(slate_description="Thanksgiving slate", selected_game_ids=["Buffalo_Pittsburgh_afternoon"])
+
+    config = second.current()
+    assert config.slate_description == "Thanksgiving slate"
+    assert config.selected_game_ids == ["Buffalo_Pittsburgh_afternoon"]
+    assert second.version == first.version == 1
+
+    # Unchanged version: the same snapshot is returned without a reload
+    assert second.current() is config
+    assert second.stats()["reloads"] == 1
+
+    # A worker started later picks up the saved state
+    assert make_worker(db_path).current().slate_description == "Thanksgiving slate"
+    assert settings.slate_description != "Thanksgiving slate"
+
+
+def test_update_from_another_process(tmp_path):
+    db_path = tmp_path / "state.sqlite3"
+    worker = make_worker(db_path)
+    assert worker.current().prop_focus == "mix"
+
+    script = (
+        "from app.config import settings\n"
+        "from app.settings_store import SettingsStore, SQLiteSettingsBackend\n"
+        f"SettingsStore(settings, SQLiteSettingsBackend({str(db_path)!r})).update(prop_focus='unders')\n"
+    )
+    env = {**os.environ, "OPENAI_API_KEY": "test-key"}
+    subprocess.run([sys.executable, "-c", script], check=True, env=env)
+
+    assert worker.current().prop_focus == "unders"
+
+
+def test_updates_are_validated_and_notified():
+    store = SettingsStore(settings, MemorySettingsBackend())
+    seen = []
+    store.subscribe(lambda config, version: seen.append((version, config.min_articles_for_sentiment)))
+
+    store.update(min_articles_for_sentiment="5")
+    assert store.current().min_articles_for_sentiment == 5
+    assert seen == [(1, 5)]
+
+    with pytest.raises(ValueError):
+        store.update(min_articles_for_sentiment="many")
+    with pytest.raises(ValueError):
+        store.update(openai_api_key="sk-other")
+    assert store.version == 1 and len(seen) == 1
+
+
+def test_endpoints_share_state(tmp_path, monkeypatch):
+    db_path = tmp_path / "state.sqlite3"
+    monkeypatch.setattr(main, "settings_store", make_worker(db_path))
+    other_worker = make_worker(db_path)
+
+    with TestClient(main.app) as client:
+        response = client.post("/api/games/select", json={"game_ids": ["Denver_Washington_night"]})
+        assert response.json()["success"]
+        assert other_worker.current().selected_game_ids == ["Denver_Washington_night"]
+
+        other_worker.update(note="Updated on another worker")
+        config = client.get("/api/config").json()
+        assert config["note"] == "Updated on another worker"
+        assert config["version"] == 2
@@ -0,0 +1,44 @@
+"""Test that the web app starts without its heavy dependencies and within a time budget."""
+
+import os
+import subprocess
+import sys
+
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from app.startup_profile import LAZY_MODULES, import_profile, time_to_first_response
+
+# Seconds from launching uvicorn to the first /health response (about 1 s here; 1.7 s with eager imports)
+STARTUP_BUDGET_SECONDS = 3.0
+
+
+def test_import_profile_has_no_heavy_dependencies():
+    timings = import_profile("app.main")
+    assert timings[-1].module == "app.main" and timings[-1].depth == 0
+    assert all(t.cumulative_us >= t.self_us for t in timings)
+
+    imported = {t.module.split(".")[0] for t in timings}
+    assert "fastapi" in imported
+    assert not imported.intersection(LAZY_MODULES)
+
+
+def test_heavy_dependencies_load_on_first_use():
+    script = "\n".join([
+        "import sys",
+        "import app.main",
+        "from app.openai_client import is_retryable, openai_clients",
+        "from app.schedule_parsers import get_parser",
+        "assert not is_retryable(ValueError()) and 'openai' not in sys.modules",
+        "openai_clients.get()",
+        "get_parser('html.parser')",
+        "print(sorted(m for m in ('openai', 'bs4', 'httpx') if m in sys.modules))",
+    ])
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "['bs4', 'httpx', 'openai']"
+
+
+def test_time_to_first_response_within_budget(tmp_path):
+    env = dict(os.environ, RUNTIME_STATE_PATH=str(tmp_path / "state.sqlite3"),
+               PICKS_INDEX_PATH=str(tmp_path / "picks_index.sqlite3"))
+    assert time_to_first_response("app.main:app", "/health", env=env) < STARTUP_BUDGET_SECONDS
@@ -0,0 +1,213 @@
+"""Test streamed pick generation with a fake OpenAI streaming client."""
+
+import functools
+import json
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from fastapi.testclient import TestClient
+
+from app import ai_client, main
+from app.completion_cache import CompletionCache
+from app.picks_stream import IncrementalPicksParser
+
+SAMPLE_PICKS_PATH = "app/data/week_14_2025-12-06.json"
+
+
+class FakeStreamingClient:
+    """Mimics client.chat.completions.stream() by replaying a document in small deltas."""
+
+    def __init__(self, document: str, chunk_size: int = 40):
+        self.chunks = [document[i:i + chunk_size] for i in range(0, len(document), chunk_size)]
+        self.consumed = 0
+        self.requests = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(stream=self.stream))
+
+    def stream(self, **kwargs):
+        self.requests.append(kwargs)
+        client = self
+
+        class Stream:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def __iter__(self):
+                for chunk in client.chunks:
+                    client.consumed += 1
+                    yield SimpleNamespace(type="content.delta", delta=chunk)
+                yield SimpleNamespace(type="content.done", content="".join(client.chunks))
+
+        return Stream()
+
+
+def sample_document() -> str:
+    with open(SAMPLE_PICKS_PATH, "r", encoding="utf-8") as f:
+        return json.dumps(json.load(f), separators=(",", ":"))
+
+
+def test_parser_emits_players_incrementally():
+    document = sample_document()
+    parser = IncrementalPicksParser()
+    emitted = []
+    first_pick_at = None
+    for i in range(0, len(document), 7):
+        completed = parser.feed(document[i:i + 7])
+        if completed and first_pick_at is None:
+            first_pick_at = i
+        emitted.extend(completed)
+
+    expected = json.loads(document)
+    categories = [c for c, _ in emitted]
+    for name in ("qbs", "rbs", "wrs", "tes"):
+        assert categories.count(name) == len(expected["categories"][name])
+    assert categories.count("long_shots") == len(expected["long_shots"]["players"])
+    assert emitted[0][1].name == expected["categories"]["qbs"][0]["name"]
+    # The first QB is available after a small fraction of the document
+    assert first_pick_at < len(document) / 10
+
+
+def test_parser_handles_braces_and_quotes_inside_strings():
+    player = {
+        "name": "Test \"QB\" {One}", "team": "Buffalo Bills", "position": "QB",
+        "game": "A @ B", "matchup_note": "Beats [cover 2] }{ easily \\ ok",
+        "injury_status": "active", "verified": True, "what_to_target": "yards",
+        "why": "because", "sources": [], "suggestions": [],
+    }
+    document = json.dumps({"meta": {}, "categories": {"qbs": [player, player], "rbs": []}})
+    parser = IncrementalPicksParser()
+    emitted = []
+    for char in document:
+        emitted.extend(parser.feed(char))
+    assert [p.name for _, p in emitted] == [player["name"]] * 2
+
+
+def test_generate_picks_stream_yields_validated_picks_before_completion(monkeypatch, tmp_path):
+    monkeypatch.setattr(ai_client, "render_prompt", lambda schedule=None, config=None: "prompt")
+    completions = CompletionCache(tmp_path)
+    monkeypatch.setattr(ai_client, "completion_cache", completions)
+    client = FakeStreamingClient(sample_document())
+
+    events = []
+    consumed_at_first_pick = None
+    for event, data in ai_client.generate_picks_stream(client=client, save=False):
+        if event == "pick" and consumed_at_first_pick is None:
+            consumed_at_first_pick = client.consumed
+        events.append((event, data))
+
+    assert consumed_at_first_pick < len(client.chunks) / 10
+    assert client.requests[0]["response_format"] is ai_client.WeeklyPicksModel
+
+    picks = [data for event, data in events if event == "pick"]
+    corrected = next(p for p in picks if p["player"]["name"] == "Cooper Kupp")
+    assert corrected["player"]["team"] == "Seattle Seahawks"
+    assert corrected["warning"].startswith("⚠️")
+
+    stages = [data["stage"] for event, data in events if event == "stage"]
+    assert stages == ["prompt_rendered", "model_called", "validated"]
+    event, done = events[-1]
+    assert event == "done"
+    assert done["picks"]["meta"]["week"] == 14
+
+    # The streamed response is reused by later non-streamed runs of the same prompt
+    assert completions.get(ai_client.completion_cache_key("prompt")).meta.week == 14
+
+
+def test_stream_endpoint_sends_server_sent_events(monkeypatch, tmp_path):
+    client = FakeStreamingClient(sample_document(), chunk_size=200)
+    monkeypatch.setattr(ai_client, "render_prompt", lambda schedule=None, config=None: "prompt")
+    monkeypatch.setattr(ai_client, "completion_cache", CompletionCache(tmp_path))
+    monkeypatch.setattr(
+        main, "generate_picks_stream",
+        lambda config: ai_client.generate_picks_stream(config=config, client=client, save=False)
+    )
+
+    with TestClient(main.app) as http:
+        response = http.post("/api/generate/stream")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+
+    messages = [m for m in response.text.split("\n\n") if m]
+    event_names = [m.split("\n")[0].removeprefix("event: ") for m in messages]
+    assert event_names[:2] == ["job", "stage"]
+    assert "pick" in event_names
+    assert event_names[-1] == "done"
+    first_pick = next(m for m in messages if m.startswith("event: pick"))
+    assert json.loads(first_pick.split("data: ", 1)[1])["category"] == "qbs"
+
+
+if __name__ == "__main__":
+    test_parser_emits_players_incrementally()
+    test_parser_handles_braces_and_quotes_inside_strings()
+    print("✅ Streaming parser tests passed")
+
+
+def test_concurrent_streams_share_one_generation(monkeypatch):
+    release = threading.Event()
+    generations = []
+
+    def fake_stream(config):
+        generations.append(config)
+        yield "stage", {"stage": "prompt_rendered"}
+        release.wait(5)
+        yield "pick", {"category": "qbs", "player": {"name": "Jalen Hurts", "team": "Philadelphia"}, "warning": None}
+        yield "done", {"picks": json.loads(sample_document())}
+
+    monkeypatch.setattr(main, "generate_picks_stream", fake_stream)
+
+    def wait_for(condition):
+        deadline = time.monotonic() + 5
+        while not condition():
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+    with TestClient(main.app) as http:
+        responses = []
+        viewers = [threading.Thread(target=lambda: responses.append(http.post("/api/generate/stream")))
+                   for _ in range(2)]
+        viewers[0].start()
+        wait_for(lambda: generations)
+        viewers[1].start()
+        wait_for(lambda: main.job_manager.list()[-1].submissions == 2)
+        release.set()
+        for viewer in viewers:
+            viewer.join(5)
+
+    assert len(generations) == 1
+    assert len(responses) == 2
+    for response in responses:
+        messages = [m for m in response.text.split("\n\n") if m]
+        assert [m.split("\n")[0].removeprefix("event: ") for m in messages] == ["job", "stage", "pick", "done"]
+    assert sorted(json.loads(r.text.split("data: ", 1)[1].split("\n", 1)[0])["coalesced"] for r in responses) == [False, True]
+
+
+
+def test_stream_follows_a_generation_job_without_an_event_log(monkeypatch):
+    release = threading.Event()
+    picks = main.WeeklyPicksModel.model_validate_json(sample_document())
+
+    def queued_generation(config, progress):
+        progress("prompt_rendered")
+        release.wait(5)
+        progress("saved")
+        return picks
+
+    # Same key as an /admin/run job for the current settings
+    config = main.settings_store.current()
+    job, _ = main.job_manager.submit(main._generation_job_key(config), queued_generation, config)
+    monkeypatch.setattr(main, "_poll_job_events", functools.partial(main._poll_job_events, interval_seconds=0.01))
+    threading.Timer(0.2, release.set).start()
+
+    with TestClient(main.app) as http:
+        response = http.post("/api/generate/stream")
+
+    messages = [m for m in response.text.split("\n\n") if m]
+    assert [m.split("\n")[0].removeprefix("event: ") for m in messages] == ["job", "stage", "stage", "done"]
+    assert json.loads(messages[0].split("data: ", 1)[1]) == {"job_id": job.id, "coalesced": True}
+    assert json.loads(messages[-1].split("data: ", 1)[1])["picks"]["meta"]["week"] == 14
@@ -0,0 +1,124 @@
+"""Test the background cache warm-up and the readiness health check."""
+
+import asyncio
+import os
+import threading
+
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+from app.espn_scraper import ScheduleCache
+from app.warmup import CacheWarmer, next_week_url
+from test_schedule_cache import FakeEspnServer, FakeClock
+
+
+def test_next_week_url():
+    assert next_week_url("https://www.espn.com/nfl/schedule/_/week/13/year/2025/seasontype/2") == \
+        "https://www.espn.com/nfl/schedule/_/week/14/year/2025/seasontype/2"
+    assert next_week_url("https://www.espn.com/nfl/schedule/_/week/18/year/2025/seasontype/2") is None
+    assert next_week_url("https://www.espn.com/nfl/schedule/_/week/1/year/2025/seasontype/3").endswith("/week/2/year/2025/seasontype/3")
+    assert next_week_url("https://www.espn.com/nfl/schedule") is None
+
+
+def test_warmer_runs_in_order_then_repeats():
+    calls = []
+    attempts = {"flaky": 0}
+
+    async def record(name):
+        calls.append(name)
+        return name
+
+    async def flaky():
+        attempts["flaky"] += 1
+        if attempts["flaky"] == 1:
+            raise RuntimeError("ESPN down")
+        return "ok"
+
+    async def run():
+        warmer = CacheWarmer()
+        warmer.add("first", lambda: record("first"), interval_seconds=0)
+        warmer.add("flaky", flaky, interval_seconds=0.01)
+        warmer.add("optional", lambda: record("optional"), interval_seconds=0, required=False)
+        warmer.start()
+        while attempts["flaky"] < 3:
+            await asyncio.sleep(0.005)
+        status = warmer.status()
+        await warmer.stop()
+        return warmer, status
+
+    warmer, status = asyncio.run(run())
+    assert calls == ["first", "optional"]  # Interval 0: startup only
+    assert status["ready"] and status["running"] and not warmer.running
+
+    task = status["tasks"]["flaky"]
+    assert task["failures"] == 1 and task["last_error"] is None and task["detail"] == "ok"
+    assert task["last_refresh_age_seconds"] >= 0 and task["runs"] >= 3
+
+    failing = CacheWarmer()
+    failing.add("required", flaky, interval_seconds=0)
+    attempts["flaky"] = 0
+    asyncio.run(failing.run_all())
+    assert not failing.ready and failing.status()["tasks"]["required"]["last_error"] == "ESPN down"
+
+
+def test_schedule_refresh_ignores_ttl():
+    with FakeEspnServer() as server:
+        cache = ScheduleCache(ttl_seconds=300, clock=FakeClock())
+
+        async def run():
+            await cache.aget(server.url())
+            games, _ = await cache.arefresh(server.url())  # Fresh, but revalidated anyway
+            server.available = False
+            with pytest.raises(Exception):
+                await cache.arefresh(server.url())
+            return games, await cache.aget(server.url())
+
+        games, (cached, _) = asyncio.run(run())
+        assert [etag for _, etag in server.requests] == [None, '"week13-v1"', '"week13-v1"']
+        assert len(games) == 16 and cached is games  # The failed refresh kept the cached copy
+        assert cache.stats()["revalidations"] == 1 and cache.stats()["errors"] == 1
+
+
+def test_readiness_waits_for_warm_caches(monkeypatch):
+    release = threading.Event()
+    warmer = CacheWarmer()
+
+    async def slow():
+        await asyncio.to_thread(release.wait, 5)
+        return {"games": 16}
+
+    async def failing():
+        raise RuntimeError("no next week yet")
+
+    warmer.add("schedule", slow, interval_seconds=0)
+    warmer.add("next_week_schedule", failing, interval_seconds=0, required=False)
+    monkeypatch.setattr(main.settings, "cache_warmup_enabled", True)
+    monkeypatch.setattr(main, "cache_warmer", warmer)
+
+    with TestClient(main.app) as client:
+        assert client.get("/health").json() == {"status": "healthy", "version": "1.0.0"}
+        warming = client.get("/health", params={"ready": "true"})
+        assert warming.status_code == 503 and warming.json()["status"] == "warming"
+        assert not warming.json()["warmup"]["tasks"]["schedule"]["warm"]
+
+        release.set()
+        for _ in range(200):
+            response = client.get("/health", params={"ready": "true"})
+            if response.status_code == 200:
+                break
+            threading.Event().wait(0.01)
+        warmup = response.json()["warmup"]
+        assert response.status_code == 200 and warmup["ready"] and warmup["enabled"]
+        assert warmup["tasks"]["schedule"]["detail"] == {"games": 16}
+        assert warmup["tasks"]["next_week_schedule"]["last_error"] == "no next week yet"
+        assert client.get("/api/cache/stats").json()["warmup"]["ready"]
+    assert not warmer.running
+
+
+def test_readiness_without_warmup():
+    with TestClient(main.app) as client:
+        response = client.get("/health", params={"ready": "true"})
+        assert response.status_code == 200 and response.json()["warmup"]["enabled"] is False